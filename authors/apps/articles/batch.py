@@ -0,0 +1,122 @@
+from django.contrib.contenttypes.models import ContentType
+from taggit.models import TaggedItem
+
+from authors.apps.bookmark.models import Bookmark
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+from authors.apps.profiles.models import Profile
+
+from .models import Article, ArticleStats
+
+
+class ArticleBatch:
+    """
+    Holds everything `GetArticlesSerializer` needs for a page of articles
+    besides the article rows themselves.
+
+    The data is fetched with one set based query per kind of information
+    (authors, tags, favorites, bookmarks, votes and engagement counters), so
+    serializing a page costs the same number of queries whatever its size.
+    """
+
+    def __init__(self, articles, user=None, viewer_only=False):
+        self.articles = list(articles)
+
+        article_ids = [article.id for article in self.articles]
+        author_ids = {article.author_id for article in self.articles}
+        user_id = getattr(user, 'id', None)
+
+        self.authors = {}
+        self.tags = {article_id: [] for article_id in article_ids}
+        self.favorites = set()
+        self.bookmarks = set()
+        self.votes = {}
+        self.stats = {}
+
+        if not article_ids:
+            return
+
+        content_type = ContentType.objects.get_for_model(Article)
+
+        # The viewer state is only relevant when there is a logged in user,
+        # anonymous readers have not favorited, bookmarked or voted anything.
+        if user_id:
+            self.favorites = set(FavouriteArticle.objects.filter(
+                user_id=user_id,
+                article_id__in=article_ids
+            ).values_list('article_id', flat=True))
+
+            self.bookmarks = set(Bookmark.objects.filter(
+                user_id=user_id,
+                article_id__in=article_ids
+            ).values_list('article_id', flat=True))
+
+            self.votes = dict(ArticleLikeDislike.objects.filter(
+                content_type=content_type,
+                object_id__in=article_ids,
+                user_id=user_id
+            ).values_list('object_id', 'vote'))
+
+        # Callers that already have the rest of the payload, for instance
+        # from the article cache, only need the viewer state.
+        if viewer_only:
+            return
+
+        for profile in Profile.objects.filter(
+                user_id__in=author_ids).select_related('user'):
+            self.authors[profile.user_id] = {
+                'username': profile.user.username,
+                'bio': profile.bio,
+                'image': profile.image,
+            }
+
+        tagged_items = TaggedItem.objects.filter(
+            content_type=content_type,
+            object_id__in=article_ids
+        ).values_list('object_id', 'tag__name')
+
+        for article_id, name in tagged_items:
+            self.tags[article_id].append(name)
+
+        self.stats = ArticleStats.objects.in_bulk(article_ids)
+
+    def author(self, article):
+        return self.authors.get(article.author_id)
+
+    def tag_list(self, article):
+        return self.tags.get(article.id, [])
+
+    def favorited(self, article):
+        return article.id in self.favorites
+
+    def bookmarked(self, article):
+        return article.id in self.bookmarks
+
+    def viewer_flags(self, article):
+        """
+        The fields of the article payload that depend on who is viewing it.
+        """
+        return {
+            'favorite': self.favorited(article),
+            'bookmarked': self.bookmarked(article),
+            'liked': self.liked(article),
+            'disliked': self.disliked(article),
+        }
+
+    def liked(self, article):
+        return self.votes.get(article.id) == ArticleLikeDislike.LIKE
+
+    def disliked(self, article):
+        return self.votes.get(article.id) == ArticleLikeDislike.DISLIKE
+
+    def likes(self, article):
+        stats = self.stats.get(article.id)
+        return stats.like_count if stats else 0
+
+    def dislikes(self, article):
+        stats = self.stats.get(article.id)
+        return stats.dislike_count if stats else 0
+
+    def rating(self, article):
+        stats = self.stats.get(article.id)
+        return stats.rating if stats else None
@@ -0,0 +1,106 @@
+"""
+Cache of the viewer independent part of the article detail payload.
+
+Every entry remembers the versions of its article and of the article's
+author it was built from. Anything that changes what the payload would
+contain bumps one of these versions (see the signal receivers in the article
+and rating models), which turns the entries built before it into misses
+without having to know their keys.
+
+A version bumped in a cache private to one process would not reach the
+others, so nothing is cached unless `settings.SHARED_CACHE` is set.
+"""
+
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .list_version import bump_list_version
+
+
+def _entry_key(slug):
+    return 'article:{}:payload'.format(slug)
+
+
+def _article_version_key(article_id):
+    return 'article:{}:version'.format(article_id)
+
+
+def _author_version_key(author_id):
+    return 'author:{}:version'.format(author_id)
+
+
+def current_versions(article_id, author_id):
+    """
+    Return the current versions of an article and its author, to be read
+    before loading the data that is going to be cached.
+    """
+    if not settings.SHARED_CACHE:
+        return [None, None]
+
+    keys = [_article_version_key(article_id), _author_version_key(author_id)]
+
+    for key in keys:
+        cache.add(key, uuid4().hex, None)
+
+    versions = cache.get_many(keys)
+
+    return [versions.get(key) for key in keys]
+
+
+def get_cached_article(slug):
+    """
+    Return the cached payload of the article with the given slug and its
+    validators, or None when it is missing or out of date.
+    """
+    if not settings.SHARED_CACHE:
+        return None
+
+    entry = cache.get(_entry_key(slug))
+
+    if entry is None:
+        return None
+
+    keys = [
+        _article_version_key(entry['article_id']),
+        _author_version_key(entry['author_id'])
+    ]
+    versions = cache.get_many(keys)
+
+    if [versions.get(key) for key in keys] != entry['versions']:
+        return None
+
+    return entry['data'], entry['validators']
+
+
+def cache_article(slug, article_id, author_id, versions, data, validators):
+    if not settings.SHARED_CACHE:
+        return
+
+    cache.set(_entry_key(slug), {
+        'article_id': article_id,
+        'author_id': author_id,
+        'versions': versions,
+        'data': data,
+        'validators': validators,
+    }, settings.ARTICLE_CACHE_TIMEOUT)
+
+
+def _bump_version(key):
+    cache.set(key, uuid4().hex, None)
+
+    # A reader may cache what it read before the change is committed, so we
+    # bump the version again once it is visible to everyone.
+    transaction.on_commit(lambda: cache.set(key, uuid4().hex, None))
+
+
+def invalidate_article(article_id):
+    _bump_version(_article_version_key(article_id))
+    bump_list_version()
+
+
+def invalidate_author(author_id):
+    _bump_version(_author_version_key(author_id))
+    bump_list_version()
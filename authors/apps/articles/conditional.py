@@ -0,0 +1,116 @@
+"""
+The validators of the article and comment read endpoints.
+
+They are computed from timestamps, counts and versions gathered with one
+or two queries each, so answering a conditional request with a 304
+never loads or serializes the articles or comments themselves.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import (
+    BigIntegerField, Count, F, Max, OuterRef, Subquery, Sum, TextField
+)
+from taggit.models import TaggedItem
+
+from authors.apps.bookmark.models import Bookmark
+from authors.apps.core.conditional import Validators, latest
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+
+from .list_version import list_version
+from .models import Article, Comment
+
+
+def article_validators(article_id):
+    """
+    Validators of the payload of an article as an anonymous reader sees it.
+
+    It changes with the article itself, the counters it shows, its tags and
+    its author, whose username is on the user and the rest on the profile.
+    """
+    tags = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Article),
+        object_id=OuterRef('pk')
+    ).values('object_id').annotate(
+        names=StringAgg('tag__name', ',')
+    ).values('names')
+
+    row = Article.objects.filter(id=article_id).values(
+        'updatedAt', 'stats__updated_at', 'author__updated_at',
+        'author__profile__updated_at'
+    ).annotate(
+        tags=Subquery(tags, output_field=TextField())
+    ).first()
+
+    if row is None:
+        return None
+
+    return Validators(
+        article_id, row['tags'],
+        last_modified=latest(
+            row['updatedAt'],
+            row['stats__updated_at'],
+            row['author__updated_at'],
+            row['author__profile__updated_at']
+        )
+    )
+
+
+def article_list_validators(request):
+    """
+    Validators of a page of the article list.
+
+    Any change to the payload of an article moves the list version on, which
+    covers deleted articles too, so the list has no Last-Modified date and
+    relies on its ETag.
+    """
+    return Validators(
+        request.get_full_path(),
+        list_version(),
+        viewer_signature(request.user)
+    )
+
+
+def comment_thread_validators(article_id, parent, cursor):
+    """
+    Validators of a page of the comments or replies of an article.
+    """
+    row = Comment.objects.filter(article_id=article_id, parent=parent).aggregate(
+        count=Count('id'),
+        last=Max('id'),
+        updated=Max('updated_at'),
+        users=Max('user__updated_at'),
+        profiles=Max('user__profile__updated_at')
+    )
+
+    return Validators(article_id, parent, cursor, sorted(row.items()))
+
+
+def viewer_signature(user):
+    """
+    A summary of which articles the user favorited, bookmarked and voted on,
+    that changes whenever one of these does. Anonymous readers have none.
+    """
+    if not user.id:
+        return None
+
+    favorites = FavouriteArticle.objects.filter(user_id=user.id).aggregate(
+        count=Count('id'), last=Max('id'))
+    bookmarks = Bookmark.objects.filter(user_id=user.id).aggregate(
+        count=Count('id'), last=Max('id'))
+
+    # Flipping a vote keeps its row, so the votes are summed weighted by
+    # their article to notice it.
+    votes = ArticleLikeDislike.objects.filter(user_id=user.id).aggregate(
+        count=Count('id'),
+        last=Max('id'),
+        votes=Sum(F('vote') * F('object_id'), output_field=BigIntegerField())
+    )
+
+    return (
+        user.id,
+        sorted(favorites.items()),
+        sorted(bookmarks.items()),
+        sorted(votes.items())
+    )
@@ -0,0 +1,47 @@
+"""
+Export of the whole catalogue of articles as JSON lines.
+
+The articles are read through a server side cursor and serialized a chunk
+at a time, so the memory used stays the same however many articles there
+are.
+"""
+
+from authors.apps.core.renderers import dumps
+
+from .models import Article
+from .serializers import GetArticlesSerializer
+
+
+def export_articles(updated_since=None, chunk_size=500):
+    """
+    Yield the articles updated since the given date, or all of them, as
+    lines of JSON in the order they were last updated.
+
+    A client can sync incrementally by passing the `updatedAt` of the last
+    line it received the next time. The articles updated at that very date
+    are sent again, as it may not have received all of them.
+    """
+    articles = Article.objects.order_by('updatedAt', 'id')
+
+    if updated_since is not None:
+        articles = articles.filter(updatedAt__gte=updated_since)
+
+    chunk = []
+
+    for article in articles.iterator(chunk_size=chunk_size):
+        chunk.append(article)
+
+        if len(chunk) == chunk_size:
+            yield _lines(chunk)
+            chunk = []
+
+    if chunk:
+        yield _lines(chunk)
+
+
+def _lines(articles):
+    # The list serializer loads everything else the articles need with one
+    # query per kind of data for the whole chunk.
+    data = GetArticlesSerializer(articles, many=True).data
+
+    return b''.join(dumps(article) + b'\n' for article in data)
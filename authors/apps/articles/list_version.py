@@ -0,0 +1,45 @@
+"""
+Version of the article list, which the ETag of its pages is derived from.
+
+The version is a Postgres sequence, moved on whenever the payload of an
+article changes (see `invalidate_article` and `invalidate_author` in the
+article cache). Sequences are not transactional, so moving it on never
+waits for another writer, and reading its value is a single row read
+whatever the size of the catalogue.
+"""
+
+from django.db import connection, transaction
+
+SEQUENCE = 'articles_list_version'
+
+
+def create_list_version(connection):
+    """
+    Create the sequence. Django has no model for it, so this is run after
+    the migrations. It does nothing when the sequence exists.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE SEQUENCE IF NOT EXISTS {}".format(connection.ops.quote_name(SEQUENCE))
+        )
+
+
+def _next_version():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT nextval(%s)", [SEQUENCE])
+
+
+def bump_list_version():
+    _next_version()
+
+    # A reader may take the new version along with the list as it was before
+    # the change is committed, so we bump it again once it is visible.
+    transaction.on_commit(_next_version)
+
+
+def list_version():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT last_value FROM {}".format(connection.ops.quote_name(SEQUENCE)))
+        (version,) = cursor.fetchone()
+
+    return version
@@ -1,12 +1,143 @@
+import re
+
 from authors.apps.likedislike.models import ArticleLikeDislike
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, SearchVectorField, TrigramSimilarity)
+from django.conf import settings
 from authors.apps.authentication.models import User
-from django.db import models
+from authors.apps.core.mixins import TrackedFieldsMixin
+from authors.apps.profiles.models import Profile
+from authors.apps.core.trigram import create_trigram_index, set_similarity_threshold
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Count, F, Func, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+from django.dispatch import receiver
 from django.template.defaultfilters import slugify
 from taggit.managers import TaggableManager
+from taggit.models import Tag, TaggedItem
+
+from .cache import invalidate_article, invalidate_author
+from .list_version import create_list_version
+
+
+class Headline(Func):
+    """
+    The fragments of a document that match a full text search query, with
+    the matching words highlighted.
+    """
+    function = 'ts_headline'
+    output_field = models.TextField()
+
+    def __init__(self, expression, query, config, options):
+        super().__init__(Value(config), expression, query, Value(options))
+
+
+class ArticleQuerySet(models.QuerySet):
+    """
+    Queryset class for articles, providing full text search over the
+    stored `search_vector` column.
+    """
+    SEARCH_CONFIG = 'english'
+    HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15'
+
+    def search(self, text):
+        """
+        Return the articles matching the search text, best matches first,
+        annotated with their `rank` and a highlighted `snippet` of the body.
+        """
+        query = SearchQuery(text, config=self.SEARCH_CONFIG)
+
+        return self.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query),
+            snippet=Headline(
+                F('body'), query, self.SEARCH_CONFIG, self.HEADLINE_OPTIONS)
+        ).order_by('-rank', '-id')
+
+    def fuzzy_search(self, text, threshold):
+        """
+        Return the articles whose title or author's username look like the
+        search text, most similar first, annotated with their `similarity`.
 
+        Both lookups use the `%` trigram operator so they are answered from
+        the trigram indexes, the threshold sets how similar a match has to
+        be, from 0 to 1. It only holds for the current transaction, which the
+        queryset has to be evaluated in.
+        """
+        set_similarity_threshold(connections[self.db], threshold)
 
-class Article(models.Model):
+        authors = User.objects.filter(
+            username__trigram_similar=text
+        ).values_list('id', flat=True)
+
+        return self.filter(
+            Q(title__trigram_similar=text) | Q(author_id__in=list(authors))
+        ).annotate(
+            similarity=Greatest(
+                TrigramSimilarity('title', text),
+                TrigramSimilarity('author__username', text)
+            )
+        ).order_by('-similarity', '-id')
+
+    TAG_MODES = ('all', 'any', 'none')
+
+    def tagged(self, names, mode='all'):
+        """
+        Filter the articles by tag name. Depending on the mode the articles
+        need to have all of the tags, any of them, or none of them.
+
+        The names are resolved to tag ids once, and the tagged articles are
+        then found with a single grouped subquery on the tag relation no
+        matter how many tags are given, so every article appears only once.
+        """
+        names = set(names)
+        tag_ids = list(Tag.objects.filter(name__in=names).values_list('id', flat=True))
+
+        tagged = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model),
+            tag_id__in=tag_ids
+        ).values('object_id')
+
+        if mode == 'none':
+            return self.exclude(id__in=tagged) if tag_ids else self
+
+        if not tag_ids or (mode == 'all' and len(tag_ids) < len(names)):
+            return self.none()
+
+        if mode == 'all':
+            tagged = tagged.annotate(
+                tag_count=Count('tag_id', distinct=True)
+            ).filter(tag_count=len(tag_ids))
+
+        return self.filter(id__in=tagged.values('object_id'))
+
+    def update_search_vector(self):
+        """
+        Recompute the search vector of the articles from their title, tags,
+        description and body, in that order of importance.
+        """
+        tags = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model),
+            object_id=OuterRef('pk')
+        ).values('object_id').annotate(
+            names=StringAgg('tag__name', ' ')
+        ).values('names')
+
+        return self.update(search_vector=(
+            SearchVector('title', weight='A', config=self.SEARCH_CONFIG) +
+            SearchVector(
+                Subquery(tags, output_field=models.TextField()),
+                weight='B', config=self.SEARCH_CONFIG) +
+            SearchVector('description', weight='B', config=self.SEARCH_CONFIG) +
+            SearchVector('body', weight='C', config=self.SEARCH_CONFIG)
+        ))
+
+
+class Article(TrackedFieldsMixin, models.Model):
     """
     create articles models
     """
@@ -22,26 +153,199 @@ class Article(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     votes = GenericRelation(ArticleLikeDislike, related_query_name='articles')
 
+    # This is kept up to date by the signal receivers at the bottom of this
+    # module, it can be rebuilt with the `rebuild_search_vectors` command.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ArticleQuerySet.as_manager()
+
+    tracked_fields = ('title',)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            # The export walks the articles in the order they were last
+            # updated, from a given date for incremental syncs.
+            models.Index(fields=['updatedAt', 'id']),
+        ]
+
+    # How many times we try another slug when a concurrent writer took the
+    # one we were given.
+    SLUG_ATTEMPTS = 5
+
     def __str__(self):
         return f"{self.title}, {self.body}"
 
     def save(self, *args, **kwargs):
 
-        # This generates a new slug from the title of the article.
-        self.slug = slugify(self.title)
+        # The slug is generated from the title, so it only needs to change
+        # for new articles and when the title has been edited into one that
+        # no longer matches the current slug.
+        base_slug = slugify(self.title)
+
+        if not self._state.adding and (
+                'title' not in self.changed_fields() or
+                re.match(r'^{}(-\d+)?$'.format(re.escape(base_slug)), self.slug)):
+            return super(Article, self).save(*args, **kwargs)
+
+        self.slug = SlugCounter.objects.allocate(base_slug)
+
+        for attempt in range(1, self.SLUG_ATTEMPTS + 1):
+            try:
+                with transaction.atomic():
+                    return super(Article, self).save(*args, **kwargs)
+            except IntegrityError:
+                # Two writers can be handed the same slug when the counter
+                # was seeded from existing articles, the unique constraint
+                # catches that and we simply ask for the next one.
+                slug_taken = Article.objects.filter(
+                    slug=self.slug).exclude(pk=self.pk).exists()
+
+                if not slug_taken or attempt == self.SLUG_ATTEMPTS:
+                    raise
+
+                self.slug = SlugCounter.objects.allocate(base_slug)
+
+
+class SlugCounterManager(models.Manager):
+    """
+    Manager class for the slug counters
+    """
+
+    def allocate(self, base_slug):
+        """
+        Return a free slug for the given base slug.
 
-        unique_slug = self.slug
-        extension = 1
+        The first article gets the base slug itself, the ones after it get an
+        increasing numeric suffix. This costs the same couple of queries no
+        matter how many articles share the base slug.
+        """
+        with transaction.atomic():
+            if self.filter(base=base_slug).update(last=F('last') + 1):
+                last = self.filter(base=base_slug).values_list('last', flat=True).get()
+                return self.with_suffix(base_slug, last)
 
-        # This ensures that the slug is unique by running through multiple
-        # variations of the slug by adding an integer at the end.
-        while Article.objects.filter(slug=unique_slug).exists():
-            unique_slug = '{}-{}'.format(self.slug, extension)
-            extension += 1
+            # This is the first time we see this base slug. Articles created
+            # before the counters existed may already be using it, with gaps
+            # left by deleted ones, so we start counting after the highest
+            # suffix in use. The suffix is read after the base slug, whose own
+            # trailing digits are not one, and the base slug itself counts as 0.
+            escaped = re.escape(base_slug)
+            taken = Article.objects.filter(
+                slug__regex=r'^{}(-\d+)?$'.format(escaped)
+            ).aggregate(
+                count=Count('id'),
+                last=Max(Cast(
+                    Func(F('slug'), Value(r'^{}-(\d+)$'.format(escaped)), function='substring'),
+                    models.BigIntegerField()
+                ))
+            )
+            taken = (taken['last'] or 0) + 1 if taken['count'] else 0
 
-        self.slug = unique_slug
+            try:
+                with transaction.atomic():
+                    self.create(base=base_slug, last=taken)
+            except IntegrityError:
+                # Another writer created the counter in the meantime.
+                return self.allocate(base_slug)
 
-        super(Article, self).save(*args, **kwargs)
+            return self.with_suffix(base_slug, taken)
+
+    @staticmethod
+    def with_suffix(base_slug, number):
+        if not number:
+            return base_slug
+
+        suffix = '-{}'.format(number)
+        max_length = Article._meta.get_field('slug').max_length
+
+        return base_slug[:max_length - len(suffix)] + suffix
+
+
+class SlugCounter(models.Model):
+    """
+    The highest numeric suffix handed out so far for each base slug.
+    """
+    base = models.SlugField(max_length=50, unique=True)
+    last = models.PositiveIntegerField(default=0)
+
+    objects = SlugCounterManager()
+
+    def __str__(self):
+        return "{} ({})".format(self.base, self.last)
+
+
+def rating_score(total, count):
+    """
+    The Bayesian average of `count` ratings adding up to `total`: their
+    average once RATING_PRIOR_WEIGHT ratings of RATING_PRIOR_MEAN are added
+    to them. A few ratings barely move an article away from the prior, so a
+    single 5 does not outrank a hundred 4s.
+
+    Works on numbers as well as on expressions.
+    """
+    return (
+        (settings.RATING_PRIOR_MEAN * settings.RATING_PRIOR_WEIGHT + total) /
+        (settings.RATING_PRIOR_WEIGHT + count)
+    )
+
+
+def unrated_score():
+    return rating_score(0, 0)
+
+
+class ArticleStats(models.Model):
+    """
+    Denormalized engagement counters for an article.
+
+    The counters are kept in step with their source tables by the views that
+    write to them (see `authors.apps.articles.stats.bump_stats`), so reading
+    them is a single row lookup instead of a count over every vote, rating,
+    favorite, comment or read of the article. They can be rebuilt from the
+    source tables with the `rebuild_article_stats` management command.
+    """
+    article = models.OneToOneField(
+        Article, primary_key=True, related_name='stats', on_delete=models.CASCADE)
+    like_count = models.IntegerField(default=0)
+    dislike_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_count = models.IntegerField(default=0)
+    favorite_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
+    read_count = models.IntegerField(default=0)
+
+    # The Bayesian average of the ratings, kept in step with their counters
+    # and indexed for ranking the top rated articles.
+    rating_score = models.FloatField(default=unrated_score)
+
+    # The last time one of the counters shown in the article payload
+    # changed, which is what conditional requests for the article check.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    COUNTERS = (
+        'like_count', 'dislike_count', 'rating_sum', 'rating_count',
+        'favorite_count', 'comment_count', 'read_count'
+    )
+
+    SHOWN_COUNTERS = ('like_count', 'dislike_count', 'rating_sum', 'rating_count')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['rating_score', 'article'], name='articles_stats_score_idx'),
+        ]
+
+    def __str__(self):
+        return "Stats for article {}".format(self.article_id)
+
+    @property
+    def rating(self):
+        """
+        The average rating of the article, or None when it has not been
+        rated yet.
+        """
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
 
 
 class Comment(models.Model):
@@ -69,6 +373,13 @@ class Comment(models.Model):
     # This is used to save the last time the comment was updated.
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Comment pages are read as a range of this index, keyed on the
+        # (created_at, id) position of the cursor.
+        indexes = [
+            models.Index(fields=['article', 'parent', 'created_at', 'id'])
+        ]
+
 
 class CommentHistory(models.Model):
 
@@ -82,3 +393,90 @@ class CommentHistory(models.Model):
 
     # This is used to save the time at which this comment was created.
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+@receiver(post_save, sender=Article)
+def create_article_stats(sender, instance, created, **kwargs):
+    """
+    create the counters row together with the article.
+    """
+    if created:
+        ArticleStats.objects.create(article=instance)
+
+
+@receiver(post_save, sender=Article)
+def update_article_search_vector(sender, instance, **kwargs):
+    """
+    recompute the search vector whenever the article is saved.
+    """
+    Article.objects.filter(pk=instance.pk).update_search_vector()
+
+
+@receiver(m2m_changed, sender=Article.tag_list.through)
+def update_tagged_article_search_vector(sender, instance, action, **kwargs):
+    """
+    recompute the search vector when the tags of an article change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear') and \
+            isinstance(instance, Article):
+        Article.objects.filter(pk=instance.pk).update_search_vector()
+
+
+@receiver(post_migrate)
+def create_article_title_trigram_index(sender, using, **kwargs):
+    """
+    index the article titles for fuzzy searches.
+    """
+    if sender.name == 'authors.apps.articles':
+        create_trigram_index(connections[using], Article, 'title')
+
+
+@receiver(post_migrate)
+def create_article_list_version(sender, using, **kwargs):
+    """
+    create the sequence the article list ETag is derived from.
+    """
+    if sender.name == 'authors.apps.articles':
+        create_list_version(connections[using])
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_cached_article(sender, instance, **kwargs):
+    """
+    drop the cached payload of an article when it is edited or deleted.
+    """
+    invalidate_article(instance.pk)
+
+
+@receiver(m2m_changed, sender=Article.tag_list.through)
+def invalidate_tagged_article(sender, instance, action, **kwargs):
+    """
+    drop the cached payload of an article when its tags change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear') and \
+            isinstance(instance, Article):
+        invalidate_article(instance.pk)
+
+
+@receiver(post_save, sender=ArticleLikeDislike)
+@receiver(post_delete, sender=ArticleLikeDislike)
+def invalidate_voted_article(sender, instance, **kwargs):
+    """
+    drop the cached payload of an article when its votes change.
+    """
+    if instance.content_type_id == ContentType.objects.get_for_model(Article).id:
+        invalidate_article(instance.object_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Profile)
+def invalidate_author_articles(sender, instance, **kwargs):
+    """
+    drop the cached payloads of the articles of a user whose username or
+    profile changed.
+    """
+    if sender is User and 'username' not in instance.changed_fields():
+        return
+
+    invalidate_author(instance.pk if sender is User else instance.user_id)
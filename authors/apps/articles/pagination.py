@@ -0,0 +1,138 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    """
+    Raised when a cursor provided by the client cannot be decoded.
+    """
+
+
+class KeysetPage:
+    """
+    A page of results along with the cursors of the pages around it.
+    """
+
+    def __init__(self, items, next_cursor=None, previous_cursor=None):
+        self.items = items
+        self.next = next_cursor
+        self.previous = previous_cursor
+
+    def __len__(self):
+        return len(self.items)
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset on a `(field, id)` key instead of an offset.
+
+    Each page starts right after (or ends right before) the key of the row
+    the cursor points to, so fetching it is an index range scan no matter
+    how deep into the results it is, and rows inserted while a client is
+    paging never shift or repeat the following pages.
+
+    The cursors handed out are opaque strings that encode the direction and
+    the key of the row to continue from. The field holds dates, or numbers
+    when `numeric` is set.
+    """
+
+    NEXT = 'n'
+    PREVIOUS = 'p'
+
+    def __init__(self, field, page_size=20, descending=False, numeric=False):
+        self.field = field
+        self.page_size = page_size
+        self.descending = descending
+        self.numeric = numeric
+
+    def paginate(self, queryset, cursor=None):
+        if not cursor:
+            direction, position = self.NEXT, None
+        else:
+            direction, position = self.decode(cursor)
+
+        forward = direction == self.NEXT
+
+        if position is not None:
+            queryset = queryset.filter(self.beyond(position, forward))
+
+        ordering = self.ordering(forward)
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if not rows:
+            return KeysetPage(rows)
+
+        if forward:
+            next_cursor = self.encode(self.NEXT, rows[-1]) if has_more else None
+            previous_cursor = (
+                self.encode(self.PREVIOUS, rows[0]) if position else None
+            )
+        else:
+            rows.reverse()
+            next_cursor = self.encode(self.NEXT, rows[-1])
+            previous_cursor = (
+                self.encode(self.PREVIOUS, rows[0]) if has_more else None
+            )
+
+        return KeysetPage(rows, next_cursor, previous_cursor)
+
+    def ordering(self, forward):
+        # Walking backwards we read the rows in reverse order and flip them
+        # once fetched.
+        descending = self.descending != (not forward)
+        prefix = '-' if descending else ''
+
+        return (prefix + self.field, prefix + 'id')
+
+    def beyond(self, position, forward):
+        """
+        Filter for the rows that come after (or before, when walking
+        backwards) the given `(value, id)` position.
+
+        The redundant `gte`/`lte` term on the leading field lets the database
+        use it as the start of an index range scan.
+        """
+        value, row_id = position
+        descending = self.descending != (not forward)
+        lookup = 'lt' if descending else 'gt'
+
+        return (
+            Q(**{'{}__{}e'.format(self.field, lookup): value}) &
+            (
+                Q(**{'{}__{}'.format(self.field, lookup): value}) |
+                Q(**{'id__{}'.format(lookup): row_id})
+            )
+        )
+
+    def encode(self, direction, row):
+        value = getattr(row, self.field)
+
+        if not self.numeric:
+            value = value.isoformat()
+
+        cursor = json.dumps([direction, value, row.id])
+
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def decode(self, cursor):
+        try:
+            direction, value, row_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode()).decode()
+            )
+            if not self.numeric:
+                value = parse_datetime(value)
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                value = None
+        except (TypeError, ValueError):
+            raise InvalidCursor(cursor)
+
+        if direction not in (self.NEXT, self.PREVIOUS) or value is None or \
+                not isinstance(row_id, int):
+            raise InvalidCursor(cursor)
+
+        return direction, (value, row_id)
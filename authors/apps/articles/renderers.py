@@ -1,21 +1,13 @@
-import json
+from authors.apps.core.renderers import FastJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
+class ArticlesJSONRenderer(FastJSONRenderer):
 
-class ArticlesJSONRenderer(JSONRenderer):
-    charset = 'utf-8'
-
-    def render(self, data, media_type=None, renderer_context=None):
+    def wrap(self, data, renderer_context=None):
         if len(data) == 1:
-            return json.dumps({'article': data})
-        return json.dumps({'articles': data})
-
+            return {'article': data}
+        return {'articles': data}
 
-class CommentHistoryJSONRenderer(JSONRenderer):
-    charset = 'utf-8'
 
-    def render(self, data, media_type=None, renderer_context=None):
-        return json.dumps({
-            'comments': data
-        })
+class CommentHistoryJSONRenderer(FastJSONRenderer):
+    namespace = 'comments'
@@ -1,18 +1,14 @@
 import numpy
 import re
 
-from authors.apps.authentication.models import User
-from authors.apps.likedislike.models import ArticleLikeDislike
-from authors.apps.bookmark.models import Bookmark
-from authors.apps.rating.models import RateArticle
 from authors.response import RESPONSE
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework import serializers
-from django.db.models import Avg
+from django.db import models
 
+from .batch import ArticleBatch
 from .models import Article, Comment, CommentHistory
-from ..favorite.models import FavouriteArticle
 
 
 class TagListSerializer(serializers.Field):
@@ -124,6 +120,25 @@ class ArticleSerializer(serializers.ModelSerializer):
         return (numpy.rint(time_to_read))
 
 
+class ArticleListSerializer(serializers.ListSerializer):
+    """
+    List serializer used whenever `GetArticlesSerializer` is called with
+    `many=True`. It loads the data shared by the whole page in one
+    `ArticleBatch` so the child serializer never queries per article.
+    """
+
+    def to_representation(self, data):
+        articles = data.all() if isinstance(data, models.Manager) else data
+        request = self.context.get('request')
+
+        self.batch = ArticleBatch(
+            articles,
+            user=request.user if request else None
+        )
+
+        return super().to_representation(self.batch.articles)
+
+
 class GetArticlesSerializer(serializers.ModelSerializer):
     author = serializers.SerializerMethodField()
     favorite = serializers.SerializerMethodField()
@@ -137,71 +152,67 @@ class GetArticlesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Article
-        fields = '__all__'
-
-    def get_author(self, article):
-        author_data = article.author
-        profile = author_data.profile
-        author = {
-            'username': author_data.username,
-            'bio': profile.bio,
-            'image': profile.image,
-        }
+        exclude = ('search_vector',)
+        list_serializer_class = ArticleListSerializer
+
+    def to_representation(self, article):
+        # When serializing a page the list serializer has already loaded a
+        # batch for all of its articles, otherwise we load one for this
+        # single article.
+        self.batch = getattr(self.parent, 'batch', None)
+
+        if self.batch is None:
+            request = self.context.get('request')
+            self.batch = ArticleBatch(
+                [article],
+                user=request.user if request else None
+            )
 
-        return author
+        return super().to_representation(article)
 
-    def get_favorite(self, slug):
-        user = self.context.get('request').user.id
-        article = slug.id
-        favorite = FavouriteArticle.objects.filter(
-            user=user, article=article).exists()
+    def get_author(self, article):
+        return self.batch.author(article)
 
-        return favorite
+    def get_favorite(self, article):
+        return self.batch.favorited(article)
 
     def get_tag_list(self, article):
-        return list(article.tag_list.names())
+        return self.batch.tag_list(article)
 
     def get_bookmarked(self, article):
-        article_slug = article.slug
-        user_id = self.context.get('request').user.id
-        return Bookmark.objects.filter(user=user_id, slug=article_slug).exists()
+        return self.batch.bookmarked(article)
 
     def get_liked(self, article):
-        user = self.context.get('request').user.id
-        article_id = article.id
-        liked = ArticleLikeDislike.objects.filter(
-            object_id=article_id, user_id=user, vote=+1
-        ).exists()
-
-        return liked
+        return self.batch.liked(article)
 
     def get_disliked(self, article):
-        user = self.context.get('request').user.id
-        article_id = article.id
-        disliked = ArticleLikeDislike.objects.filter(
-            object_id=article_id, user_id=user, vote=-1
-        ).exists()
-
-        return disliked
+        return self.batch.disliked(article)
 
     def get_likes(self, article):
-        likes = article.votes.likes().count()
-        return likes
+        return self.batch.likes(article)
 
     def get_dislikes(self, article):
-        dislikes = article.votes.dislikes().count()
-        return dislikes
+        return self.batch.dislikes(article)
 
     def get_rating(self, article):
-        article_id = article.id
-        try:
-            rating = RateArticle.objects.filter(article_id=article_id).values()
-        except RateArticle.DoesNotExist:
-            average_rating = 0
-        finally:
-            average_rating = rating.aggregate(Avg('user_rating'))
-            average_rating = average_rating['user_rating__avg']
-            return average_rating
+        return self.batch.rating(article)
+
+
+class ArticleSearchResultSerializer(GetArticlesSerializer):
+    """
+    Serializes full text search results, which come with how well they match
+    the search and a highlighted snippet of their body.
+    """
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+
+
+class ArticleFuzzySearchResultSerializer(GetArticlesSerializer):
+    """
+    Serializes fuzzy search results, which come with how similar their title
+    or author's username is to the search.
+    """
+    similarity = serializers.FloatField(read_only=True)
 
 
 class CreateCommentSerializer(serializers.ModelSerializer):
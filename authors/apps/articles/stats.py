@@ -0,0 +1,154 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, FloatField, Q, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+from authors.apps.rating.models import RateArticle
+from authors.apps.read_stats.models import UserReadStat
+
+from .models import Article, ArticleStats, Comment, rating_score
+
+
+def bump_stats(article_id, **deltas):
+    """
+    Apply the given deltas to the counters of an article, e.g.
+    `bump_stats(article.id, like_count=1, dislike_count=-1)`.
+
+    The counters are incremented in the database with F expressions, so
+    concurrent writers never overwrite each other. Callers should write to
+    the source table first and bump the counters in the same transaction.
+    """
+    updates = {
+        field: F(field) + delta for (field, delta) in deltas.items() if delta
+    }
+
+    if not updates:
+        return
+
+    if 'rating_sum' in updates or 'rating_count' in updates:
+        updates['rating_score'] = rating_score(
+            Cast(F('rating_sum') + deltas.get('rating_sum', 0), FloatField()),
+            Cast(F('rating_count') + deltas.get('rating_count', 0), FloatField())
+        )
+
+    if any(field in ArticleStats.SHOWN_COUNTERS for field in updates):
+        updates['updated_at'] = timezone.now()
+
+    with transaction.atomic():
+        if ArticleStats.objects.filter(article_id=article_id).update(**updates):
+            return
+
+        # The counters row is missing, for instance for an article created
+        # before the table existed. Since the source tables already hold the
+        # change, we seed the row from them instead of applying the deltas.
+        try:
+            with transaction.atomic():
+                ArticleStats.objects.create(
+                    article_id=article_id, **compute_stats([article_id])[article_id]
+                )
+        except IntegrityError:
+            # Somebody else created the row in the meantime.
+            ArticleStats.objects.filter(article_id=article_id).update(**updates)
+
+
+def compute_stats(article_ids):
+    """
+    Count the engagement of the given articles from the source tables.
+
+    Returns a dict mapping each article id to the values of its counters,
+    and to its rating score.
+    """
+    stats = {
+        article_id: dict.fromkeys(ArticleStats.COUNTERS, 0)
+        for article_id in article_ids
+    }
+
+    votes = ArticleLikeDislike.objects.filter(
+        content_type=ContentType.objects.get_for_model(Article),
+        object_id__in=article_ids
+    ).values('object_id').annotate(
+        likes=Count('id', filter=Q(vote__gt=0)),
+        dislikes=Count('id', filter=Q(vote__lt=0))
+    )
+
+    for vote in votes:
+        stats[vote['object_id']]['like_count'] = vote['likes']
+        stats[vote['object_id']]['dislike_count'] = vote['dislikes']
+
+    ratings = RateArticle.objects.filter(
+        article_id__in=article_ids
+    ).values('article_id').annotate(
+        total=Sum('user_rating'),
+        count=Count('id')
+    )
+
+    for rating in ratings:
+        stats[rating['article_id']]['rating_sum'] = rating['total']
+        stats[rating['article_id']]['rating_count'] = rating['count']
+
+    counted = (
+        (FavouriteArticle, 'favorite_count'),
+        (Comment, 'comment_count'),
+        (UserReadStat, 'read_count'),
+    )
+
+    for (model, field) in counted:
+        counts = model.objects.filter(
+            article_id__in=article_ids
+        ).values('article_id').annotate(count=Count('id'))
+
+        for count in counts:
+            stats[count['article_id']][field] = count['count']
+
+    for counters in stats.values():
+        counters['rating_score'] = rating_score(
+            float(counters['rating_sum']), float(counters['rating_count'])
+        )
+
+    return stats
+
+
+def rebuild_stats(article_ids, dry_run=False):
+    """
+    Reconcile the counters of the given articles with the source tables.
+
+    Returns a `(missing, drifted)` tuple with the ids of the articles that
+    had no counters row and of those whose counters did not match. Unless
+    `dry_run` is set, the rows are created or corrected.
+
+    The existing rows are locked before counting, so a write that is in
+    flight while we rebuild waits for us and then applies its delta on top
+    of the rebuilt values.
+    """
+    with transaction.atomic():
+        existing = ArticleStats.objects.select_for_update().in_bulk(article_ids)
+        expected = compute_stats(article_ids)
+
+        missing = []
+        drifted = []
+
+        for (article_id, counters) in expected.items():
+            stats = existing.get(article_id)
+
+            if stats is None:
+                missing.append(ArticleStats(article_id=article_id, **counters))
+                continue
+
+            if any(getattr(stats, field) != value for (field, value) in counters.items()):
+                for (field, value) in counters.items():
+                    setattr(stats, field, value)
+                drifted.append(stats)
+
+        if not dry_run:
+            ArticleStats.objects.bulk_create(missing)
+
+            for stats in drifted:
+                stats.save(update_fields=ArticleStats.COUNTERS + ('rating_score', 'updated_at'))
+
+    return (
+        [stats.article_id for stats in missing],
+        [stats.article_id for stats in drifted]
+    )
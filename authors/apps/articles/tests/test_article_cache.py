@@ -0,0 +1,120 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.rating.models import RateArticle
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.factory import ArticleFactory
+
+
+@override_settings(SHARED_CACHE=True)
+class TestArticleCache(TestUsingLoggedInUser):
+    """
+    test suite for the cached article detail payload
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.article = ArticleFactory(author=self.stored_users[1], title="Cached article")
+
+    def get(self, slug=None, token=None):
+        headers = {}
+
+        if token:
+            headers['HTTP_AUTHORIZATION'] = 'Token {}'.format(token)
+
+        response = self.client.get(
+            reverse("article", kwargs={"slug": slug or self.article.slug}),
+            **headers
+        )
+
+        return response
+
+    def test_anonymous_reads_are_served_from_the_cache(self):
+        self.get()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(response.data['title'], "Cached article")
+
+    @override_settings(SHARED_CACHE=False)
+    def test_articles_are_not_cached_in_a_private_cache(self):
+        self.get()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(queries), 0)
+
+    def test_viewer_flags_are_overlaid(self):
+        self.get()
+        self.client.post(
+            reverse("favorite", kwargs={"slug": self.article.slug}),
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertTrue(self.get(token=self.access_token).data['favorite'])
+        self.assertFalse(self.get().data['favorite'])
+
+    def test_edits_invalidate_the_cache(self):
+        self.get()
+
+        self.article.body = "An edited body"
+        self.article.save()
+
+        self.assertEqual(self.get().data['body'], "An edited body")
+
+    def test_tags_invalidate_the_cache(self):
+        self.get()
+
+        self.article.tag_list.add("cached")
+
+        self.assertEqual(self.get().data['tag_list'], ["cached"])
+
+    def test_votes_invalidate_the_cache(self):
+        self.get()
+
+        self.client.post(
+            '/api/articles/{}/like/'.format(self.article.slug),
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+        data = self.get(token=self.access_token).data
+
+        self.assertEqual(data['likes'], 1)
+        self.assertTrue(data['liked'])
+
+    def test_ratings_invalidate_the_cache(self):
+        self.get()
+
+        self.client.post(
+            reverse("rate_article", kwargs={"slug": self.article.slug}),
+            {"article": {"rate": 4}},
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertTrue(RateArticle.objects.filter(article=self.article).exists())
+        self.assertEqual(self.get().data['rating'], 4)
+
+    def test_author_profile_changes_invalidate_the_cache(self):
+        self.get()
+
+        profile = self.stored_users[1].profile
+        profile.bio = "A new bio"
+        profile.save()
+
+        self.assertEqual(self.get().data['author']['bio'], "A new bio")
+
+    def test_deleted_articles_are_not_served(self):
+        self.get()
+
+        self.article.delete()
+
+        self.assertEqual(self.get().status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,75 @@
+import json
+import math
+
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.views.articles import ArticleExportView
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.response import RESPONSE
+
+
+class TestArticleExport(TestUsingLoggedInUser):
+    """
+    test suite for streaming the articles as JSON lines
+    """
+
+    def export(self, **params):
+        response = self.client.get(
+            reverse("article_export"),
+            params,
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        return response
+
+    def lines(self, response):
+        content = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_streams_every_article(self):
+        response = self.export()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        articles = self.lines(response)
+
+        self.assertEqual(len(articles), Article.objects.count())
+        self.assertEqual(
+            [article['id'] for article in articles],
+            list(Article.objects.order_by('updatedAt', 'id').values_list('id', flat=True))
+        )
+        self.assertIn('tag_list', articles[0])
+        self.assertIn('username', articles[0]['author'])
+
+    def test_export_reads_in_chunks(self):
+        self.addCleanup(setattr, ArticleExportView, 'chunk_size', ArticleExportView.chunk_size)
+        ArticleExportView.chunk_size = 10
+
+        chunks = list(self.export().streaming_content)
+
+        self.assertEqual(len(chunks), math.ceil(Article.objects.count() / 10))
+        self.assertEqual(chunks[0].count(b'\n'), 10)
+
+    def test_incremental_export(self):
+        article = self.stored_articles[3]
+        article.body = "Updated for the sync"
+        article.save()
+
+        article.refresh_from_db()
+        articles = self.lines(self.export(updated_since=article.updatedAt.isoformat()))
+
+        self.assertEqual([data['id'] for data in articles], [article.id])
+        self.assertEqual(articles[0]['body'], "Updated for the sync")
+
+    def test_invalid_updated_since(self):
+        response = self.export(updated_since="yesterday")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['updated_since'],
+            RESPONSE['invalid_field'].format("updated_since")
+        )
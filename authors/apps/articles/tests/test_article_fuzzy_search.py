@@ -0,0 +1,89 @@
+from unittest import mock
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.apps.core.trigram import trigram_available
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory, UserFactory
+from authors.response import RESPONSE
+
+
+class TestArticleFuzzySearch(TestConfiguration):
+    """
+    test suite for the typo tolerant search of article titles and authors
+    """
+
+    def setUp(self):
+        if not trigram_available(connection):
+            self.skipTest("the pg_trgm extension is not available")
+
+        super().setUp()
+
+        self.dragons = ArticleFactory(
+            author=self.stored_users[0], title="Training dragons")
+        self.dungeons = ArticleFactory(
+            author=self.stored_users[0], title="Training dungeons")
+        self.by_tolkien = ArticleFactory(
+            author=UserFactory(username="tolkien"), title="Middle earth")
+
+    def search(self, text, **params):
+        params['fuzzy'] = text
+        return self.client.get(reverse("search"), params)
+
+    def slugs(self, response):
+        return [article['slug'] for article in response.data['results']]
+
+    def test_misspelled_title(self):
+        response = self.search("trainig dragns")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.slugs(response)[0], self.dragons.slug)
+        self.assertIn(self.dungeons.slug, self.slugs(response))
+
+        similarities = [article['similarity'] for article in response.data['results']]
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+
+    def test_misspelled_username(self):
+        response = self.search("tolkein")
+
+        self.assertEqual(self.slugs(response), [self.by_tolkien.slug])
+
+    def test_threshold(self):
+        response = self.search("trainig dragns", similarity=0.6)
+
+        self.assertEqual(self.slugs(response), [self.dragons.slug])
+
+    def test_invalid_threshold(self):
+        response = self.search("dragons", similarity=2)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['similarity'],
+            RESPONSE['invalid_field'].format("similarity")
+        )
+
+    def test_search_without_the_extension(self):
+        with mock.patch(
+            'authors.apps.articles.views.filters.trigram_installed', return_value=False
+        ):
+            response = self.search("dragons")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['fuzzy'],
+            RESPONSE['unavailable_field'].format("fuzzy")
+        )
+
+    def test_search_uses_the_trigram_index(self):
+        queryset = Article.objects.fuzzy_search("dragns", 0.3)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute("EXPLAIN " + sql, params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        self.assertIn("articles_article_title_trgm", plan)
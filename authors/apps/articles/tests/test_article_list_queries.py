@@ -0,0 +1,113 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.stats import rebuild_stats
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+from authors.apps.rating.models import RateArticle
+from authors.base_test_config import TestUsingLoggedInUser
+
+
+class TestArticleListQueries(TestUsingLoggedInUser):
+    """
+    test suite for the number of queries run when listing articles
+    """
+
+    def get_articles(self, limit, token=None):
+        headers = {}
+
+        if token:
+            headers['HTTP_AUTHORIZATION'] = 'Token {}'.format(token)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                "{}?limit={}".format(reverse("all_articles"), limit),
+                content_type='application/json',
+                **headers
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), limit)
+
+        return response, len(queries)
+
+    def engage(self):
+        """
+        favorite, like and rate a couple of articles so that the batch has
+        viewer state and aggregates to load.
+        """
+        user, reader = self.stored_users
+        content_type = ContentType.objects.get_for_model(Article)
+
+        for article in Article.objects.order_by('id')[:3]:
+            FavouriteArticle.objects.create(user=user, article=article)
+            ArticleLikeDislike.objects.create(
+                user=user,
+                vote=ArticleLikeDislike.LIKE,
+                content_type=content_type,
+                object_id=article.id
+            )
+            ArticleLikeDislike.objects.create(
+                user=reader,
+                vote=ArticleLikeDislike.DISLIKE,
+                content_type=content_type,
+                object_id=article.id
+            )
+            RateArticle.objects.create(user=reader, article=article, user_rating=4)
+
+        rebuild_stats(Article.objects.values_list('id', flat=True))
+
+    def test_anonymous_query_count_is_flat(self):
+        """
+        test listing articles anonymously runs the same number of queries
+        whatever the page size
+        """
+        self.engage()
+
+        # warm up the content type cache so it does not skew the counts
+        self.get_articles(1)
+
+        _, small_page = self.get_articles(5)
+        _, large_page = self.get_articles(40)
+
+        self.assertEqual(small_page, large_page)
+
+    def test_authenticated_query_count_is_flat(self):
+        """
+        test listing articles as a logged in user runs the same number of
+        queries whatever the page size
+        """
+        self.engage()
+        self.get_articles(1, self.access_token)
+
+        _, small_page = self.get_articles(5, self.access_token)
+        _, large_page = self.get_articles(40, self.access_token)
+
+        self.assertEqual(small_page, large_page)
+
+    def test_batched_fields_are_correct(self):
+        """
+        test the batched serializer returns the same values the per article
+        lookups used to
+        """
+        self.engage()
+        engaged = set(Article.objects.order_by('id')[:3].values_list('id', flat=True))
+
+        response, _ = self.get_articles(51, self.access_token)
+
+        for article in response.data['results']:
+            is_engaged = article['id'] in engaged
+
+            self.assertEqual(article['favorite'], is_engaged)
+            self.assertEqual(article['liked'], is_engaged)
+            self.assertFalse(article['disliked'])
+            self.assertEqual(article['likes'], int(is_engaged))
+            self.assertEqual(article['dislikes'], int(is_engaged))
+            self.assertEqual(article['rating'], 4 if is_engaged else None)
+            self.assertEqual(
+                article['author']['username'], self.stored_users[0].username
+            )
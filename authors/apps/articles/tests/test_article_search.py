@@ -0,0 +1,96 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory
+
+
+class TestArticleSearch(TestConfiguration):
+    """
+    test suite for the full text search of articles
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        author = self.stored_users[0]
+
+        self.in_title = ArticleFactory(
+            author=author,
+            title="Training dragons",
+            description="A guide",
+            body="Everything you need to know before you start."
+        )
+        self.in_body = ArticleFactory(
+            author=author,
+            title="A long story",
+            description="Once upon a time",
+            body="There was a village terrified by a dragon living nearby."
+        )
+        self.in_tags = ArticleFactory(
+            author=author,
+            title="Mythical creatures",
+            description="Creatures of legend",
+            body="Stories about creatures that never existed."
+        )
+        self.in_tags.tag_list.add("dragons", "legends")
+
+    def search(self, text):
+        return self.client.get(reverse("search"), {"q": text})
+
+    def test_search_covers_title_body_and_tags(self):
+        response = self.search("dragon")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {article['slug'] for article in response.data['results']},
+            {self.in_title.slug, self.in_body.slug, self.in_tags.slug}
+        )
+
+    def test_results_are_ranked_with_snippets(self):
+        results = self.search("dragons").data['results']
+
+        # A match in the title weighs more than one in the tags or body.
+        self.assertEqual(results[0]['slug'], self.in_title.slug)
+        self.assertEqual(
+            [article['rank'] for article in results],
+            sorted((article['rank'] for article in results), reverse=True)
+        )
+
+        in_body = next(
+            article for article in results if article['slug'] == self.in_body.slug)
+        self.assertIn("<mark>dragon</mark>", in_body['snippet'])
+        self.assertNotIn('search_vector', in_body)
+
+    def test_vector_follows_edits(self):
+        self.in_body.body = "The village lived happily ever after."
+        self.in_body.save()
+        self.in_tags.tag_list.clear()
+
+        response = self.search("dragon")
+
+        self.assertEqual(
+            [article['slug'] for article in response.data['results']],
+            [self.in_title.slug]
+        )
+
+    def test_search_without_matches(self):
+        response = self.search("unicorn")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+    def test_rebuild_command(self):
+        Article.objects.filter(pk=self.in_body.pk).update(search_vector=None)
+
+        output = StringIO()
+        call_command('rebuild_search_vectors', stdout=output)
+
+        self.assertIn("Updated the search vectors", output.getvalue())
+        self.assertTrue(
+            Article.objects.filter(pk=self.in_body.pk).search("dragon").exists()
+        )
@@ -0,0 +1,130 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Article, SlugCounter
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory
+
+
+class TestArticleSlug(TestConfiguration):
+    """
+    test suite for allocating unique article slugs
+    """
+
+    def create(self, title):
+        return ArticleFactory(author=self.stored_users[0], title=title)
+
+    def test_same_titles_get_increasing_suffixes(self):
+        """
+        test articles sharing a title get the base slug then numbered ones
+        """
+        slugs = [self.create("Dragons of the north").slug for _ in range(3)]
+
+        self.assertEqual(slugs, [
+            "dragons-of-the-north",
+            "dragons-of-the-north-1",
+            "dragons-of-the-north-2"
+        ])
+
+    def test_allocation_cost_does_not_grow(self):
+        """
+        test saving the n-th same-titled article runs a constant number of
+        queries
+        """
+        self.create("Constant cost")
+
+        with CaptureQueriesContext(connection) as second:
+            self.create("Constant cost")
+
+        for _ in range(10):
+            self.create("Constant cost")
+
+        with CaptureQueriesContext(connection) as last:
+            article = self.create("Constant cost")
+
+        self.assertEqual(len(second), len(last))
+        self.assertEqual(article.slug, "constant-cost-12")
+
+    def test_update_keeps_the_slug(self):
+        """
+        test saving an article without editing its title keeps its slug
+        """
+        self.create("Keep my slug")
+        article = self.create("Keep my slug")
+
+        article = Article.objects.get(pk=article.pk)
+        article.body = "An edited body"
+        article.save()
+
+        self.assertEqual(Article.objects.get(pk=article.pk).slug, "keep-my-slug-1")
+
+    def test_title_change_gets_a_new_slug(self):
+        """
+        test editing the title of an article gives it a matching slug
+        """
+        article = Article.objects.get(pk=self.create("Old title").pk)
+        article.title = "A brand new title"
+        article.save()
+
+        self.assertEqual(article.slug, "a-brand-new-title")
+
+    def test_slug_collision_is_retried(self):
+        """
+        test the unique constraint and a retry recover from a counter that
+        is behind the existing slugs
+        """
+        self.create("Behind the counter")
+        self.create("Behind the counter")
+        SlugCounter.objects.filter(base="behind-the-counter").update(last=0)
+
+        article = self.create("Behind the counter")
+
+        self.assertEqual(article.slug, "behind-the-counter-2")
+
+    def test_existing_slugs_seed_the_counter(self):
+        """
+        test a base slug used before the counters existed is not reused
+        """
+        self.create("Seeded slug")
+        SlugCounter.objects.filter(base="seeded-slug").delete()
+
+        article = self.create("Seeded slug")
+
+        self.assertEqual(article.slug, "seeded-slug-1")
+
+    def test_gapped_slugs_seed_the_counter(self):
+        """
+        test the counter starts after the highest suffix in use, not after
+        the number of articles using the base slug
+        """
+        for suffix in ["", "-6", "-7", "-8", "-9", "-10", "-11", "-12", "-other"]:
+            article = self.create("Legacy title")
+            Article.objects.filter(pk=article.pk).update(slug="gapped-slug" + suffix)
+
+        SlugCounter.objects.filter(base="gapped-slug").delete()
+
+        slugs = [self.create("Gapped slug").slug for _ in range(2)]
+
+        self.assertEqual(slugs, ["gapped-slug-13", "gapped-slug-14"])
+
+    def test_digits_of_the_base_slug_are_not_a_suffix(self):
+        """
+        test a base slug ending in a number is seeded from the suffixes after
+        it, not from its own number
+        """
+        self.create("Python 3")
+        SlugCounter.objects.filter(base="python-3").delete()
+
+        article = self.create("Python 3")
+
+        self.assertEqual(article.slug, "python-3-1")
+
+    def test_suffixed_slug_fits_the_column(self):
+        """
+        test the suffix does not push a long slug past the column length
+        """
+        title = "a" * 50
+        self.create(title)
+        article = self.create(title)
+
+        self.assertEqual(article.slug, "a" * 48 + "-1")
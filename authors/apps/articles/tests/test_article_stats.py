@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import ArticleStats
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.factory import ArticleFactory
+
+
+class TestArticleStats(TestUsingLoggedInUser):
+    """
+    test suite for the denormalized article engagement counters
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        # The logged in user wrote the stored articles and cannot rate them,
+        # so we engage with an article written by somebody else.
+        self.other_article = ArticleFactory(author=self.stored_users[1])
+
+    def post(self, url, data=None):
+        return self.client.post(
+            url,
+            data,
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+    def stats(self):
+        return ArticleStats.objects.get(article=self.other_article)
+
+    def test_stats_are_created_with_the_article(self):
+        """
+        test a new article starts with zeroed counters
+        """
+        stats = self.stats()
+
+        for field in ArticleStats.COUNTERS:
+            self.assertEqual(getattr(stats, field), 0)
+
+        self.assertIsNone(stats.rating)
+
+    def test_votes_update_the_counters(self):
+        """
+        test liking, flipping and removing a vote keeps the counters in step
+        """
+        slug = self.other_article.slug
+
+        self.post('/api/articles/{}/like/'.format(slug))
+        self.assertEqual(
+            (self.stats().like_count, self.stats().dislike_count), (1, 0))
+
+        self.post('/api/articles/{}/dislike/'.format(slug))
+        self.assertEqual(
+            (self.stats().like_count, self.stats().dislike_count), (0, 1))
+
+        self.post('/api/articles/{}/dislike/'.format(slug))
+        self.assertEqual(
+            (self.stats().like_count, self.stats().dislike_count), (0, 0))
+
+    def test_ratings_update_the_counters(self):
+        """
+        test rating and re-rating an article updates the rating sum and count
+        """
+        url = reverse("rate_article", kwargs={"slug": self.other_article.slug})
+
+        self.post(url, {"article": {"rate": 2}})
+        self.post(url, {"article": {"rate": 5}})
+
+        stats = self.stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count), (5, 1))
+        self.assertEqual(stats.rating, 5)
+
+    def test_favorites_comments_and_reads_update_the_counters(self):
+        """
+        test favoriting, commenting and reading an article bump its counters
+        """
+        slug = self.other_article.slug
+
+        self.post(reverse("favorite", kwargs={"slug": slug}))
+        self.post(
+            reverse("article_comments", kwargs={"slug": slug}),
+            {"parent": 0, "text": "A comment"}
+        )
+        response = self.client.get(
+            reverse("article", kwargs={"slug": slug}),
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        stats = self.stats()
+        self.assertEqual(stats.favorite_count, 1)
+        self.assertEqual(stats.comment_count, 1)
+        self.assertEqual(stats.read_count, 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_rebuild_command_fixes_drifted_counters(self):
+        """
+        test the rebuild command recreates missing rows and fixes drift
+        """
+        self.post(reverse("favorite", kwargs={"slug": self.other_article.slug}))
+
+        ArticleStats.objects.filter(article=self.other_article).update(
+            favorite_count=7, like_count=3
+        )
+        ArticleStats.objects.filter(article=self.stored_articles[0]).delete()
+
+        output = StringIO()
+        call_command('rebuild_article_stats', stdout=output)
+
+        self.assertIn("1 missing and 1 drifted", output.getvalue())
+        self.assertEqual(self.stats().favorite_count, 1)
+        self.assertEqual(self.stats().like_count, 0)
+        self.assertEqual(
+            ArticleStats.objects.get(article=self.stored_articles[0]).comment_count,
+            12
+        )
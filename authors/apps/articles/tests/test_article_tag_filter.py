@@ -0,0 +1,105 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory
+from authors.response import RESPONSE
+
+
+class TestArticleTagFilter(TestConfiguration):
+    """
+    test suite for filtering the searched articles by their tags
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.python = self.tagged("python")
+        self.python_django = self.tagged("python", "django")
+        self.python_django_rest = self.tagged("python", "django", "rest")
+        self.go = self.tagged("go")
+
+    def tagged(self, *tags):
+        article = ArticleFactory(author=self.stored_users[0])
+        article.tag_list.add(*tags)
+        return article
+
+    def search(self, tags, mode=None):
+        params = {"tags": tags, "limit": 100}
+
+        if mode:
+            params["tags_mode"] = mode
+
+        return self.client.get(reverse("search"), params)
+
+    def slugs(self, response):
+        return sorted(article['slug'] for article in response.data['results'])
+
+    def expected(self, *articles):
+        return sorted(article.slug for article in articles)
+
+    def test_all_tags(self):
+        response = self.search("python,django")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.slugs(response),
+            self.expected(self.python_django, self.python_django_rest)
+        )
+
+    def test_all_tags_with_unknown_tag(self):
+        response = self.search("python,unknown")
+
+        self.assertEqual(response.data['count'], 0)
+
+    def test_any_tag(self):
+        response = self.search("django,go", "any")
+
+        self.assertEqual(
+            self.slugs(response),
+            self.expected(self.python_django, self.python_django_rest, self.go)
+        )
+
+    def test_no_tag(self):
+        response = self.search("django,go", "none")
+
+        slugs = self.slugs(response)
+        self.assertIn(self.python.slug, slugs)
+        self.assertNotIn(self.python_django.slug, slugs)
+        self.assertNotIn(self.go.slug, slugs)
+
+    def test_articles_are_not_repeated(self):
+        response = self.search("python,django,rest", "any")
+
+        self.assertEqual(
+            self.slugs(response),
+            self.expected(self.python, self.python_django, self.python_django_rest)
+        )
+
+    def test_invalid_mode(self):
+        response = self.search("python", "some")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['tags_mode'],
+            RESPONSE['invalid_field'].format("tags_mode")
+        )
+
+    def test_tags_are_filtered_in_one_grouped_subquery(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.search("python,django,rest")
+
+        article_queries = [
+            query['sql'] for query in queries
+            if query['sql'].startswith('SELECT') and '"articles_article"' in query['sql'] and
+            'HAVING' in query['sql']
+        ]
+
+        self.assertTrue(article_queries)
+
+        for sql in article_queries:
+            self.assertEqual(sql.count('FROM "taggit_taggeditem"'), 1)
+            self.assertNotIn('JOIN "taggit_taggeditem"', sql)
+            self.assertIn('HAVING COUNT(DISTINCT', sql)
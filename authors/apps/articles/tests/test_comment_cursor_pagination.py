@@ -0,0 +1,111 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from authors.apps.articles.models import Comment
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory, CommentFactory
+
+
+class TestCommentCursorPagination(TestConfiguration):
+    """
+    test suite for walking the pages of a long comment thread with cursors
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.article = ArticleFactory(author=self.stored_users[0])
+        self.comments = CommentFactory.create_batch(
+            45,
+            parent=0,
+            user=self.stored_users[1],
+            article=self.article
+        )
+
+        # Comments created in the same instant are ordered by their id.
+        Comment.objects.filter(
+            id__in=[comment.id for comment in self.comments[10:30]]
+        ).update(created_at=timezone.now())
+
+        self.expected = list(
+            Comment.objects.filter(article=self.article)
+            .order_by('created_at', 'id')
+            .values_list('id', flat=True)
+        )
+
+    def get_page(self, cursor=None):
+        response = self.client.get(
+            reverse("article_comments", kwargs={"slug": self.article.slug}),
+            {"cursor": cursor} if cursor else {}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response.data
+
+    def ids(self, page):
+        return [comment['id'] for comment in page['comments']]
+
+    def test_walking_forward_returns_every_comment_once(self):
+        """
+        test following the next cursors goes through the whole thread in
+        order without repeating or skipping comments
+        """
+        pages = [self.get_page()]
+
+        while pages[-1]['cursor']['next']:
+            pages.append(self.get_page(pages[-1]['cursor']['next']))
+
+        self.assertEqual([len(page['comments']) for page in pages], [20, 20, 5])
+        self.assertEqual(sum((self.ids(page) for page in pages), []), self.expected)
+        self.assertIsNone(pages[0]['cursor']['previous'])
+
+    def test_walking_back_returns_the_same_pages(self):
+        """
+        test following the previous cursors from the last page gives back
+        the pages seen on the way forward
+        """
+        first = self.get_page()
+        second = self.get_page(first['cursor']['next'])
+        third = self.get_page(second['cursor']['next'])
+
+        back_to_second = self.get_page(third['cursor']['previous'])
+        back_to_first = self.get_page(back_to_second['cursor']['previous'])
+
+        self.assertEqual(self.ids(back_to_second), self.ids(second))
+        self.assertEqual(self.ids(back_to_first), self.ids(first))
+        self.assertIsNone(back_to_first['cursor']['previous'])
+        self.assertIsNotNone(back_to_first['cursor']['next'])
+
+    def test_new_comments_do_not_shift_the_next_page(self):
+        """
+        test comments posted while paging only show up at the end of the
+        thread instead of pushing comments into the following page
+        """
+        first = self.get_page()
+        CommentFactory(parent=0, user=self.stored_users[1], article=self.article)
+        second = self.get_page(first['cursor']['next'])
+
+        self.assertEqual(self.ids(second), self.expected[20:40])
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        """
+        test fetching a deep page runs the same number of queries as the
+        first one
+        """
+        with CaptureQueriesContext(connection) as first_queries:
+            first = self.get_page()
+
+        second = self.get_page(first['cursor']['next'])
+
+        with CaptureQueriesContext(connection) as last_queries:
+            self.get_page(second['cursor']['next'])
+
+        self.assertEqual(len(first_queries), len(last_queries))
+        self.assertTrue(any(
+            '"created_at" >' in query['sql'] and 'OFFSET' not in query['sql']
+            for query in last_queries
+        ))
@@ -0,0 +1,171 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.factory import ArticleFactory, CommentFactory
+
+
+@override_settings(SHARED_CACHE=True)
+class TestConditionalRequests(TestUsingLoggedInUser):
+    """
+    test suite for answering conditional GET requests on articles and
+    comments with 304 responses
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.article = ArticleFactory(author=self.stored_users[1])
+        self.article_url = reverse("article", kwargs={"slug": self.article.slug})
+
+    def get(self, url, etag=None, token=None, **headers):
+        if etag:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+
+        if token:
+            headers['HTTP_AUTHORIZATION'] = 'Token {}'.format(token)
+
+        return self.client.get(url, **headers)
+
+    def post(self, url, data=None):
+        return self.client.post(
+            url,
+            data,
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+    def test_article_is_not_resent(self):
+        response = self.get(self.article_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.get(self.article_url, response['ETag'])
+
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached['ETag'], response['ETag'])
+        self.assertEqual(cached.content, b'')
+        self.assertEqual(len(queries), 0)
+
+        modified_since = self.get(
+            self.article_url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(modified_since.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_article_counters_change_the_etag(self):
+        etag = self.get(self.article_url)['ETag']
+
+        self.post('/api/articles/{}/like/'.format(self.article.slug))
+        response = self.get(self.article_url, etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['likes'], 1)
+
+    def test_viewer_state_changes_the_etag(self):
+        etag = self.get(self.article_url, token=self.access_token)['ETag']
+
+        self.assertEqual(
+            self.get(self.article_url, etag, self.access_token).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.post(reverse("bookmark", kwargs={"slug": self.article.slug}))
+        response = self.get(self.article_url, etag, self.access_token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['bookmarked'])
+        self.assertNotIn('Last-Modified', response)
+
+    def test_article_list(self):
+        url = reverse("all_articles")
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        ArticleFactory(author=self.stored_users[1])
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_200_OK)
+
+    def test_article_list_validator_does_not_scan_the_articles(self):
+        url = reverse("all_articles")
+        etag = self.get(url)['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('articles_article', queries[0]['sql'])
+
+    def test_author_rename_changes_the_etags(self):
+        urls = [
+            self.article_url,
+            reverse("all_articles"),
+            reverse("article_comments", kwargs={"slug": self.stored_articles[0].slug})
+        ]
+        CommentFactory(parent=0, user=self.stored_users[1], article=self.stored_articles[0])
+        etags = [self.get(url)['ETag'] for url in urls]
+
+        author = self.stored_users[1]
+        author.username = "renamed_author"
+        author.save()
+
+        responses = [self.get(url, etag) for (url, etag) in zip(urls, etags)]
+
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [status.HTTP_200_OK] * 3
+        )
+        self.assertEqual(responses[0].data['author']['username'], "renamed_author")
+
+    def test_tagging_changes_the_list_etag(self):
+        url = reverse("all_articles")
+        etag = self.get(url)['ETag']
+
+        self.article.tag_list.add("fresh-tag")
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_200_OK)
+
+    def test_article_list_follows_the_viewer(self):
+        url = reverse("all_articles")
+        etag = self.get(url, token=self.access_token)['ETag']
+
+        self.assertEqual(
+            self.get(url, etag, self.access_token).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.post('/api/articles/{}/like/'.format(self.article.slug))
+
+        self.assertEqual(
+            self.get(url, etag, self.access_token).status_code,
+            status.HTTP_200_OK
+        )
+
+    def test_comments(self):
+        url = reverse("article_comments", kwargs={"slug": self.stored_articles[0].slug})
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        CommentFactory(parent=0, user=self.stored_users[1], article=self.stored_articles[0])
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_200_OK)
+
+    def test_comment_replies(self):
+        url = reverse("article_comment", kwargs={
+            "slug": self.stored_articles[0].slug,
+            "pk": self.stored_comments[0].id
+        })
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.stored_comments[-1][-1].delete()
+
+        self.assertEqual(self.get(url, etag).status_code, status.HTTP_200_OK)
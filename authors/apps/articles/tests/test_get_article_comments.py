@@ -7,19 +7,19 @@ from authors.response import RESPONSE
 
 class TestGetArticleComments(TestConfiguration):
 
-    def get_comments(self, slug, offset):
+    def get_comments(self, slug, cursor=None):
         return self.client.get(
             reverse(
-                "article_comments_list",
+                "article_comments",
                 kwargs={
-                    "slug": slug,
-                    "offset": offset
+                    "slug": slug
                 }
-            )
+            ),
+            {"cursor": cursor} if cursor else {}
         )
 
     def test_using_unexisting_article_slug(self):
-        response = self.get_comments("this-article-does-not-exist", 0)
+        response = self.get_comments("this-article-does-not-exist")
 
         self.assertEqual(
             response.status_code,
@@ -31,8 +31,8 @@ class TestGetArticleComments(TestConfiguration):
             RESPONSE['not_found'].format(data="Article")
         )
 
-    def test_using_out_of_range_offset(self):
-        response = self.get_comments(self.stored_articles[0].slug, 40)
+    def test_using_article_without_comments(self):
+        response = self.get_comments(self.stored_articles[1].slug)
 
         self.assertEqual(
             response.status_code,
@@ -44,8 +44,21 @@ class TestGetArticleComments(TestConfiguration):
             RESPONSE['not_found'].format(data="Comments")
         )
 
+    def test_using_invalid_cursor(self):
+        response = self.get_comments(self.stored_articles[0].slug, "not-a-cursor")
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+        self.assertEqual(
+            response.data['errors']['cursor'],
+            RESPONSE['invalid_field'].format("cursor")
+        )
+
     def test_using_valid_data(self):
-        response = self.get_comments(self.stored_articles[0].slug, 0)
+        response = self.get_comments(self.stored_articles[0].slug)
 
         self.assertEqual(
             response.status_code,
@@ -56,3 +69,9 @@ class TestGetArticleComments(TestConfiguration):
             response.data['comment'],
             RESPONSE['comment']['get_success']
         )
+
+        self.assertEqual(len(response.data['comments']), 6)
+        self.assertEqual(
+            response.data['cursor'],
+            {"next": None, "previous": None}
+        )
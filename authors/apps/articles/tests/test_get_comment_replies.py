@@ -7,20 +7,20 @@ from authors.response import RESPONSE
 
 class TestGetCommentReplies(TestConfiguration):
 
-    def get_replies(self, comment_id, offset):
+    def get_replies(self, comment_id, cursor=None):
         return self.client.get(
             reverse(
-                "article_comment_replies",
+                "article_comment",
                 kwargs={
                     "pk": comment_id,
-                    "slug": self.stored_articles[0].slug,
-                    "offset": offset
+                    "slug": self.stored_articles[0].slug
                 }
-            )
+            ),
+            {"cursor": cursor} if cursor else {}
         )
 
     def test_using_unexisting_comment_id(self):
-        response = self.get_replies(999, 0)
+        response = self.get_replies(999)
 
         self.assertEqual(
             response.status_code,
@@ -32,21 +32,21 @@ class TestGetCommentReplies(TestConfiguration):
             RESPONSE['not_found'].format(data="Comments")
         )
 
-    def test_using_out_of_range_offset(self):
-        response = self.get_replies(self.stored_comments[0].id, 40)
+    def test_using_invalid_cursor(self):
+        response = self.get_replies(self.stored_comments[0].id, "not-a-cursor")
 
         self.assertEqual(
             response.status_code,
-            status.HTTP_404_NOT_FOUND
+            status.HTTP_400_BAD_REQUEST
         )
 
         self.assertEqual(
-            response.data['errors']['comments'],
-            RESPONSE['not_found'].format(data="Comments")
+            response.data['errors']['cursor'],
+            RESPONSE['invalid_field'].format("cursor")
         )
 
     def test_using_valid_data(self):
-        response = self.get_replies(self.stored_comments[0].id, 0)
+        response = self.get_replies(self.stored_comments[0].id)
 
         self.assertEqual(
             response.status_code,
@@ -0,0 +1,138 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.base_test_config import TestConfiguration
+from authors.factory import ArticleFactory, CommentFactory, UserFactory
+from authors.response import RESPONSE
+
+
+class TestGetCommentTree(TestConfiguration):
+    """
+    test suite for retrieving the whole comment thread of an article
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.article = ArticleFactory(author=self.stored_users[0])
+
+        # Two top level comments, the first one with a reply chain three
+        # levels deep.
+        self.first = self.comment(0)
+        self.second = self.comment(0)
+        self.reply = self.comment(self.first.id)
+        self.nested_reply = self.comment(self.reply.id)
+
+    def comment(self, parent, user=None):
+        return CommentFactory(
+            parent=parent,
+            user=user or self.stored_users[1],
+            article=self.article
+        )
+
+    def get_tree(self, slug=None, **params):
+        return self.client.get(
+            reverse(
+                "article_comment_tree",
+                kwargs={"slug": slug or self.article.slug}
+            ),
+            params
+        )
+
+    def shape(self, nodes):
+        return [(node['id'], self.shape(node['replies'])) for node in nodes]
+
+    def test_using_unexisting_article_slug(self):
+        response = self.get_tree("this-article-does-not-exist")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            response.data['errors']['article'],
+            RESPONSE['not_found'].format(data="Article")
+        )
+
+    def test_getting_the_whole_thread(self):
+        response = self.get_tree()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['comment'],
+            RESPONSE['comment']['tree']['get_success']
+        )
+        self.assertEqual(self.shape(response.data['comments']), [
+            (self.first.id, [(self.reply.id, [(self.nested_reply.id, [])])]),
+            (self.second.id, [])
+        ])
+        self.assertEqual(
+            response.data['comments'][0]['user']['username'],
+            self.stored_users[1].username
+        )
+
+    def test_limiting_the_depth(self):
+        response = self.get_tree(depth=2)
+
+        self.assertEqual(self.shape(response.data['comments']), [
+            (self.first.id, [(self.reply.id, [])]),
+            (self.second.id, [])
+        ])
+
+    def test_getting_the_thread_below_a_comment(self):
+        response = self.get_tree(root=self.reply.id)
+
+        self.assertEqual(self.shape(response.data['comments']), [
+            (self.reply.id, [(self.nested_reply.id, [])])
+        ])
+
+    def test_using_a_root_from_another_article(self):
+        response = self.get_tree(root=self.stored_comments[0].id)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            response.data['errors']['comments'],
+            RESPONSE['not_found'].format(data="Comments")
+        )
+
+    def test_using_invalid_depth(self):
+        response = self.get_tree(depth="zero")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['depth'],
+            RESPONSE['invalid_field'].format("depth")
+        )
+
+    def test_using_a_unicode_digit_as_root(self):
+        response = self.get_tree(root="\u00b2")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['root'],
+            RESPONSE['invalid_field'].format("root")
+        )
+
+    def test_replies_to_deleted_comments_are_left_out(self):
+        self.reply.delete()
+
+        response = self.get_tree()
+
+        self.assertEqual(self.shape(response.data['comments']), [
+            (self.first.id, []),
+            (self.second.id, [])
+        ])
+
+    def test_query_count_does_not_grow_with_the_thread(self):
+        with CaptureQueriesContext(connection) as small:
+            self.get_tree()
+
+        parent = self.nested_reply.id
+
+        for _ in range(10):
+            parent = self.comment(parent, user=UserFactory()).id
+
+        with CaptureQueriesContext(connection) as large:
+            response = self.get_tree()
+
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(len(response.data['comments']), 2)
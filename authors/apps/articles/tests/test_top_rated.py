@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import ArticleStats
+from authors.apps.articles.stats import compute_stats, rebuild_stats
+from authors.apps.articles.views.articles import TopRatedArticles
+from authors.apps.rating.serializers import RateArticleSerializer
+from authors.base_test_config import TestConfiguration
+from authors.factory import UserFactory
+from authors.response import RESPONSE
+
+
+class TestTopRatedArticles(TestConfiguration):
+    """
+    test suite for ranking articles by their rating score
+    """
+
+    def setUp(self):
+        super().setUp()
+        raters = UserFactory.create_batch(10)
+        (self.single_five, self.many_fours, self.low) = self.stored_articles[10:13]
+
+        self.rate(self.single_five, raters[:1], 5)
+        self.rate(self.many_fours, raters, 4)
+        self.rate(self.low, raters[:3], 2)
+
+    def rate(self, article, raters, rate):
+        for rater in raters:
+            RateArticleSerializer.rate_article({"rate": rate}, rater.id, article)
+
+    def get_top_rated(self, **params):
+        return self.client.get(reverse("top_rated_articles"), params)
+
+    def slugs(self, response):
+        return [article['slug'] for article in response.data['results']]
+
+    def test_scores_are_bayesian_averages(self):
+        scores = dict(ArticleStats.objects.filter(
+            article__in=[self.single_five, self.many_fours, self.low]
+        ).values_list('article_id', 'rating_score'))
+
+        self.assertAlmostEqual(scores[self.single_five.id], (3 * 5 + 5) / 6)
+        self.assertAlmostEqual(scores[self.many_fours.id], (3 * 5 + 40) / 15)
+        self.assertAlmostEqual(scores[self.low.id], (3 * 5 + 6) / 8)
+
+    def test_scores_are_kept_in_step_with_the_ratings(self):
+        rater = UserFactory()
+        self.rate(self.low, [rater], 5)
+        self.rate(self.low, [rater], 1)
+
+        expected = compute_stats([self.low.id])[self.low.id]
+
+        self.assertEqual(
+            ArticleStats.objects.get(article=self.low).rating_score,
+            expected['rating_score']
+        )
+        self.assertEqual(rebuild_stats([self.low.id], dry_run=True), ([], []))
+
+    def test_rated_articles_are_ranked_by_score(self):
+        response = self.get_top_rated()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.slugs(response),
+            [self.many_fours.slug, self.single_five.slug, self.low.slug]
+        )
+
+    def test_ranking_is_paginated(self):
+        with mock.patch.object(TopRatedArticles, 'page_size', 2):
+            first = self.get_top_rated()
+            second = self.get_top_rated(cursor=first.data['cursor']['next'])
+            back = self.get_top_rated(cursor=second.data['cursor']['previous'])
+
+        self.assertEqual(self.slugs(first), [self.many_fours.slug, self.single_five.slug])
+        self.assertEqual(self.slugs(second), [self.low.slug])
+        self.assertIsNone(second.data['cursor']['next'])
+        self.assertEqual(self.slugs(back), self.slugs(first))
+
+    def test_invalid_cursor(self):
+        response = self.get_top_rated(cursor="not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['cursor'],
+            RESPONSE['invalid_field'].format("cursor")
+        )
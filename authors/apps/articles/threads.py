@@ -0,0 +1,72 @@
+from django.db.models.expressions import RawSQL
+
+from .models import Comment
+
+
+THREAD_SQL = """
+    WITH RECURSIVE thread (id, depth, path) AS (
+        SELECT id, 1, ARRAY[id]
+        FROM {table}
+        WHERE article_id = %s AND {anchor}
+      UNION ALL
+        SELECT reply.id, thread.depth + 1, thread.path || reply.id
+        FROM {table} reply
+        JOIN thread ON reply.parent = thread.id
+        WHERE reply.article_id = %s
+          AND NOT reply.id = ANY(thread.path)
+          AND (%s IS NULL OR thread.depth < %s)
+    )
+    SELECT id FROM thread
+"""
+
+
+def load_thread(article_id, root=None, depth=None):
+    """
+    Load the comments of an article in a single query, ordered the way they
+    are displayed.
+
+    Without a root or a depth every comment of the article is returned.
+    Otherwise a recursive query walks down the reply chains from the given
+    root comment, or from the top level comments, and stops after `depth`
+    levels.
+    """
+    comments = Comment.objects.filter(
+        article_id=article_id
+    ).select_related('user__profile').order_by('created_at', 'id')
+
+    if root is None and depth is None:
+        return list(comments)
+
+    sql = THREAD_SQL.format(
+        table=Comment._meta.db_table,
+        anchor='id = %s' if root is not None else 'parent = 0'
+    )
+    params = [article_id] + ([root] if root is not None else []) + \
+        [article_id, depth, depth]
+
+    return list(comments.filter(id__in=RawSQL(sql, params)))
+
+
+def build_tree(nodes, root=None):
+    """
+    Nest serialized comments under their parents in a `replies` list.
+
+    Every node is visited once, so assembling the tree is linear in the
+    number of comments. Replies whose parent is not part of the loaded
+    comments, for instance because it has been deleted, are left out.
+    """
+    by_id = {}
+
+    for node in nodes:
+        node['replies'] = []
+        by_id[node['id']] = node
+
+    roots = []
+
+    for node in nodes:
+        if node['id'] == root or (root is None and node['parent'] == 0):
+            roots.append(node)
+        elif node['parent'] in by_id:
+            by_id[node['parent']]['replies'].append(node)
+
+    return roots
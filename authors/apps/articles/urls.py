@@ -10,15 +10,15 @@ urlpatterns = [
     path("articles/", articles.ArticlesViews.as_view(), name="articles"),
     path("article/<str:slug>", articles.ArticleView.as_view(), name="article"),
     path("articles/all", articles.GetArticles.as_view(), name="all_articles"),
+    path("articles/export", articles.ArticleExportView.as_view(), name="article_export"),
+    path("articles/top-rated", articles.TopRatedArticles.as_view(), name="top_rated_articles"),
 
     path("articles/<str:slug>/comments",
          comments.CommentsView.as_view(), name="article_comments"),
-    path("articles/<str:slug>/comments/<int:offset>",
-         comments.CommentsView.as_view(), name="article_comments_list"),
+    path("articles/<str:slug>/comments/tree",
+         comments.CommentTreeView.as_view(), name="article_comment_tree"),
     path("articles/<str:slug>/comment/<int:pk>",
          comments.CommentView.as_view(), name="article_comment"),
-    path("articles/<str:slug>/comment/<int:pk>/<int:offset>",
-         comments.CommentView.as_view(), name="article_comment_replies"),
     path("comment/history/<int:pk>",
          comments.CommentHistoryView.as_view(), name="comment_edit_history"),
 
@@ -2,13 +2,25 @@ from rest_framework.generics import CreateAPIView, RetrieveUpdateDestroyAPIView,
 from rest_framework.response import Response
 from rest_framework import status, exceptions
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.views import APIView
+from django.db.models import F
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from ..serializers import ArticleSerializer, GetArticlesSerializer
 from ..renderers import ArticlesJSONRenderer
+from ..batch import ArticleBatch
+from ..cache import cache_article, current_versions, get_cached_article
+from ..conditional import article_list_validators, article_validators
+from ..export import export_articles
 from ..models import Article
+from ..pagination import InvalidCursor, KeysetPaginator
 
-from authors.apps.read_stats.models import UserReadStat
+from authors.apps.core.conditional import Validators
+from authors.apps.read_stats.buffer import record_read
+from authors.response import RESPONSE
 
 
 class ArticlesViews(CreateAPIView):
@@ -55,27 +67,71 @@ class ArticleView(RetrieveUpdateDestroyAPIView):
         :param slug
         any user should view details of an article
         """
+        # The part of the article every reader sees the same is cached, so
+        # we only go to the database when it is missing or out of date.
+        cached = get_cached_article(slug)
+
+        if cached is None:
+            cached = self.load_article(slug)
+
+        data, validators = cached
+        viewer_flags = {}
+
+        # The read is only buffered, saving it is left to a background
+        # thread.
+        if request.user.id:
+            record_read(request.user.id, data['id'])
+
+            # Whether the reader favorited, bookmarked or voted on the
+            # article is looked up on top of the shared payload. These have
+            # no modification date, so the reader only gets an ETag.
+            batch = ArticleBatch(
+                [Article(id=data['id'], slug=data['slug'])],
+                user=request.user,
+                viewer_only=True
+            )
+            viewer_flags = batch.viewer_flags(batch.articles[0])
+            validators = Validators(
+                validators.etag, request.user.id, sorted(viewer_flags.items()))
+
+        not_modified = validators.not_modified(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        return validators.apply(
+            Response(dict(data, **viewer_flags), status.HTTP_200_OK)
+        )
+
+    def load_article(self, slug):
+        """
+        Load and cache the payload of the article as an anonymous reader
+        sees it, along with its validators.
+        """
         # Get the article user searched
         # When article is not found, Give the user a description
         # of what happened. If the article is found return it back to user
+        keys = Article.objects.filter(slug=slug).values('id', 'author_id').first()
+
+        if keys is None:
+            raise exceptions.NotFound({
+                "message": "Article was not found"})
+
+        # The versions are read before the article, so a change made while
+        # we load it invalidates what we are about to cache.
+        versions = current_versions(keys['id'], keys['author_id'])
+        validators = article_validators(keys['id'])
+
         try:
-            article = Article.objects.get(slug=slug)
+            article = Article.objects.get(id=keys['id'])
         except Article.DoesNotExist:
             raise exceptions.NotFound({
                 "message": "Article was not found"})
-        # save an instance of user access to an article to db
-        if request.user.id:
-            if not UserReadStat.objects.filter(user=request.user, article=article).exists():
-                user_read_stat = UserReadStat(
-                    user=request.user,
-                    article=article
-                )
-                user_read_stat.save()
 
-        serializer = GetArticlesSerializer(
-            instance=article, context={'request': request})
+        data = dict(GetArticlesSerializer(instance=article).data)
+        cache_article(slug, article.id, article.author_id, versions, data, validators)
 
-        return Response(serializer.data, status.HTTP_200_OK)
+        return data, validators
 
     def put(self, request, slug):
         """
@@ -133,3 +189,91 @@ class GetArticles(ListAPIView):
     serializer_class = GetArticlesSerializer
     renderer_classes = (ArticlesJSONRenderer,)
     queryset = Article.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        # Polling clients get a 304 as long as no article changed, without
+        # the page being loaded or serialized.
+        validators = article_list_validators(request)
+        not_modified = validators.not_modified(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        return validators.apply(super().list(request, *args, **kwargs))
+
+
+class TopRatedArticles(APIView):
+    """
+    list the rated articles by rating score, best first
+    """
+    permission_classes = (IsAuthenticatedOrReadOnly,)
+    renderer_classes = (ArticlesJSONRenderer,)
+    page_size = 10
+
+    def get(self, request):
+        # Pages are keyed on the indexed (rating_score, article) pair of the
+        # counters, so each one is read with a single index scan.
+        articles = Article.objects.filter(
+            stats__rating_count__gt=0
+        ).annotate(rating_score=F('stats__rating_score'))
+
+        try:
+            page = KeysetPaginator(
+                'rating_score', page_size=self.page_size, descending=True, numeric=True
+            ).paginate(articles, request.query_params.get('cursor'))
+        except InvalidCursor:
+            return Response(
+                {
+                    "errors": {
+                        "cursor": RESPONSE['invalid_field'].format("cursor")
+                    }
+                }, status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = GetArticlesSerializer(page.items, many=True, context={'request': request})
+
+        return Response(
+            {
+                "results": serializer.data,
+                "cursor": {
+                    "next": page.next,
+                    "previous": page.previous
+                }
+            }, status.HTTP_200_OK
+        )
+
+
+class ArticleExportView(APIView):
+    """
+    stream every article as a line of JSON, for syncing the catalogue
+    """
+    permission_classes = (IsAuthenticated,)
+
+    # How many articles are read from the cursor and serialized at a time.
+    chunk_size = 500
+
+    def get(self, request):
+        updated_since = request.query_params.get('updated_since')
+
+        if updated_since is not None:
+            try:
+                updated_since = parse_datetime(updated_since)
+            except ValueError:
+                updated_since = None
+
+            if updated_since is None:
+                return Response(
+                    {
+                        "errors": {
+                            "updated_since": RESPONSE['invalid_field'].format("updated_since")
+                        }
+                    }, status.HTTP_400_BAD_REQUEST
+                )
+
+            if timezone.is_naive(updated_since):
+                updated_since = timezone.make_aware(updated_since)
+
+        return StreamingHttpResponse(
+            export_articles(updated_since, self.chunk_size),
+            content_type='application/x-ndjson'
+        )
@@ -1,13 +1,22 @@
+import re
+
 from rest_framework.response import Response
 from rest_framework import status, generics
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from ..serializers import CommentSerializer, CommentHistorySerializer, CreateCommentSerializer
 from ..models import Comment, Article, CommentHistory
 from ..renderers import CommentHistoryJSONRenderer
+from ..conditional import comment_thread_validators
+from ..pagination import KeysetPaginator, InvalidCursor
+from ..stats import bump_stats
+from ..threads import load_thread, build_tree
 from authors.response import RESPONSE
 
+COMMENTS_PAGE_SIZE = 20
+
 
 class CommentsView(generics.ListCreateAPIView):
     queryset = Comment.objects.all()
@@ -27,40 +36,46 @@ class CommentsView(generics.ListCreateAPIView):
         # We need to get the article slug from the url parameter.
         article_slug = kwargs["slug"]
 
-        page_size = 20
-        offset = kwargs["offset"]
-
         # This checks if the article slug provided matches any article in the database.
-        article_exists = check_if_article_exists(article_slug)
+        article = check_if_article_exists(article_slug)
 
-        if isinstance(article_exists, Response):
-            return article_exists
+        if isinstance(article, Response):
+            return article
 
-        # This tries to fetch a list of reply comments for the specified comment,
-        # from the database. If the comment id provided does not match any in
-        # the database, an error 404 response is sent back to the API user.
-        comments = get_comments(
-            article_slug=article_slug,
+        # This tries to fetch a page of top level comments for the article,
+        # starting from the position the cursor query parameter points to.
+        # If there are none, an error 404 response is sent back to the API user.
+        cursor = request.query_params.get("cursor")
+
+        # Clients polling the thread get a 304 as long as none of its
+        # comments changed, without the page being loaded.
+        validators = comment_thread_validators(article.id, 0, cursor)
+        not_modified = validators.not_modified(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        page = get_comments(
+            article=article,
             comment_id=0,
-            offset=offset,
-            page_size=page_size
+            cursor=cursor
         )
 
-        if isinstance(comments, Response):
-            return comments
+        if isinstance(page, Response):
+            return page
 
-        serializer = CommentSerializer(comments, many=True)
+        serializer = CommentSerializer(page.items, many=True)
 
-        return Response(
+        return validators.apply(Response(
             {
                 "comments": serializer.data,
-                "offset": {
-                    "next": offset + len(comments),
-                    "previous": offset
+                "cursor": {
+                    "next": page.next,
+                    "previous": page.previous
                 },
                 "comment": RESPONSE['comment']['get_success']
             }, status.HTTP_200_OK
-        )
+        ))
 
     def post(self, request, *args, **kwargs):
 
@@ -93,8 +108,11 @@ class CommentsView(generics.ListCreateAPIView):
                 }, status.HTTP_400_BAD_REQUEST
             )
 
-        # This is where we save the validated comment data to the database.
-        comment_serializer.save()
+        # This is where we save the validated comment data to the database,
+        # together with the article comment counter.
+        with transaction.atomic():
+            comment_serializer.save()
+            bump_stats(article.id, comment_count=1)
 
         return Response(
             {
@@ -122,40 +140,46 @@ class CommentView(generics.RetrieveUpdateDestroyAPIView):
         comment_id = kwargs["pk"]
         article_slug = kwargs["slug"]
 
-        page_size = 20
-        offset = kwargs["offset"]
-
         # This checks if the article slug provided matches any article in the database.
-        article_exists = check_if_article_exists(article_slug)
+        article = check_if_article_exists(article_slug)
 
-        if isinstance(article_exists, Response):
-            return article_exists
+        if isinstance(article, Response):
+            return article
 
-        # This tries to fetch a list of reply comments for the specified comment,
+        # This tries to fetch a page of reply comments for the specified comment,
         # from the database. If the comment id provided does not match any in
         # the database, an error 404 response is sent back to the API user.
-        comments = get_comments(
-            article_slug=article_slug,
+        cursor = request.query_params.get("cursor")
+
+        # Clients polling the thread get a 304 as long as none of its
+        # comments changed, without the page being loaded.
+        validators = comment_thread_validators(article.id, comment_id, cursor)
+        not_modified = validators.not_modified(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        page = get_comments(
+            article=article,
             comment_id=comment_id,
-            offset=offset,
-            page_size=page_size
+            cursor=cursor
         )
 
-        if isinstance(comments, Response):
-            return comments
+        if isinstance(page, Response):
+            return page
 
-        serializer = CommentSerializer(comments, many=True)
+        serializer = CommentSerializer(page.items, many=True)
 
-        return Response(
+        return validators.apply(Response(
             {
                 "comments": serializer.data,
-                "offset": {
-                    "next": offset + len(comments),
-                    "previous": offset
+                "cursor": {
+                    "next": page.next,
+                    "previous": page.previous
                 },
                 "comment": RESPONSE['comment']['replies']['get_success']
             }, status.HTTP_200_OK
-        )
+        ))
 
     def put(self, request, *args, **kwargs):
         """
@@ -254,7 +278,9 @@ class CommentView(generics.RetrieveUpdateDestroyAPIView):
             )
 
         # This is responsible for deleting the comment from the database.
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
+            bump_stats(comment.article_id, comment_count=-1)
 
         return Response(
             {
@@ -273,6 +299,66 @@ class CommentView(generics.RetrieveUpdateDestroyAPIView):
         }
 
 
+class CommentTreeView(generics.GenericAPIView):
+    """
+    This returns the comments of an article nested under the comments they
+    reply to, so that a whole thread can be displayed with a single request.
+    The optional root query parameter limits the tree to the replies of a
+    single comment, and depth limits how many levels of replies are returned.
+    """
+    permission_classes = (IsAuthenticatedOrReadOnly,)
+
+    serializer_class = CommentSerializer
+
+    def get(self, request, *args, **kwargs):
+        # This checks if the article slug provided matches any article in the database.
+        article = check_if_article_exists(kwargs["slug"])
+
+        if isinstance(article, Response):
+            return article
+
+        params = {}
+
+        for param in ("root", "depth"):
+            value = request.query_params.get(param)
+
+            if value is None:
+                continue
+
+            if not re.fullmatch(r'[0-9]+', value) or int(value) < 1:
+                return Response(
+                    {
+                        "errors": {
+                            param: RESPONSE['invalid_field'].format(param)
+                        }
+                    }, status.HTTP_400_BAD_REQUEST
+                )
+
+            params[param] = int(value)
+
+        # All the comments of the thread are loaded, together with their
+        # authors, in one query and then nested in memory.
+        comments = load_thread(article.id, **params)
+
+        if not comments:
+            return Response(
+                {
+                    "errors": {
+                        "comments": RESPONSE['not_found'].format(data="Comments")
+                    }
+                }, status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = CommentSerializer(comments, many=True)
+
+        return Response(
+            {
+                "comments": build_tree(serializer.data, params.get("root")),
+                "comment": RESPONSE['comment']['tree']['get_success']
+            }, status.HTTP_200_OK
+        )
+
+
 class CommentHistoryView(generics.ListAPIView):
 
     permission_classes = (IsAuthenticated,)
@@ -285,11 +371,26 @@ class CommentHistoryView(generics.ListAPIView):
 
 def get_comments(**kwargs):
     comments = Comment.objects.filter(
-        article__slug=kwargs['article_slug'],
+        article_id=kwargs['article'].id,
         parent=kwargs['comment_id']
-    )[kwargs['offset']:kwargs['offset'] + kwargs['page_size']]
+    ).select_related('user__profile')
+
+    # Pages are keyed on (created_at, id) rather than an offset, so deep pages
+    # of long threads cost the same as the first one.
+    try:
+        page = KeysetPaginator('created_at', page_size=COMMENTS_PAGE_SIZE).paginate(
+            comments, kwargs['cursor']
+        )
+    except InvalidCursor:
+        return Response(
+            {
+                "errors": {
+                    "cursor": RESPONSE['invalid_field'].format("cursor")
+                }
+            }, status.HTTP_400_BAD_REQUEST
+        )
 
-    if not comments:
+    if not page.items:
         return Response(
             {
                 "errors": {
@@ -298,11 +399,13 @@ def get_comments(**kwargs):
             }, status.HTTP_404_NOT_FOUND
         )
 
-    return comments
+    return page
 
 
 def check_if_article_exists(article_slug):
-    if not Article.objects.filter(slug=article_slug).exists():
+    article = Article.objects.filter(slug=article_slug).only('id').first()
+
+    if article is None:
         return Response(
             {
                 "errors": {
@@ -311,4 +414,4 @@ def check_if_article_exists(article_slug):
             }, status.HTTP_404_NOT_FOUND
         )
 
-    return True
+    return article
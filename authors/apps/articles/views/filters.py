@@ -1,11 +1,18 @@
 
 import django_filters as filters
 
+from django.conf import settings
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView
 from rest_framework.filters import SearchFilter
 
-from authors.apps.articles.models import Article
-from authors.apps.articles.serializers import GetArticlesSerializer
+from authors.apps.articles.models import Article, ArticleQuerySet
+from authors.apps.articles.serializers import (
+    ArticleFuzzySearchResultSerializer, ArticleSearchResultSerializer,
+    GetArticlesSerializer)
+from authors.apps.core.trigram import trigram_installed
+from authors.response import RESPONSE
 
 
 class ArticleFilterView(filters.FilterSet):
@@ -30,6 +37,17 @@ class ArticleSearchListAPIView(ListAPIView):
     """
     View class for article search and filter
     using title and author.
+
+    The `q` query parameter runs a full text search over the title, tags,
+    description and body of the articles instead, returning the best
+    matches first with a highlighted snippet of their body.
+
+    The `fuzzy` query parameter finds the articles whose title or author's
+    username look like it, so misspelled searches still match. How similar
+    they need to be can be set from 0 to 1 with the `similarity` parameter.
+
+    The comma separated `tags` parameter keeps the articles that have all of
+    the tags, or any or none of them when `tags_mode` is `any` or `none`.
     """
     serializer_class = GetArticlesSerializer
 
@@ -37,21 +55,74 @@ class ArticleSearchListAPIView(ListAPIView):
     filterset_class = ArticleFilterView
     search_fields = ('title', 'author__username')
 
+    def list(self, request, *args, **kwargs):
+        # The similarity threshold of a fuzzy search only holds for the
+        # transaction it is set in, so the search is run in one.
+        with transaction.atomic():
+            return super().list(request, *args, **kwargs)
+
+    def get_serializer_class(self):
+        if self.request.query_params.get('fuzzy'):
+            return ArticleFuzzySearchResultSerializer
+
+        if self.request.query_params.get('q'):
+            return ArticleSearchResultSerializer
+
+        return GetArticlesSerializer
+
     def get_queryset(self):
         tags = self.request.query_params.get('tags', '')
         author = self.request.query_params.get('author', '')
+        text = self.request.query_params.get('q', '')
+        fuzzy = self.request.query_params.get('fuzzy', '')
+
+        articles = Article.objects.all()
+
+        if fuzzy:
+            # Without the trigram extension the search would fail on its
+            # operators, so it is turned down instead.
+            if not trigram_installed(connection):
+                raise ValidationError({
+                    "fuzzy": RESPONSE['unavailable_field'].format("fuzzy")
+                })
+
+            articles = articles.fuzzy_search(fuzzy, self.get_similarity_threshold())
+        elif text:
+            articles = articles.search(text)
 
         if(tags == ""):
-            return Article.objects.all()
+            return articles
 
-        tag_list = tags.split(",")
-        articles = Article.objects.all()
+        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        mode = self.request.query_params.get('tags_mode', 'all')
+
+        if mode not in ArticleQuerySet.TAG_MODES:
+            raise ValidationError({
+                "tags_mode": RESPONSE['invalid_field'].format("tags_mode")
+            })
 
         if tag_list:
-            for tag in tag_list:
-                articles = articles.filter(tag_list__name=tag)
+            articles = articles.tagged(tag_list, mode)
 
         if author:
             articles = articles.filter(author__username=author)
 
         return articles
+
+    def get_similarity_threshold(self):
+        threshold = self.request.query_params.get('similarity')
+
+        if threshold is None:
+            return settings.TRIGRAM_SIMILARITY_THRESHOLD
+
+        try:
+            threshold = float(threshold)
+        except ValueError:
+            threshold = None
+
+        if threshold is None or not 0 <= threshold <= 1:
+            raise ValidationError({
+                "similarity": RESPONSE['invalid_field'].format("similarity")
+            })
+
+        return threshold
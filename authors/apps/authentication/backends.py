@@ -1,11 +1,16 @@
 import datetime
+from uuid import uuid4
 
 import jwt
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 
+from authors.response import RESPONSE
+
+from .cache import get_user
+from .verification import RevokedTokenError, verify_token
+
 """Configure JWT Here"""
 
 
@@ -25,6 +30,7 @@ class Authentication(TokenAuthentication):
         token = jwt.encode({
             "username": user["username"],
             "refresh_token": refresh_token,
+            "jti": uuid4().hex,
             "iat": datetime.datetime.utcnow(),
             'nbf': datetime.datetime.utcnow() + datetime.timedelta(minutes=-5),
             'exp': exp_time
@@ -35,20 +41,24 @@ class Authentication(TokenAuthentication):
     def authenticate_credentials(self, key):
 
         try:
-            payload = jwt.decode(key, secret_key)
-            user = get_user_model().objects.get(username=payload["username"])
+            payload = verify_token(key, secret_key)
+            user = get_user(payload["username"])
 
         except jwt.ExpiredSignatureError:
             raise exceptions.AuthenticationFailed(
                 'Token has expired please request for another'
             )
+        except RevokedTokenError:
+            raise exceptions.AuthenticationFailed(RESPONSE['token']['revoked'])
         return (user, payload)
 
     @staticmethod
     def decode_jwt_token(token):
         try:
-            user_info = jwt.decode(token, secret_key)
+            user_info = verify_token(token, secret_key)
         except jwt.ExpiredSignatureError:
             raise exceptions.AuthenticationFailed(
                 'Token has expired please request for another')
+        except RevokedTokenError:
+            raise exceptions.AuthenticationFailed(RESPONSE['token']['revoked'])
         return user_info
@@ -0,0 +1,265 @@
+"""
+Bulk import of user accounts, for onboarding the members of a partner.
+
+Creating the accounts one by one with `create_user` costs a password hash,
+two saves and the profile signals per user. Here the passwords are hashed
+across a pool of processes, and the users and their profiles are inserted
+with `bulk_create` one chunk at a time, which also skips the signals.
+
+Files uploaded through the API are only stored, and imported later by the
+`run_user_imports` worker, so the web processes never hash passwords or
+fork pools.
+"""
+
+import csv
+import io
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from authors.apps.profiles.models import Profile
+
+from .models import User, UserImport
+
+FORMATS = ('csv', 'jsonl')
+
+PROFILE_FIELDS = ('bio', 'image', 'company', 'website', 'location', 'phone')
+
+
+class ImportReport:
+    """
+    What became of the rows of an import.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.skipped = []
+
+    def skip(self, row, reason):
+        self.skipped.append({"row": row, "reason": reason})
+
+    def json(self):
+        return {
+            "created": self.created,
+            "skipped": self.skipped
+        }
+
+
+def read_rows(lines, fmt):
+    """
+    Yield the fields of every row of a CSV file with a header, or of a file
+    with a JSON object per line. Lines that are not valid JSON are yielded
+    as None.
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown format {}".format(fmt))
+
+    if fmt == 'csv':
+        yield from csv.DictReader(lines)
+        return
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+def _is_active(value):
+    if isinstance(value, str):
+        return value.strip().lower() not in ('false', 'no', '0')
+
+    return value is None or bool(value)
+
+
+def _check_field(row, model, field):
+    """
+    Whether a field of a row is missing or a string that fits its column.
+    """
+    value = row.get(field)
+
+    if value is None:
+        return True
+
+    max_length = model._meta.get_field(field).max_length
+
+    return isinstance(value, str) and (max_length is None or len(value) <= max_length)
+
+
+def _check(row):
+    if not isinstance(row, dict):
+        return None, "invalid row"
+
+    # JSON rows can hold any type, and values longer than their column
+    # would fail the whole chunk they are inserted with.
+    for (model, fields) in ((User, ('username', 'email', 'password')), (Profile, PROFILE_FIELDS)):
+        for field in fields:
+            if not _check_field(row, model, field):
+                return None, "invalid {}".format(field)
+
+    username = (row.get('username') or '').strip()
+    email = User.objects.normalize_email((row.get('email') or '').strip())
+
+    if re.match(r"^[0-9]*$", username) or len(username) < 4:
+        return None, "invalid username"
+
+    try:
+        validate_email(email)
+    except ValidationError:
+        return None, "invalid email"
+
+    return dict(
+        row,
+        username=username,
+        email=email,
+        is_active=_is_active(row.get('is_active'))
+    ), None
+
+
+def _hash_passwords(passwords, pool):
+    # Users without a password get an unusable one and have to reset it.
+    passwords = [password or None for password in passwords]
+
+    if pool is None:
+        return [make_password(password) for password in passwords]
+
+    return list(pool.map(make_password, passwords, chunksize=16))
+
+
+def _import_chunk(rows, report, pool):
+    usernames = {row['username'] for _, row in rows}
+    emails = {row['email'] for _, row in rows}
+
+    taken = set()
+    for username, email in User.objects.filter(
+        Q(username__in=usernames) | Q(email__in=emails)
+    ).values_list('username', 'email'):
+        taken.update((username, email))
+
+    new_rows = []
+    for number, row in rows:
+        if row['username'] in taken or row['email'] in taken:
+            report.skip(number, "already registered")
+            continue
+
+        taken.update((row['username'], row['email']))
+        new_rows.append((number, row))
+
+    passwords = _hash_passwords([row.get('password') for _, row in new_rows], pool)
+
+    users = [
+        (number, User(
+            username=row['username'],
+            email=row['email'],
+            password=password,
+            is_active=row['is_active']
+        ), row)
+        for (number, row), password in zip(new_rows, passwords)
+    ]
+
+    try:
+        _insert(users)
+    except IntegrityError:
+        # Somebody registered one of the users since they were looked up, so
+        # the users of the chunk are inserted one at a time instead.
+        for user in users:
+            try:
+                _insert([user])
+            except IntegrityError:
+                report.skip(user[0], "already registered")
+            else:
+                report.created += 1
+    else:
+        report.created += len(users)
+
+
+def _insert(users):
+    with transaction.atomic():
+        User.objects.bulk_create([user for _, user, _ in users])
+        Profile.objects.bulk_create([
+            Profile(user_id=user.id, **{
+                field: row[field] for field in PROFILE_FIELDS if row.get(field)
+            })
+            for _, user, row in users
+        ])
+
+
+def import_users(lines, fmt, chunk_size=1000, workers=None):
+    """
+    Create the users described by the rows of the given file, skipping the
+    invalid ones and the ones whose username or email is already taken.
+
+    Passwords are hashed by `workers` processes, or in this process when it
+    is 1. Every chunk is inserted in its own transaction.
+    """
+    report = ImportReport()
+    pool = ProcessPoolExecutor(workers) if workers != 1 else None
+
+    try:
+        chunk = []
+
+        for number, row in enumerate(read_rows(lines, fmt), start=1):
+            row, error = _check(row)
+
+            if error:
+                report.skip(number, error)
+                continue
+
+            chunk.append((number, row))
+
+            if len(chunk) == chunk_size:
+                _import_chunk(chunk, report, pool)
+                chunk = []
+
+        if chunk:
+            _import_chunk(chunk, report, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return report
+
+
+def run_pending_import(workers=None):
+    """
+    Import the oldest pending upload, and return it, or None when there are
+    none.
+
+    The upload is claimed with SKIP LOCKED, so that several workers can run
+    side by side without importing a file twice.
+    """
+    with transaction.atomic():
+        upload = UserImport.objects.select_for_update(skip_locked=True).filter(
+            status=UserImport.PENDING
+        ).order_by('id').first()
+
+        if upload is None:
+            return None
+
+        upload.status = UserImport.RUNNING
+        upload.save(update_fields=['status'])
+
+    try:
+        report = import_users(io.StringIO(upload.content), upload.format, workers=workers)
+    except Exception as error:
+        upload.status = UserImport.FAILED
+        upload.error = repr(error)
+    else:
+        upload.status = UserImport.DONE
+        upload.report = report.json()
+        upload.content = ''
+
+    upload.finished_at = timezone.now()
+    upload.save(update_fields=['status', 'report', 'error', 'content', 'finished_at'])
+
+    return upload
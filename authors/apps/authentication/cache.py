@@ -0,0 +1,72 @@
+"""
+Cache of the users that authenticated requests are made by.
+
+The rows of the users are kept in an LRU cache in the memory of each
+process, next to the version of the user they were loaded at. The versions
+live in the shared cache and are bumped whenever a user is saved or deleted
+(see the signal receivers in the user model), which covers password
+changes, deactivations and profile updates alike. Checking the version
+keeps every process from serving a stale user without any database query.
+
+A version bumped in a cache private to one process would not reach the
+others, so the users are only cached when `settings.SHARED_CACHE` is set.
+"""
+
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from authors.apps.core.lru import LRUCache
+
+_users = LRUCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TIMEOUT)
+
+
+def _version_key(username):
+    return 'user:{}:version'.format(username)
+
+
+def _current_version(username):
+    key = _version_key(username)
+    cache.add(key, uuid4().hex, None)
+
+    return cache.get(key)
+
+
+def get_user(username):
+    """
+    Return the user with the given username, from the cache when it holds
+    an up to date copy of it.
+
+    Raises `User.DoesNotExist` when there is no such user.
+    """
+    User = get_user_model()
+
+    if not settings.SHARED_CACHE:
+        return User.objects.get(username=username)
+
+    version = _current_version(username)
+    entry = _users.get(username)
+
+    if entry is not None and entry[0] == version:
+        field_names, values = entry[1]
+        return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+    user = User.objects.get(username=username)
+
+    field_names = [field.attname for field in User._meta.concrete_fields]
+    values = tuple(getattr(user, name) for name in field_names)
+    _users.set(username, (version, (field_names, values)))
+
+    return user
+
+
+def invalidate_user(username):
+    key = _version_key(username)
+    cache.set(key, uuid4().hex, None)
+
+    # A request may cache the user it read before the change is committed,
+    # so we bump the version again once it is visible to everyone.
+    transaction.on_commit(lambda: cache.set(key, uuid4().hex, None))
@@ -1,7 +1,15 @@
 from django.contrib.auth.models import (
     AbstractBaseUser, BaseUserManager, PermissionsMixin
 )
-from django.db import models
+from django.contrib.postgres.fields import JSONField
+from django.db import connections, models
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from authors.apps.core.mixins import TrackedFieldsMixin
+from authors.apps.core.trigram import create_trigram_index
+
+from .cache import invalidate_user
 
 
 class UserManager(BaseUserManager):
@@ -48,7 +56,7 @@ class UserManager(BaseUserManager):
         return user
 
 
-class User(AbstractBaseUser, PermissionsMixin):
+class User(TrackedFieldsMixin, AbstractBaseUser, PermissionsMixin):
     # Each `User` needs a human-readable unique identifier that we can use to
     # represent the `User` in the UI. We want to index this column in the
     # database to improve lookup performance.
@@ -90,6 +98,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     # objects of this type.
     objects = UserManager()
 
+    # The username is tracked so that the cached copy of a renamed user can
+    # be invalidated under its old name too.
+    tracked_fields = ('username',)
+
     def __str__(self):
         """
         Returns a string representation of this `User`.
@@ -125,3 +137,89 @@ class User(AbstractBaseUser, PermissionsMixin):
             "username": self.username,
             "email": self.email
         }
+
+
+class RevokedToken(models.Model):
+    """
+    A token that was given up before it expired, on logout or once a
+    password reset token has been used. It is only worth remembering until
+    the token expires.
+    """
+    jti = models.CharField(max_length=32, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.jti
+
+
+class UserImport(models.Model):
+    """
+    A file of users uploaded to be imported by the `run_user_imports`
+    worker, or the report of one that was. The file is dropped once it has
+    been imported.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    STATUSES = (
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    )
+
+    format = models.CharField(max_length=10)
+    content = models.TextField()
+    uploaded_by = models.ForeignKey(User, null=True, on_delete=models.SET_NULL)
+
+    status = models.CharField(max_length=10, choices=STATUSES, default=PENDING)
+    report = JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+    def __str__(self):
+        return "{} import {}".format(self.format, self.id)
+
+    def json(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "report": self.report,
+            "error": self.error
+        }
+
+
+@receiver(post_migrate)
+def create_username_trigram_index(sender, using, **kwargs):
+    """
+    index the usernames for fuzzy searches.
+    """
+    if sender.name == 'authors.apps.authentication':
+        create_trigram_index(connections[using], User, 'username')
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    drop the cached copies of a user whenever it changes, be it a password
+    change, a deactivation or an update of the account details.
+    """
+    usernames = {instance.username}
+
+    loaded_values = getattr(instance, '_loaded_values', None) or {}
+    if 'username' in loaded_values:
+        usernames.add(loaded_values['username'])
+
+    for username in usernames:
+        invalidate_user(username)
@@ -1,22 +1,16 @@
-import json
+from authors.apps.core.renderers import FastJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
+class UserJSONRenderer(FastJSONRenderer):
+    namespace = 'user'
 
-class UserJSONRenderer(JSONRenderer):
-    charset = 'utf-8'
-
-    def render(self, data, media_type=None, renderer_context=None):
+    def wrap(self, data, renderer_context=None):
         # If the view throws an error (such as the user can't be authenticated
         # or something similar), `data` will contain an `errors` key. We want
-        # the default JSONRenderer to handle rendering errors, so we need to
-        # check for this case.
-        errors = data.get('errors', None)
-
-        if errors is not None:
-            # As mentioned about, we will let the default JSONRenderer handle
-            # rendering errors.
-            return super(UserJSONRenderer, self).render(data)
+        # errors to be rendered as they are, so we need to check for this
+        # case.
+        if data.get('errors', None) is not None:
+            return data
 
         # Finally, we can render our data under the "user" namespace.
-        return json.dumps({'user': data})
+        return super().wrap(data, renderer_context)
@@ -0,0 +1,127 @@
+from unittest import mock
+
+import jwt
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.authentication.backends import Authentication
+from authors.apps.authentication.models import RevokedToken
+from authors.apps.authentication.verification import revoked
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.response import RESPONSE
+
+
+class TestLogout(TestUsingLoggedInUser):
+    """
+    test suite for revoking tokens on logout and for the cache of verified
+    tokens
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        # Every test revokes tokens, so it logs in again instead of using
+        # the tokens shared by the whole test case.
+        response = self.client.post(
+            reverse("user_login"),
+            {"user": {
+                "email": self.stored_user.email,
+                "password": self.stored_user.password
+            }},
+            content_type='application/json'
+        )
+
+        self.token = response.data['token']
+        self.refresh = response.data['refresh_token']
+
+    def get_user(self, token):
+        return self.client.get(
+            '/api/user/',
+            HTTP_AUTHORIZATION='Token {}'.format(token)
+        )
+
+    def logout(self, data=None):
+        return self.client.post(
+            reverse("user_logout"),
+            data or {},
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token {}'.format(self.token)
+        )
+
+    def test_logout_revokes_the_token(self):
+        self.assertEqual(self.get_user(self.token).status_code, status.HTTP_200_OK)
+
+        response = self.logout()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['message'], RESPONSE['token']['logout'])
+
+        response = self.get_user(self.token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], RESPONSE['token']['revoked'])
+
+    def test_logout_revokes_the_refresh_token(self):
+        self.logout({"refresh_token": self.refresh})
+
+        self.assertEqual(
+            self.get_user(self.refresh).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+        self.assertEqual(RevokedToken.objects.count(), 2)
+
+    def test_invalid_refresh_token(self):
+        self.logout({"refresh_token": self.refresh})
+
+        for refresh_token in ("garbage", self.refresh):
+            self.token = self.client.post(
+                reverse("user_login"),
+                {"user": {
+                    "email": self.stored_user.email,
+                    "password": self.stored_user.password
+                }},
+                content_type='application/json'
+            ).data['token']
+
+            response = self.logout({"refresh_token": refresh_token})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['message'], RESPONSE['token']['refresh']['invalid'])
+            self.assertEqual(self.get_user(self.token).status_code, status.HTTP_200_OK)
+
+    def test_other_sessions_are_kept(self):
+        self.logout()
+
+        self.assertEqual(
+            self.get_user(self.access_token).status_code,
+            status.HTTP_200_OK
+        )
+
+    def test_revocations_are_synced_from_the_database(self):
+        self.logout()
+        revoked.add('not-in-the-database')
+
+        revoked.sync()
+
+        self.assertIn(jwt.decode(self.token, verify=False)['jti'], revoked)
+        self.assertNotIn('not-in-the-database', revoked)
+
+    def test_verified_tokens_are_not_decoded_again(self):
+        Authentication.decode_jwt_token(self.token)
+
+        with mock.patch('authors.apps.authentication.verification.jwt.decode') as decode:
+            claims = Authentication.decode_jwt_token(self.token)
+
+        decode.assert_not_called()
+        self.assertEqual(claims['username'], self.stored_user.username)
+
+    def test_cached_tokens_still_expire(self):
+        claims = Authentication.decode_jwt_token(self.token)
+
+        with mock.patch(
+            'authors.apps.authentication.verification.time.time',
+            return_value=claims['exp'] + 1
+        ):
+            response = self.get_user(self.token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
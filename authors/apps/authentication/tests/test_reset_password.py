@@ -40,17 +40,20 @@ class TestResetPassword(TestConfiguration):
             data,
             content_type='application/json')
 
-    def edit_password(self, data):
+    def edit_password(self, data, link=None):
         return self.client.put(
-            test_token,
+            link or test_token,
             data,
             content_type='application/json')
 
-    def test_generate_reset_link(self):
+    def reset_link(self):
         response = self.submit_email(self.registered_user_email)
+        link = response.json()['user'].get('linker')
+        return link[:22] + 'api/' + link[22:]
+
+    def test_generate_reset_link(self):
         global test_token
-        test_token = response.json()['user'].get('linker')
-        test_token = test_token[:22] + 'api/' + test_token[22:]
+        test_token = self.reset_link()
 
     def test_user_enter_empty_field(self):
         response = self.edit_password(self.user_email[0])
@@ -95,7 +98,10 @@ class TestResetPassword(TestConfiguration):
             })
 
     def test_user_enter_correct_password(self):
-        response = self.edit_password(self.user_email[3])
+        # The link can only be used once, so the shared one is left to the
+        # other tests.
+        link = self.reset_link()
+        response = self.edit_password(self.user_email[3], link)
 
         self.assertEqual(
             response.status_code,
@@ -104,3 +110,7 @@ class TestResetPassword(TestConfiguration):
         self.assertEqual(
             response.json(),
             {'user': {'message': 'Your password was successfully changed'}})
+
+        self.assertEqual(
+            self.edit_password(self.user_email[3], link).status_code,
+            status.HTTP_401_UNAUTHORIZED)
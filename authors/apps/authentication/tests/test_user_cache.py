@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from authors.apps.authentication.backends import Authentication
+from authors.apps.core.lru import LRUCache
+from authors.base_test_config import TestUsingLoggedInUser
+
+
+@override_settings(SHARED_CACHE=True)
+class TestUserCache(TestUsingLoggedInUser):
+    """
+    test suite for resolving the users of authenticated requests from the
+    user cache
+    """
+
+    def authenticate(self):
+        user, _ = Authentication().authenticate_credentials(self.access_token)
+        return user
+
+    def test_repeated_authentication_is_query_free(self):
+        self.authenticate()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+
+        self.assertEqual(user.id, self.stored_users[0].id)
+        self.assertEqual(user.username, self.stored_users[0].username)
+
+    def test_password_change_invalidates_the_user(self):
+        self.authenticate()
+
+        user = self.stored_users[0]
+        user.set_password("An0ther.password")
+        user.save()
+
+        self.assertTrue(self.authenticate().check_password("An0ther.password"))
+
+    def test_deactivation_invalidates_the_user(self):
+        self.authenticate()
+
+        user = self.stored_users[0]
+        user.is_active = False
+        user.save()
+
+        self.assertFalse(self.authenticate().is_active)
+
+    def test_account_update_invalidates_the_user(self):
+        self.authenticate()
+
+        self.client.put(
+            '/api/user/',
+            {"user": {"email": "renamed@email.com"}},
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertEqual(self.authenticate().email, "renamed@email.com")
+
+    @override_settings(SHARED_CACHE=False)
+    def test_users_are_not_cached_in_a_private_cache(self):
+        self.authenticate()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate()
+
+        self.assertEqual(user.id, self.stored_users[0].id)
+
+
+class TestLRUCache(SimpleTestCase):
+    """
+    test suite for the in-process LRU cache
+    """
+
+    def test_least_recently_used_entries_are_evicted(self):
+        lru = LRUCache(maxsize=2)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+
+        self.assertEqual(len(lru), 2)
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIsNone(lru.get('b'))
+
+    def test_entries_expire(self):
+        lru = LRUCache(timeout=10)
+
+        with mock.patch('authors.apps.core.lru.time.monotonic', return_value=0):
+            lru.set('a', 1)
+
+        with mock.patch('authors.apps.core.lru.time.monotonic', return_value=11):
+            self.assertIsNone(lru.get('a'))
@@ -0,0 +1,195 @@
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.authentication import bulk
+from authors.apps.authentication.bulk import import_users, run_pending_import
+from authors.apps.authentication.models import User, UserImport
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.response import RESPONSE
+
+CSV = (
+    "username,email,password,bio\n"
+    "partner1,partner1@email.com,Partner.1,First partner\n"
+    "partner2,PARTNER2@EMAIL.COM,,\n"
+    "123,invalid@email.com,Partner.3,\n"
+    "partner4,not-an-email,Partner.4,\n"
+    "partner1,other@email.com,Partner.5,\n"
+)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class TestUserImport(TestUsingLoggedInUser):
+    """
+    test suite for importing users in bulk
+    """
+
+    def test_import_creates_users_and_profiles(self):
+        report = import_users(io.StringIO(CSV), 'csv', workers=1)
+
+        self.assertEqual(report.created, 2)
+        self.assertEqual(report.skipped, [
+            {"row": 3, "reason": "invalid username"},
+            {"row": 4, "reason": "invalid email"},
+            {"row": 5, "reason": "already registered"},
+        ])
+
+        partner = User.objects.get(username="partner1")
+        self.assertTrue(partner.check_password("Partner.1"))
+        self.assertEqual(partner.profile.bio, "First partner")
+
+        partner = User.objects.get(username="partner2")
+        self.assertEqual(partner.email, "PARTNER2@email.com")
+        self.assertFalse(partner.has_usable_password())
+
+    def test_import_is_batched(self):
+        lines = io.StringIO("".join(
+            '{{"username": "partner{0}", "email": "partner{0}@email.com"}}\n'.format(i)
+            for i in range(10)
+        ))
+
+        # A lookup of the taken names, the savepoint around the inserts and
+        # one insert of users and one of profiles per chunk.
+        with self.assertNumQueries(10):
+            report = import_users(lines, 'jsonl', chunk_size=5, workers=1)
+
+        self.assertEqual(report.created, 10)
+
+    def test_passwords_are_hashed_in_a_pool(self):
+        lines = io.StringIO(
+            '{"username": "pooled", "email": "pooled@email.com", "password": "Pool.ed1"}\n'
+            'not json\n'
+        )
+
+        report = import_users(lines, 'jsonl', workers=2)
+
+        self.assertEqual(report.skipped, [{"row": 2, "reason": "invalid row"}])
+        self.assertTrue(User.objects.get(username="pooled").check_password("Pool.ed1"))
+
+    def test_fields_must_be_strings_that_fit(self):
+        rows = [
+            {"username": 12345, "email": "typed@email.com"},
+            {"username": "a" * 300, "email": "long@email.com"},
+            {"username": "longphone", "email": "phone@email.com", "phone": "1" * 31},
+            {"username": "listbio", "email": "bio@email.com", "bio": ["not", "text"]},
+            {"username": "fitting", "email": "fitting@email.com", "phone": "1" * 30},
+        ]
+        lines = io.StringIO("".join(json.dumps(row) + "\n" for row in rows))
+
+        report = import_users(lines, 'jsonl', workers=1)
+
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.skipped, [
+            {"row": 1, "reason": "invalid username"},
+            {"row": 2, "reason": "invalid username"},
+            {"row": 3, "reason": "invalid phone"},
+            {"row": 4, "reason": "invalid bio"},
+        ])
+        self.assertEqual(User.objects.get(username="fitting").profile.phone, "1" * 30)
+
+    def test_existing_users_are_skipped(self):
+        user = self.stored_users[1]
+        lines = io.StringIO("username,email\n{},new@email.com\n".format(user.username))
+
+        report = import_users(lines, 'csv', workers=1)
+
+        self.assertEqual(report.created, 0)
+        self.assertEqual(report.skipped, [{"row": 1, "reason": "already registered"}])
+
+    def test_users_registered_during_the_import_are_skipped(self):
+        hash_passwords = bulk._hash_passwords
+
+        def register_meanwhile(passwords, pool):
+            User.objects.create_user("partner1", "meanwhile@email.com")
+            return hash_passwords(passwords, pool)
+
+        with mock.patch.object(bulk, '_hash_passwords', side_effect=register_meanwhile):
+            report = import_users(io.StringIO(CSV), 'csv', workers=1)
+
+        self.assertEqual(report.created, 1)
+        self.assertIn({"row": 1, "reason": "already registered"}, report.skipped)
+        self.assertTrue(User.objects.filter(username="partner2").exists())
+
+    def test_import_command(self):
+        handle = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False)
+        self.addCleanup(os.remove, handle.name)
+
+        with handle:
+            handle.write(CSV)
+
+        out = io.StringIO()
+
+        call_command('import_users', handle.name, workers=1, stdout=out)
+
+        self.assertIn("Created 2 users, skipped 3 rows", out.getvalue())
+
+    def test_import_api(self):
+        user = self.stored_users[0]
+        user.is_staff = True
+        user.save()
+
+        response = self.client.post(
+            reverse("user_import"),
+            {"file": SimpleUploadedFile("partners.csv", CSV.encode())},
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], UserImport.PENDING)
+        self.assertFalse(User.objects.filter(username="partner1").exists())
+
+        self.assertEqual(run_pending_import(workers=1).id, response.data['id'])
+        self.assertIsNone(run_pending_import(workers=1))
+
+        response = self.client.get(
+            reverse("user_import_status", kwargs={"pk": response.data['id']}),
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], UserImport.DONE)
+        self.assertEqual(response.data['report']['created'], 2)
+        self.assertEqual(UserImport.objects.get(id=response.data['id']).content, '')
+
+    def test_import_worker_command(self):
+        UserImport.objects.create(format='csv', content=CSV)
+        out = io.StringIO()
+
+        call_command('run_user_imports', workers=1, once=True, stdout=out)
+
+        self.assertIn("done", out.getvalue())
+        self.assertTrue(User.objects.filter(username="partner2").exists())
+
+    def test_import_api_needs_a_known_format(self):
+        user = self.stored_users[0]
+        user.is_staff = True
+        user.save()
+
+        response = self.client.post(
+            reverse("user_import"),
+            {"file": SimpleUploadedFile("partners.xls", CSV.encode())},
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['format'],
+            RESPONSE['invalid_field'].format("format")
+        )
+
+    def test_import_api_is_for_admins(self):
+        response = self.client.post(
+            reverse("user_import"),
+            {"file": SimpleUploadedFile("partners.csv", CSV.encode())},
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -3,7 +3,8 @@ from django.urls import path
 from .views import (
     LoginAPIView, RegistrationAPIView, UserRetrieveUpdateAPIView,
     RequestResetAPIView, ResetPasswordAPIView, ActivateAccountAPIView, SocialAuthView,
-    SocialAuthErrorView, SocialAuthNewUserView, RefreshTokenAPIView
+    SocialAuthErrorView, SocialAuthNewUserView, RefreshTokenAPIView, LogoutAPIView,
+    UserImportAPIView, UserImportStatusAPIView
 )
 
 
@@ -11,6 +12,9 @@ urlpatterns = [
     path('user/', UserRetrieveUpdateAPIView.as_view()),
     path('users/', RegistrationAPIView.as_view(), name="create_user"),
     path('users/login', LoginAPIView.as_view(), name="user_login"),
+    path('users/logout', LogoutAPIView.as_view(), name="user_logout"),
+    path('users/import', UserImportAPIView.as_view(), name="user_import"),
+    path('users/import/<int:pk>', UserImportStatusAPIView.as_view(), name="user_import_status"),
     path('token/refresh', RefreshTokenAPIView.as_view(), name="token_refresh"),
     path("resetrequest", RequestResetAPIView.as_view(), name="reset_request"),
     path("change_password/<str:token>",
@@ -0,0 +1,121 @@
+"""
+Verification of the JSON web tokens that requests are authenticated with.
+
+Checking the signature of a token and parsing its claims is done once per
+process and token: the claims are then kept in an LRU cache keyed by a
+digest of the token, and only their dates are checked again on later
+requests.
+
+Tokens carry a unique `jti` claim, so that they can be revoked before they
+expire. The revoked ones are loaded from the database into a set that each
+process refreshes every REVOKED_TOKENS_SYNC_INTERVAL seconds, instead of
+looking them up on every request.
+"""
+
+import hashlib
+import threading
+import time
+from datetime import datetime
+
+import jwt
+from django.conf import settings
+from django.utils import timezone
+
+from authors.apps.core.lru import LRUCache
+
+from .models import RevokedToken
+
+_claims = LRUCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_TIMEOUT)
+
+
+class RevokedTokenError(jwt.InvalidTokenError):
+    pass
+
+
+class RevocationList:
+    """
+    The ids of the revoked tokens that have not expired yet.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+
+        self._jtis = set()
+        self._synced_at = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        if self._synced_at is None or time.monotonic() - self._synced_at > self.interval:
+            self.sync()
+
+        return jti in self._jtis
+
+    def sync(self):
+        jtis = set(RevokedToken.objects.filter(
+            expires_at__gt=timezone.now()
+        ).values_list('jti', flat=True))
+
+        with self._lock:
+            self._jtis = jtis
+            self._synced_at = time.monotonic()
+
+    def add(self, jti):
+        with self._lock:
+            self._jtis = self._jtis | {jti}
+
+
+revoked = RevocationList(settings.REVOKED_TOKENS_SYNC_INTERVAL)
+
+
+def _digest(token):
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _check_dates(claims):
+    now = time.time()
+
+    if 'exp' in claims and claims['exp'] <= now:
+        raise jwt.ExpiredSignatureError('Signature has expired')
+
+    if 'nbf' in claims and claims['nbf'] > now:
+        raise jwt.ImmatureSignatureError('The token is not yet valid (nbf)')
+
+
+def verify_token(token, secret_key):
+    """
+    Return the claims of the given token, raising the errors of `jwt.decode`
+    when it is invalid or expired, and `RevokedTokenError` when it has been
+    revoked.
+    """
+    key = _digest(token)
+    claims = _claims.get(key)
+
+    if claims is None:
+        claims = jwt.decode(token, secret_key)
+        _claims.set(key, claims)
+    else:
+        _check_dates(claims)
+
+    if claims.get('jti') and claims['jti'] in revoked:
+        raise RevokedTokenError('The token has been revoked')
+
+    return dict(claims)
+
+
+def revoke_token(claims):
+    """
+    Revoke the token with the given claims, in this process right away and
+    in the others the next time they sync their revocation list.
+    """
+    jti = claims.get('jti')
+
+    # Tokens issued before they had an id can only expire.
+    if not jti:
+        return
+
+    expires_at = timezone.make_aware(
+        datetime.utcfromtimestamp(claims['exp']), timezone.utc)
+
+    RevokedToken.objects.get_or_create(jti=jti, defaults={'expires_at': expires_at})
+
+    revoked.add(jti)
@@ -1,26 +1,31 @@
 import os
 
+import jwt
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
-from rest_framework import status
+from rest_framework import exceptions, status
 from rest_framework.generics import (CreateAPIView, ListAPIView,
                                      RetrieveAPIView, RetrieveUpdateAPIView,
                                      UpdateAPIView)
-from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import (AllowAny, IsAdminUser, IsAuthenticated,
+                                        IsAuthenticatedOrReadOnly)
 from rest_framework.response import Response
 
 from ...settings import EMAIL_HOST_USER
+from authors.apps.outbox.mail import queue_mail
 from .backends import Authentication
-from .models import User
+from .bulk import FORMATS
+from .models import User, UserImport
 from .renderers import UserJSONRenderer
 from .serializers import (LoginSerializer, RegistrationSerializer,
                           ResetSerializer, UserSerializer)
 from .token import account_activation_token
+from .verification import revoke_token
 from authors.response import RESPONSE
 
 
@@ -69,7 +74,7 @@ class RegistrationAPIView(CreateAPIView):
         from_email = EMAIL_HOST_USER
         recipient = user.get('email')
         to_list = [recipient]
-        send_mail(subject, message, from_email, to_list)
+        queue_mail(subject, message, from_email, to_list)
         user_data = serializer.data
 
         response_message = {
@@ -121,6 +126,94 @@ class RefreshTokenAPIView(RetrieveAPIView):
         }, status=status.HTTP_200_OK)
 
 
+class UserImportAPIView(CreateAPIView):
+    permission_classes = (IsAdminUser,)
+    parser_classes = (MultiPartParser,)
+
+    def post(self, request):
+        """
+        Queue an uploaded CSV or JSON lines file of user accounts to be
+        created in bulk, whose format is given or guessed from the file name.
+        The import is run by the `run_user_imports` worker.
+        """
+        upload = request.FILES.get('file')
+
+        if upload is None:
+            return Response({
+                "errors": {"file": RESPONSE['no_field'].format("file")}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        fmt = request.data.get('format') or os.path.splitext(upload.name)[1].lstrip('.')
+
+        if fmt not in FORMATS:
+            return Response({
+                "errors": {"format": RESPONSE['invalid_field'].format("format")}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            content = upload.read().decode('utf-8')
+        except UnicodeDecodeError:
+            return Response({
+                "errors": {"file": RESPONSE['invalid_field'].format("file")}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        user_import = UserImport.objects.create(
+            format=fmt,
+            content=content,
+            uploaded_by=request.user
+        )
+
+        return Response(user_import.json(), status=status.HTTP_202_ACCEPTED)
+
+
+class UserImportStatusAPIView(RetrieveAPIView):
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, pk):
+        """
+        Tell how far an import is, and once it is done, the number of users
+        created and the rows that were skipped.
+        """
+        user_import = UserImport.objects.defer('content').filter(pk=pk).first()
+
+        if user_import is None:
+            return Response({
+                "errors": {"import": RESPONSE['not_found'].format(data="import")}
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(user_import.json(), status=status.HTTP_200_OK)
+
+
+class LogoutAPIView(CreateAPIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        """
+        Revoke the token the request is made with, and the refresh token of
+        the session when it is given too.
+        """
+        refresh_token = request.data.get('refresh_token')
+
+        if refresh_token:
+            # The refresh token is checked first, so a logout that is turned
+            # down leaves the session as it was.
+            try:
+                claims = Authentication.decode_jwt_token(refresh_token)
+            except (jwt.InvalidTokenError, exceptions.AuthenticationFailed):
+                return Response({
+                    "message": RESPONSE["token"]["refresh"]["invalid"]
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            if claims["username"] == request.user.username:
+                revoke_token(claims)
+
+        revoke_token(request.auth)
+
+        return Response({
+            "message": RESPONSE["token"]["logout"]
+        }, status=status.HTTP_200_OK)
+
+
 class UserRetrieveUpdateAPIView(RetrieveUpdateAPIView):
     permission_classes = (IsAuthenticated,)
     renderer_classes = (UserJSONRenderer,)
@@ -174,12 +267,12 @@ class RequestResetAPIView(CreateAPIView):
         from_email = EMAIL_HOST_USER
         to_list = [user_data['email']]
 
-        # Send the email
-        send_mail(
+        # Queue the email for the outbox worker to send
+        queue_mail(
             subject,
             message,
             from_email,
-            to_list, fail_silently=True
+            to_list
         )
 
         # Respond back to the user
@@ -215,6 +308,9 @@ class ResetPasswordAPIView(UpdateAPIView):
             }
         )
 
+        # The token can only be used to reset the password once
+        revoke_token(decoded)
+
         # Respond back to the user
         return Response(
             {"message": "Your password was successfully changed"},
@@ -1,6 +1,7 @@
 from django.db import models
 
 # local imports
+from authors.apps.articles.models import Article
 from authors.apps.authentication.models import User
 
 
@@ -9,5 +10,12 @@ class Bookmark(models.Model):
     Bookmarks model
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    slug = models.CharField(max_length=255)
+    article = models.ForeignKey(Article, related_name='bookmarks', on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (('user', 'article'),)
+        indexes = [
+            # The bookmarks of a user, most recent first.
+            models.Index(fields=['user', 'created_at', 'article'], name='bookmark_user_created_idx'),
+        ]
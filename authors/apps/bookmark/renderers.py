@@ -1,14 +1,9 @@
-import json
+from authors.apps.core.renderers import FastJSONRenderer
 
-from rest_framework.renderers import JSONRenderer
 
+class BookmarksJSONRenderer(FastJSONRenderer):
 
-class BookmarksJSONRenderer(JSONRenderer):
-    charset = 'utf-8'
-
-    def render(self, data, media_type=None, renderer_context=None):
-        # breakpoint()
-
-        if len(data) < 1:
-            return json.dumps({'message': "You have not bookmarked any article"})
-        return json.dumps({'bookmarks': data})
+    def wrap(self, data, renderer_context=None):
+        if data.get('results') == []:
+            return {'message': "You have not bookmarked any article"}
+        return {'bookmarks': data}
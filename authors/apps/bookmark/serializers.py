@@ -12,5 +12,5 @@ class BookmarkSerializer(serializers.ModelSerializer):
     class Meta:
         model = Bookmark
 
-        fields = ('user', 'slug')
+        fields = ('user', 'article')
         read_only = ('created_at',)
@@ -0,0 +1,113 @@
+import json
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.response import RESPONSE
+
+from ..models import Bookmark
+from ..views import BookmarkListAPIView
+
+
+class TestBookmarkList(TestUsingLoggedInUser):
+    """
+    test suite for the bookmarks keyed on their article
+    """
+
+    def bookmark(self, article):
+        return self.client.post(
+            reverse("bookmark", kwargs={"slug": article.slug}),
+            HTTP_AUTHORIZATION='Token ' + self.access_token
+        )
+
+    def get_bookmarks(self, **params):
+        return self.client.get(
+            reverse("all_bookmarks"), params,
+            HTTP_AUTHORIZATION='Token ' + self.access_token
+        )
+
+    def slugs(self, response):
+        return [article['slug'] for article in response.data['results']]
+
+    def test_bookmarks_are_listed_most_recent_first(self):
+        articles = self.stored_articles[20:25]
+
+        for article in articles:
+            self.bookmark(article)
+
+        response = self.get_bookmarks()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.slugs(response), [article.slug for article in reversed(articles)])
+        self.assertTrue(all(article['bookmarked'] for article in response.data['results']))
+
+    def test_bookmarks_are_paginated(self):
+        articles = self.stored_articles[20:25]
+
+        for article in articles:
+            self.bookmark(article)
+
+        with mock.patch.object(BookmarkListAPIView, 'page_size', 3):
+            first = self.get_bookmarks()
+            second = self.get_bookmarks(cursor=first.data['cursor']['next'])
+            back = self.get_bookmarks(cursor=second.data['cursor']['previous'])
+
+        self.assertEqual(self.slugs(first), [article.slug for article in articles[:1:-1]])
+        self.assertEqual(self.slugs(second), [article.slug for article in articles[1::-1]])
+        self.assertIsNone(second.data['cursor']['next'])
+        self.assertEqual(self.slugs(back), self.slugs(first))
+
+    def test_listing_does_not_grow_with_the_bookmarks(self):
+        for article in self.stored_articles[20:30]:
+            self.bookmark(article)
+
+        # The user is looked up, the bookmarked articles are read with one
+        # join, and what they are shown with is read in a query per kind for
+        # the whole page.
+        with self.assertNumQueries(8):
+            response = self.get_bookmarks()
+
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_bookmark_follows_a_renamed_article(self):
+        article = self.stored_articles[20]
+        self.bookmark(article)
+
+        Article.objects.filter(id=article.id).update(slug="renamed-article")
+
+        response = self.get_bookmarks()
+
+        self.assertEqual(self.slugs(response), ["renamed-article"])
+
+    def test_bookmarks_are_unique_per_article(self):
+        article = self.stored_articles[20]
+
+        first = self.bookmark(article)
+        second = self.bookmark(article)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(second.data['message'], RESPONSE['bookmark']['repeat_bookmarking'])
+        self.assertEqual(Bookmark.objects.filter(article=article).count(), 1)
+
+    def test_no_bookmarks(self):
+        response = self.get_bookmarks()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+        self.assertEqual(
+            json.loads(response.content.decode()),
+            {'message': "You have not bookmarked any article"}
+        )
+
+    def test_invalid_cursor(self):
+        response = self.get_bookmarks(cursor="not-a-cursor")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['errors']['cursor'],
+            RESPONSE['invalid_field'].format("cursor")
+        )
@@ -0,0 +1,91 @@
+import io
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from authors.base_test_config import TestConfiguration
+
+from ..models import Bookmark
+
+
+class TestRelinkBookmarks(TestConfiguration):
+    """
+    Test moving the bookmarks stored with the slug of their article onto the
+    article foreign key
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.table = Bookmark._meta.db_table
+
+        self.model_constraints = self.constraints()
+
+        # The slug column of the bookmarks is brought back inside the test
+        # transaction, and rolled back with it.
+        with connection.cursor() as cursor:
+            cursor.execute("ALTER TABLE {} DROP COLUMN article_id".format(self.table))
+            cursor.execute(
+                "ALTER TABLE {} ADD COLUMN slug varchar(255) NOT NULL DEFAULT ''".format(self.table)
+            )
+
+    def add_legacy_bookmark(self, user, slug, minutes_ago):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO {} (user_id, slug, created_at) VALUES (%s, %s, %s)".format(self.table),
+                [user.id, slug, timezone.now() - timezone.timedelta(minutes=minutes_ago)]
+            )
+
+    def columns(self):
+        with connection.cursor() as cursor:
+            return {
+                column.name for column in
+                connection.introspection.get_table_description(cursor, self.table)
+            }
+
+    def constraints(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, self.table).values()
+
+        # The generated names of the constraints are left out.
+        return sorted(
+            (constraint['columns'], constraint['unique'],
+             list(constraint['foreign_key'] or ()), constraint['index'])
+            for constraint in constraints
+        )
+
+    def test_bookmarks_are_relinked(self):
+        (reader, other) = self.stored_users
+        (first, second) = self.stored_articles[:2]
+
+        self.add_legacy_bookmark(reader, first.slug, 30)
+        self.add_legacy_bookmark(reader, first.slug, 10)
+        self.add_legacy_bookmark(reader, second.slug, 20)
+        self.add_legacy_bookmark(other, first.slug, 5)
+        self.add_legacy_bookmark(reader, "a-deleted-article", 1)
+
+        out = io.StringIO()
+        call_command('relink_bookmarks', stdout=out)
+
+        self.assertIn("Deleted 1 bookmarks of deleted articles and 1 duplicates", out.getvalue())
+        self.assertNotIn('slug', self.columns())
+        self.assertEqual(
+            list(Bookmark.objects.filter(user=reader).order_by('created_at').values_list(
+                'article_id', flat=True
+            )),
+            [first.id, second.id]
+        )
+        self.assertTrue(Bookmark.objects.filter(user=other, article=first).exists())
+
+        # The article column is left as the model would have created it.
+        self.assertEqual(self.constraints(), self.model_constraints)
+
+    def test_dry_run(self):
+        self.add_legacy_bookmark(self.stored_users[0], "a-deleted-article", 1)
+
+        out = io.StringIO()
+        call_command('relink_bookmarks', dry_run=True, stdout=out)
+
+        self.assertIn("Found 1 bookmarks of deleted articles and 0 duplicates", out.getvalue())
+        self.assertIn('slug', self.columns())
+        self.assertNotIn('article_id', self.columns())
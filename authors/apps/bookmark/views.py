@@ -1,13 +1,16 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from rest_framework import status
 from rest_framework.generics import (
     CreateAPIView,
-    DestroyAPIView,
-    ListAPIView
+    DestroyAPIView
 )
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from authors.apps.articles.models import Article
+from authors.apps.articles.pagination import InvalidCursor, KeysetPaginator
 from authors.apps.articles.serializers import GetArticlesSerializer
 from authors.apps.bookmark.models import Bookmark
 from authors.apps.bookmark.renderers import BookmarksJSONRenderer
@@ -36,18 +39,17 @@ class BookmarkArticleCreateDestroyAPIView(CreateAPIView, DestroyAPIView):
         if isinstance(to_bookmark, Response):
             return to_bookmark
 
-        bookmarked = Bookmark.objects.filter(user=self.request.user.id, slug=slug).exists()
-        if bookmarked is True:
+        # The unique (user, article) constraint tells whether the article
+        # was already bookmarked, even by a concurrent request.
+        try:
+            with transaction.atomic():
+                Bookmark.objects.create(user=request.user, article=to_bookmark)
+        except IntegrityError:
             return Response(
                 {"message": RESPONSE['bookmark']['repeat_bookmarking']},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        data = {"user": request.user.id, "slug": slug}
-        serializer = self.serializer_class(data=data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-
         message = {"message": RESPONSE['bookmark']['bookmarked'].format(data=slug)}
 
         return Response(message, status=status.HTTP_200_OK)
@@ -64,36 +66,59 @@ class BookmarkArticleCreateDestroyAPIView(CreateAPIView, DestroyAPIView):
         if isinstance(to_unbookmark, Response):
             return to_unbookmark
 
-        bookmarked = Bookmark.objects.filter(user=self.request.user.id, slug=slug).exists()
-        if bookmarked is False:
+        deleted, _ = Bookmark.objects.filter(user=request.user, article=to_unbookmark).delete()
+
+        if not deleted:
             message = {"message": RESPONSE['bookmark']['repeat_unbookmarking']}
             return Response(
                 message,
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        instance = Bookmark.objects.filter(user=self.request.user.id, slug=slug)
-        self.perform_destroy(instance)
-
         message = {"message": RESPONSE['bookmark']['unbookmarked'].format(data=slug)}
 
         return Response(message, status=status.HTTP_204_NO_CONTENT)
 
 
-class BookmarkListAPIView(ListAPIView):
+class BookmarkListAPIView(APIView):
+    """
+    list the articles the user bookmarked, most recently bookmarked first
+    """
     permission_classes = (IsAuthenticated,)
-    serializer_class = GetArticlesSerializer
     renderer_classes = (BookmarksJSONRenderer,)
+    page_size = 10
+
+    def get(self, request):
+        # The bookmarked articles are joined to the bookmarks of the user and
+        # paged on when they were bookmarked, most recent first.
+        articles = Article.objects.filter(
+            bookmarks__user=request.user
+        ).annotate(bookmarked_at=F('bookmarks__created_at'))
+
+        try:
+            page = KeysetPaginator(
+                'bookmarked_at', page_size=self.page_size, descending=True
+            ).paginate(articles, request.query_params.get('cursor'))
+        except InvalidCursor:
+            return Response(
+                {
+                    "errors": {
+                        "cursor": RESPONSE['invalid_field'].format("cursor")
+                    }
+                }, status.HTTP_400_BAD_REQUEST
+            )
 
-    def get_queryset(self):
-        article_to_bookmark = Bookmark.objects.filter(user_id=self.request.user.pk)
-
-        if not article_to_bookmark:
-            return []
-
-        slugs = Bookmark.objects.filter(user_id=self.request.user.id).values_list('slug', flat=True)
-        articles = Article.objects.filter(slug__in=slugs)
-        return articles
+        serializer = GetArticlesSerializer(page.items, many=True, context={'request': request})
+
+        return Response(
+            {
+                "results": serializer.data,
+                "cursor": {
+                    "next": page.next,
+                    "previous": page.previous
+                }
+            }, status.HTTP_200_OK
+        )
 
 
 def check_article(slug):
@@ -0,0 +1,171 @@
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authors.apps.articles.models import Article, Comment
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+from authors.apps.rating.models import RateArticle
+
+
+class ChangeLogEntryManager(models.Manager):
+
+    def feed(self, after=0):
+        """
+        The entries after the one with the id `after`, in the order of
+        (txid, id).
+
+        Ids are handed out when a row is inserted, not when it is committed,
+        so a consumer reading by id could skip an entry that commits after
+        entries with higher ids were read. Instead only the entries of
+        transactions below the xmin of the current snapshot are returned:
+        all of those have ended, and every transaction still running, or yet
+        to start, has a txid at or above it, so it sorts after anything read
+        now. A long running transaction holds the feed back until it ends.
+        """
+        queryset = self.order_by('txid', 'id')
+
+        if after:
+            position = self.filter(id=after).values_list('txid', flat=True).first()
+
+            if position is not None:
+                queryset = queryset.filter(
+                    models.Q(txid__gt=position) | models.Q(txid=position, id__gt=after)
+                )
+
+        finished = models.Q(
+            txid__lt=RawSQL("txid_snapshot_xmin(txid_current_snapshot())", [])
+        )
+
+        # A reader inside a transaction also sees the changes made in it.
+        if connection.in_atomic_block:
+            finished |= models.Q(txid=RawSQL("txid_current()", []))
+
+        return queryset.filter(finished)
+
+
+class ChangeLogEntry(models.Model):
+    """
+    A change made to an article or to something about it. The entries are
+    only ever appended, and consumers of the change feed read them in the
+    order of the transactions that made them (see `ChangeLogEntry.objects.feed`).
+    """
+    ARTICLE = 'article'
+    COMMENT = 'comment'
+    VOTE = 'vote'
+    RATING = 'rating'
+    FAVORITE = 'favorite'
+
+    KINDS = (
+        (ARTICLE, 'Article'),
+        (COMMENT, 'Comment'),
+        (VOTE, 'Vote'),
+        (RATING, 'Rating'),
+        (FAVORITE, 'Favorite'),
+    )
+
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+
+    ACTIONS = (
+        (CREATED, 'Created'),
+        (UPDATED, 'Updated'),
+        (DELETED, 'Deleted'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    # Id of the transaction the change was made in, from `txid_current()`.
+    txid = models.BigIntegerField()
+    kind = models.CharField(max_length=10, choices=KINDS)
+    action = models.CharField(max_length=10, choices=ACTIONS)
+    object_id = models.BigIntegerField()
+    article_id = models.BigIntegerField(null=True)
+    user_id = models.BigIntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = ChangeLogEntryManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['txid', 'id']),
+        ]
+
+    def __str__(self):
+        return "{} {} {}".format(self.kind, self.object_id, self.action)
+
+
+def record_change(kind, action, object_id, article_id=None, user_id=None):
+    """
+    Append a change to the log. Code that changes the logged models without
+    sending their signals, with raw SQL or a queryset update, calls this
+    itself.
+
+    The entry is stamped with the id of the current transaction, which is
+    what the feed is ordered by, so writers never wait on each other.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT txid_current()")
+        (txid,) = cursor.fetchone()
+
+    return ChangeLogEntry.objects.create(
+        txid=txid,
+        kind=kind,
+        action=action,
+        object_id=object_id,
+        article_id=article_id,
+        user_id=user_id
+    )
+
+
+def _action(kwargs):
+    if 'created' not in kwargs:
+        return ChangeLogEntry.DELETED
+
+    return ChangeLogEntry.CREATED if kwargs['created'] else ChangeLogEntry.UPDATED
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def log_article_change(sender, instance, **kwargs):
+    record_change(
+        ChangeLogEntry.ARTICLE, _action(kwargs), instance.id,
+        article_id=instance.id, user_id=instance.author_id
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def log_comment_change(sender, instance, **kwargs):
+    record_change(
+        ChangeLogEntry.COMMENT, _action(kwargs), instance.id,
+        article_id=instance.article_id, user_id=instance.user_id
+    )
+
+
+@receiver(post_save, sender=ArticleLikeDislike)
+@receiver(post_delete, sender=ArticleLikeDislike)
+def log_vote_change(sender, instance, **kwargs):
+    record_change(
+        ChangeLogEntry.VOTE, _action(kwargs), instance.id,
+        article_id=instance.object_id, user_id=instance.user_id
+    )
+
+
+@receiver(post_save, sender=RateArticle)
+@receiver(post_delete, sender=RateArticle)
+def log_rating_change(sender, instance, **kwargs):
+    record_change(
+        ChangeLogEntry.RATING, _action(kwargs), instance.id,
+        article_id=instance.article_id, user_id=instance.user_id
+    )
+
+
+@receiver(post_save, sender=FavouriteArticle)
+@receiver(post_delete, sender=FavouriteArticle)
+def log_favorite_change(sender, instance, **kwargs):
+    record_change(
+        ChangeLogEntry.FAVORITE, _action(kwargs), instance.id,
+        article_id=instance.article_id, user_id=instance.user_id
+    )
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from .models import ChangeLogEntry
+
+
+class ChangeLogEntrySerializer(serializers.ModelSerializer):
+    sequence = serializers.IntegerField(source='id')
+
+    class Meta:
+        model = ChangeLogEntry
+        fields = ('sequence', 'kind', 'action', 'object_id', 'article_id', 'user_id', 'created_at')
@@ -0,0 +1,125 @@
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.changefeed.models import ChangeLogEntry, record_change
+from authors.apps.rating.models import RateArticle
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.response import RESPONSE
+
+
+class TestChangeFeed(TestUsingLoggedInUser):
+    """
+    test suite for the change feed of articles, comments and votes
+    """
+
+    def get_changes(self, **params):
+        return self.client.get(
+            reverse("change_feed"),
+            params,
+            HTTP_AUTHORIZATION='Token {}'.format(self.access_token)
+        )
+
+    def latest(self):
+        return ChangeLogEntry.objects.order_by('id').last()
+
+    def changes_since(self, entry):
+        return [
+            (change.kind, change.action)
+            for change in ChangeLogEntry.objects.filter(id__gt=entry.id).order_by('id')
+        ]
+
+    def test_article_changes_are_logged(self):
+        start = self.latest()
+        article = self.stored_articles[1]
+
+        article.title = "A new title"
+        article.save()
+        article_id = article.id
+        article.delete()
+
+        self.assertEqual(self.changes_since(start), [
+            (ChangeLogEntry.ARTICLE, ChangeLogEntry.UPDATED),
+            (ChangeLogEntry.ARTICLE, ChangeLogEntry.DELETED),
+        ])
+        self.assertEqual(self.latest().article_id, article_id)
+
+    def test_comments_votes_ratings_and_favorites_are_logged(self):
+        start = self.latest()
+        slug = self.stored_articles[2].slug
+        auth = 'Token {}'.format(self.access_token)
+
+        self.client.post(
+            '/api/articles/{}/comments'.format(slug),
+            {"text": "A comment", "parent": 0},
+            content_type='application/json',
+            HTTP_AUTHORIZATION=auth
+        )
+        self.client.post('/api/articles/{}/like/'.format(slug), HTTP_AUTHORIZATION=auth)
+        self.client.post('/api/article/{}/favorite'.format(slug), HTTP_AUTHORIZATION=auth)
+        RateArticle.objects.create(
+            article=self.stored_articles[2], user=self.stored_users[1], user_rating=4
+        )
+
+        self.assertEqual(self.changes_since(start), [
+            (ChangeLogEntry.COMMENT, ChangeLogEntry.CREATED),
+            (ChangeLogEntry.VOTE, ChangeLogEntry.CREATED),
+            (ChangeLogEntry.FAVORITE, ChangeLogEntry.CREATED),
+            (ChangeLogEntry.RATING, ChangeLogEntry.CREATED),
+        ])
+
+        for entry in ChangeLogEntry.objects.filter(id__gt=start.id):
+            self.assertEqual(entry.article_id, self.stored_articles[2].id)
+
+    def test_changes_are_read_in_batches(self):
+        start = self.latest().id
+
+        for i in range(5):
+            record_change(ChangeLogEntry.ARTICLE, ChangeLogEntry.UPDATED, i)
+
+        response = self.get_changes(after=start, limit=3)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([change['object_id'] for change in response.data['changes']], [0, 1, 2])
+        self.assertTrue(response.data['has_more'])
+
+        response = self.get_changes(after=response.data['last'], limit=3)
+
+        self.assertEqual([change['object_id'] for change in response.data['changes']], [3, 4])
+        self.assertFalse(response.data['has_more'])
+
+        response = self.get_changes(after=response.data['last'])
+
+        self.assertEqual(response.data['changes'], [])
+        self.assertEqual(response.data['last'], self.latest().id)
+
+    def test_changes_are_read_in_transaction_order(self):
+        # An entry inserted first, by a transaction that committed last.
+        late = ChangeLogEntry.objects.create(
+            txid=2, kind=ChangeLogEntry.ARTICLE, action=ChangeLogEntry.UPDATED, object_id=1
+        )
+        early = ChangeLogEntry.objects.create(
+            txid=1, kind=ChangeLogEntry.ARTICLE, action=ChangeLogEntry.UPDATED, object_id=2
+        )
+
+        self.assertEqual(list(ChangeLogEntry.objects.feed()[:2]), [early, late])
+        self.assertEqual(ChangeLogEntry.objects.feed(early.id).first(), late)
+
+    def test_invalid_parameters(self):
+        for params, field in (
+            ({"after": "abc"}, "after"),
+            ({"after": -1}, "after"),
+            ({"limit": 0}, "limit"),
+            ({"limit": 1001}, "limit"),
+        ):
+            response = self.get_changes(**params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(
+                response.data['errors'][field],
+                RESPONSE['invalid_field'].format(field)
+            )
+
+    def test_feed_needs_authentication(self):
+        response = self.client.get(reverse("change_feed"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import ChangeFeedView
+
+urlpatterns = [
+    path("changes", ChangeFeedView.as_view(), name="change_feed"),
+]
@@ -0,0 +1,53 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from authors.response import RESPONSE
+
+from .models import ChangeLogEntry
+from .serializers import ChangeLogEntrySerializer
+
+
+class ChangeFeedView(APIView):
+    """
+    the changes made after a given sequence, oldest first
+    """
+    permission_classes = (IsAuthenticated,)
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 1000
+
+    def get(self, request):
+        try:
+            after = int(request.query_params.get('after', 0))
+            limit = int(request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            after = limit = -1
+
+        if after < 0:
+            return self.invalid("after")
+
+        if not 0 < limit <= self.MAX_LIMIT:
+            return self.invalid("limit")
+
+        # One more entry than asked for tells whether there are more.
+        entries = list(ChangeLogEntry.objects.feed(after)[:limit + 1])
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        return Response({
+            "changes": ChangeLogEntrySerializer(entries, many=True).data,
+            "last": entries[-1].id if entries else after,
+            "has_more": has_more
+        }, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def invalid(param):
+        return Response(
+            {
+                "errors": {
+                    param: RESPONSE['invalid_field'].format(param)
+                }
+            }, status.HTTP_400_BAD_REQUEST
+        )
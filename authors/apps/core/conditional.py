@@ -0,0 +1,58 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+class Validators:
+    """
+    The ETag and Last-Modified validators of a response, used to answer
+    conditional GET requests with a 304 before building the response body.
+
+    The ETag is a hash of whatever the body depends on, so views only need
+    to gather a few cheap values (timestamps, counts, versions) instead of
+    the data itself.
+    """
+
+    def __init__(self, *parts, last_modified=None):
+        digest = hashlib.sha1(repr(parts + (last_modified,)).encode()).hexdigest()
+
+        self.etag = quote_etag(digest)
+        self.last_modified = last_modified
+
+    def timestamp(self):
+        if self.last_modified is None:
+            return None
+        return int(self.last_modified.timestamp())
+
+    def not_modified(self, request):
+        """
+        Return a 304 response when the client already has the current
+        version of the response, and None otherwise.
+        """
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=self.timestamp()
+        )
+
+        return self.apply(response) if response is not None else None
+
+    def apply(self, response):
+        """
+        Set the validators on the response so the client can send them back.
+        """
+        response['ETag'] = self.etag
+
+        if self.last_modified is not None:
+            response['Last-Modified'] = http_date(self.timestamp())
+
+        return response
+
+
+def latest(*timestamps):
+    """
+    Return the most recent of the given timestamps, ignoring missing ones.
+    """
+    timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+    return max(timestamps) if timestamps else None
@@ -0,0 +1,110 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from faker.providers.lorem.en_US import Provider
+
+from authors.apps.articles.models import Article
+from authors.factory import UserFactory
+
+
+class Command(BaseCommand):
+    help = 'Benchmark full text article search against the ILIKE search'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count', type=int, default=100000,
+            help='Number of articles to search through'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Number of times each search is run'
+        )
+        parser.add_argument(
+            '--term', default='dragon',
+            help='Word searched for, it is planted in one article out of 500'
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        term = options['term']
+        words = Provider.word_list
+        rng = random.Random(0)
+
+        def text(length):
+            return ' '.join(rng.choice(words) for _ in range(length))
+
+        author = UserFactory()
+
+        try:
+            started = time.perf_counter()
+
+            for start in range(0, count, 5000):
+                articles = []
+
+                for number in range(start, min(start + 5000, count)):
+                    body = text(300)
+
+                    if number % 500 == 0:
+                        body += ' ' + term
+
+                    articles.append(Article(
+                        slug='bench-search-{}'.format(number),
+                        title=text(5)[:50],
+                        description=text(20),
+                        body=body,
+                        author=author
+                    ))
+
+                with transaction.atomic():
+                    created = Article.objects.bulk_create(articles)
+                    Article.objects.filter(
+                        id__in=[article.id for article in created]
+                    ).update_search_vector()
+
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE {}'.format(Article._meta.db_table))
+
+            self.stdout.write("Created {} articles in {:.1f}s".format(
+                count, time.perf_counter() - started))
+
+            # The same queries as the SearchFilter of the search view, plus
+            # the body which it cannot search at all today.
+            ilike = Article.objects.filter(
+                Q(title__icontains=term) |
+                Q(author__username__icontains=term) |
+                Q(body__icontains=term)
+            ).order_by('-id')
+            full_text = Article.objects.search(term)
+
+            for name, queryset in (('ILIKE', ilike), ('Full text', full_text)):
+                timings = []
+
+                for _ in range(options['repeat']):
+                    timed = time.perf_counter()
+                    total = queryset.count()
+                    list(queryset[:10])
+                    timings.append(time.perf_counter() - timed)
+
+                self.stdout.write(
+                    "{}: {} matches, first page in {:.2f}ms median "
+                    "({:.2f}ms best)".format(
+                        name, total,
+                        1000 * statistics.median(timings),
+                        1000 * min(timings)
+                    )
+                )
+
+                with connection.cursor() as cursor:
+                    sql, params = queryset[:10].query.sql_with_params()
+                    cursor.execute('EXPLAIN ' + sql, params)
+                    plan = [row[0] for row in cursor.fetchall()]
+
+                self.stdout.write("  " + "\n  ".join(plan[:6]))
+        finally:
+            with transaction.atomic():
+                Article.objects.filter(author=author).delete()
+                author.delete()
@@ -0,0 +1,52 @@
+import json
+import timeit
+from itertools import cycle, islice
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.serializers import GetArticlesSerializer
+from authors.apps.core.renderers import ENCODERS
+
+
+class Command(BaseCommand):
+    help = 'Benchmark encoding a page of articles with the available JSON encoders'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-size', type=int, default=100,
+            help='Number of articles on the page'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=200,
+            help='Number of times each encoder encodes the page'
+        )
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        articles = GetArticlesSerializer(
+            Article.objects.order_by('-id')[:page_size], many=True
+        ).data
+
+        if not articles:
+            raise CommandError("There are no articles, create some with setup_test_data")
+
+        # Small databases have their articles repeated to fill the page.
+        results = list(islice(cycle(articles), page_size))
+        page = {'articles': {'count': len(results), 'results': results}}
+
+        encoders = [
+            ('json.dumps', lambda data: json.dumps(data).encode('utf-8')),
+            ('JSONRenderer', JSONRenderer().render),
+        ] + [
+            ('FastJSONRenderer ({})'.format(name), encode)
+            for name, encode in sorted(ENCODERS.items())
+        ]
+
+        for name, encode in encoders:
+            size = len(encode(page))
+            elapsed = timeit.timeit(lambda: encode(page), number=options['repeat'])
+
+            self.stdout.write("{:<30} {:8.3f}ms per page, {} bytes".format(
+                name, 1000 * elapsed / options['repeat'], size))
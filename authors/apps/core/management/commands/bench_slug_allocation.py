@@ -0,0 +1,81 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.template.defaultfilters import slugify
+
+from authors.apps.articles.models import Article, SlugCounter
+from authors.factory import UserFactory
+
+
+class Command(BaseCommand):
+    help = 'Benchmark creating many articles that share the same title'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count', type=int, default=10000,
+            help='Number of same-titled articles to create'
+        )
+        parser.add_argument(
+            '--title', default='How to train your dragon',
+            help='Title shared by all the articles'
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+
+        timings = []
+        queries = []
+        executed = []
+
+        def count_query(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        # Every article is saved in its own transaction like it would be by
+        # the API, so we clean up everything we created once we are done.
+        author = UserFactory()
+
+        try:
+            started = time.perf_counter()
+
+            for _ in range(count):
+                article = Article(
+                    title=options['title'],
+                    description="Benchmark article",
+                    body="Benchmark article",
+                    author=author
+                )
+
+                del executed[:]
+
+                with connection.execute_wrapper(count_query):
+                    saved = time.perf_counter()
+                    article.save()
+                    timings.append(time.perf_counter() - saved)
+
+                queries.append(len(executed))
+
+            elapsed = time.perf_counter() - started
+            last_slug = article.slug
+        finally:
+            with transaction.atomic():
+                Article.objects.filter(author=author).delete()
+                SlugCounter.objects.filter(base=slugify(options['title'])).delete()
+                author.delete()
+
+        window = max(1, min(100, count // 10))
+
+        self.stdout.write("Created {} articles in {:.2f}s ({:.0f} per second)".format(
+            count, elapsed, count / elapsed))
+        self.stdout.write("Last slug: {}".format(last_slug))
+        self.stdout.write("First {} saves: {:.2f}ms and {:.1f} queries on average".format(
+            window,
+            1000 * sum(timings[:window]) / window,
+            sum(queries[:window]) / window
+        ))
+        self.stdout.write("Last {} saves: {:.2f}ms and {:.1f} queries on average".format(
+            window,
+            1000 * sum(timings[-window:]) / window,
+            sum(queries[-window:]) / window
+        ))
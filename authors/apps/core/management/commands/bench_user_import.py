@@ -0,0 +1,83 @@
+import io
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from authors.apps.authentication.bulk import import_users
+from authors.apps.authentication.models import User
+
+
+class Command(BaseCommand):
+    help = 'Benchmark importing users in bulk against creating them one by one'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count', type=int, default=2000,
+            help='Number of users to import'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count(),
+            help='Number of processes hashing the passwords'
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        prefix = 'bench-import-{}-'.format(int(time.time()))
+
+        def rows(start, stop):
+            return io.StringIO("".join(
+                json.dumps({
+                    "username": "{}{}".format(prefix, i),
+                    "email": "{}{}@example.com".format(prefix, i),
+                    "password": "Benchmark.{}".format(i)
+                }) + "\n"
+                for i in range(start, stop)
+            ))
+
+        executed = []
+
+        def count_query(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        # The one by one baseline is slow, so it only creates a sample of
+        # the users and its throughput is extrapolated.
+        sample = max(1, count // 20)
+
+        try:
+            with connection.execute_wrapper(count_query):
+                started = time.perf_counter()
+                for i in range(sample):
+                    User.objects.create_user(
+                        "{}single-{}".format(prefix, i),
+                        "{}single-{}@example.com".format(prefix, i),
+                        "Benchmark.{}".format(i)
+                    )
+                single = time.perf_counter() - started
+                single_queries = len(executed)
+
+                results = []
+                for workers in sorted({1, options['workers']}):
+                    del executed[:]
+                    offset = len(results) * count
+
+                    started = time.perf_counter()
+                    report = import_users(
+                        rows(offset, offset + count), 'jsonl', workers=workers)
+                    results.append((
+                        workers, report.created, time.perf_counter() - started, len(executed)))
+        finally:
+            with transaction.atomic():
+                User.objects.filter(username__startswith=prefix).delete()
+
+        self.stdout.write("create_user: {} users in {:.2f}s ({:.0f} per second, {:.1f} queries each)".format(
+            sample, single, sample / single, single_queries / sample))
+
+        for workers, created, elapsed, queries in results:
+            self.stdout.write(
+                "import_users with {} workers: {} users in {:.2f}s "
+                "({:.0f} per second, {} queries)".format(
+                    workers, created, elapsed, created / elapsed, queries))
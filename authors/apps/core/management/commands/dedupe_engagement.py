@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from authors.apps.articles.models import Article, ArticleStats
+from authors.apps.articles.stats import rebuild_stats
+from authors.apps.favorite.models import FavouriteArticle
+from authors.apps.likedislike.models import ArticleLikeDislike
+from authors.apps.rating.models import RateArticle
+from authors.apps.read_stats.models import UserReadStat
+
+# The tables that only allow one row per key, with the columns of the key,
+# the order in which the rows of a key are ranked to keep the first one,
+# and the column of the article they are about.
+UNIQUE_ROWS = (
+    (ArticleLikeDislike, ('content_type_id', 'object_id', 'user_id'), 'id DESC', 'object_id'),
+    (RateArticle, ('article_id', 'user_id'), 'id DESC', 'article_id'),
+    (FavouriteArticle, ('user_id', 'article_id'), 'id', 'article_id'),
+    (UserReadStat, ('user_id', 'article_id'), 'read DESC, "createdAt", id', 'article_id'),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete the duplicate votes, ratings, favorites and read stats that predate their '
+        'unique constraints, run before the migrations adding these and followed '
+        'by rebuild_article_stats when they also create the counters'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report how many duplicates there are'
+        )
+
+    def handle(self, *args, **options):
+        article_ids = set()
+
+        with transaction.atomic():
+            for (model, key, order, article_column) in UNIQUE_ROWS:
+                deleted = self.dedupe(model, key, order, article_column)
+                article_ids.update(deleted)
+
+                self.stdout.write("{} duplicate {} rows".format(
+                    len(deleted), model._meta.db_table
+                ))
+
+            # The duplicates were counted by the engagement counters, unless
+            # this runs before the migrations creating them, which leaves
+            # counting them to `rebuild_article_stats` once they have run.
+            article_ids = sorted(
+                Article.objects.filter(id__in=article_ids).values_list('id', flat=True)
+            )
+            stats_exist = ArticleStats._meta.db_table in connection.introspection.table_names()
+
+            if stats_exist:
+                rebuild_stats(article_ids)
+
+            if options['dry_run']:
+                transaction.set_rollback(True)
+
+        if not stats_exist:
+            self.stdout.write(
+                "The article counters do not exist yet, run rebuild_article_stats "
+                "after migrating"
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            "Duplicates of {} articles {}".format(
+                len(article_ids), "found" if options['dry_run'] else "deleted"
+            )
+        ))
+
+    @staticmethod
+    def dedupe(model, key, order, article_column):
+        """
+        Delete all but the first row of each key, returning the articles of
+        the deleted rows.
+        """
+        table = model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM {table} WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, row_number() OVER (
+                            PARTITION BY {key} ORDER BY {order}
+                        ) AS rank
+                        FROM {table}
+                    ) AS ranked
+                    WHERE rank > 1
+                )
+                RETURNING {article_column}
+                """.format(
+                    table=table,
+                    key=', '.join(key),
+                    order=order,
+                    article_column=article_column
+                )
+            )
+            return [article_id for (article_id,) in cursor.fetchall()]
@@ -0,0 +1,51 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authors.apps.authentication.bulk import FORMATS, import_users
+
+
+class Command(BaseCommand):
+    help = 'Create user accounts in bulk from a CSV or JSON lines file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='File with a username, email and optionally password, '
+                 'is_active and profile fields for every user'
+        )
+        parser.add_argument(
+            '--format', choices=FORMATS,
+            help='Format of the file, guessed from its extension by default'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Number of users to create per transaction'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Number of processes hashing the passwords, one per CPU by default'
+        )
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or os.path.splitext(options['path'])[1].lstrip('.')
+
+        if fmt not in FORMATS:
+            raise CommandError("Cannot tell the format of {}, use --format".format(
+                options['path']))
+
+        with open(options['path'], newline='', encoding='utf-8') as lines:
+            report = import_users(
+                lines,
+                fmt,
+                chunk_size=options['chunk_size'],
+                workers=options['workers']
+            )
+
+        for skipped in report.skipped:
+            self.stdout.write("Skipped row {row}: {reason}".format(**skipped))
+
+        self.stdout.write(self.style.SUCCESS(
+            "Created {} users, skipped {} rows".format(
+                report.created, len(report.skipped))
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from authors.apps.authentication.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = 'Delete the revoked tokens that have expired since'
+
+    def handle(self, *args, **options):
+        deleted, _ = RevokedToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            "Deleted {} expired revoked tokens".format(deleted)
+        ))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the article engagement counters from the source tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='Number of articles to reconcile per transaction'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report the articles whose counters are missing or wrong'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        article_ids = list(
+            Article.objects.order_by('id').values_list('id', flat=True)
+        )
+
+        missing = []
+        drifted = []
+
+        for start in range(0, len(article_ids), chunk_size):
+            chunk_missing, chunk_drifted = rebuild_stats(
+                article_ids[start:start + chunk_size],
+                dry_run=options['dry_run']
+            )
+            missing += chunk_missing
+            drifted += chunk_drifted
+
+        for article_id in drifted:
+            self.stdout.write("Counters of article {} drifted".format(article_id))
+
+        self.stdout.write(self.style.SUCCESS(
+            "Checked {} articles: {} missing and {} drifted counters {}".format(
+                len(article_ids),
+                len(missing),
+                len(drifted),
+                "found" if options['dry_run'] else "fixed"
+            )
+        ))
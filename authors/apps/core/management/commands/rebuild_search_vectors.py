@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    help = 'Recompute the full text search vectors of the articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Number of articles to update per query'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        article_ids = list(
+            Article.objects.order_by('id').values_list('id', flat=True)
+        )
+
+        for start in range(0, len(article_ids), chunk_size):
+            Article.objects.filter(
+                id__in=article_ids[start:start + chunk_size]
+            ).update_search_vector()
+
+        self.stdout.write(self.style.SUCCESS(
+            "Updated the search vectors of {} articles".format(len(article_ids))
+        ))
@@ -0,0 +1,110 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from authors.apps.articles.models import Article
+from authors.apps.bookmark.models import Bookmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Move the bookmarks stored with the slug of their article onto the '
+        'article foreign key, dropping the ones of deleted articles and the '
+        'duplicates. Run it in place of the migration replacing the slug, '
+        'which is then recorded with `migrate bookmark --fake`'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report what would become of the bookmarks'
+        )
+
+    def handle(self, *args, **options):
+        table = Bookmark._meta.db_table
+
+        with connection.cursor() as cursor:
+            columns = {
+                column.name for column in
+                connection.introspection.get_table_description(cursor, table)
+            }
+
+        if 'slug' not in columns:
+            self.stdout.write("Bookmarks are already keyed on their article")
+            return
+
+        with transaction.atomic():
+            unmatched, duplicates = self.relink(table)
+            self.add_constraints()
+
+            if options['dry_run']:
+                transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(
+            "{} {} bookmarks of deleted articles and {} duplicates".format(
+                "Found" if options['dry_run'] else "Deleted", unmatched, duplicates
+            )
+        ))
+
+    @staticmethod
+    def relink(table):
+        """
+        Point the bookmarks at the article with their slug, delete the ones
+        no article has anymore and keep the first bookmark of each article
+        by a user. Returns how many rows of both kinds were deleted.
+        """
+        with connection.cursor() as cursor:
+            # The table cannot be altered while checks of its deferred
+            # foreign keys are pending.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute("ALTER TABLE {} ADD COLUMN article_id integer".format(table))
+
+            cursor.execute(
+                """
+                UPDATE {table} AS bookmark SET article_id = article.id
+                FROM {articles} AS article
+                WHERE article.slug = bookmark.slug
+                """.format(table=table, articles=Article._meta.db_table)
+            )
+
+            cursor.execute("DELETE FROM {} WHERE article_id IS NULL".format(table))
+            unmatched = cursor.rowcount
+
+            cursor.execute(
+                """
+                DELETE FROM {table} WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, row_number() OVER (
+                            PARTITION BY user_id, article_id ORDER BY created_at, id
+                        ) AS rank
+                        FROM {table}
+                    ) AS ranked
+                    WHERE rank > 1
+                )
+                """.format(table=table)
+            )
+            duplicates = cursor.rowcount
+
+            cursor.execute("ALTER TABLE {} DROP COLUMN slug".format(table))
+
+        return unmatched, duplicates
+
+    @staticmethod
+    def add_constraints():
+        """
+        Give the article column the constraints and indexes of the model,
+        as its migration would.
+        """
+        article = Bookmark._meta.get_field('article')
+
+        with connection.schema_editor() as editor:
+            editor.execute("ALTER TABLE {} ALTER COLUMN article_id SET NOT NULL".format(
+                Bookmark._meta.db_table
+            ))
+            editor.execute(editor._create_index_sql(Bookmark, [article]))
+            editor.execute(editor._create_fk_sql(
+                Bookmark, article, "_fk_%(to_table)s_%(to_column)s"
+            ))
+            editor.alter_unique_together(Bookmark, [], Bookmark._meta.unique_together)
+
+            for index in Bookmark._meta.indexes:
+                editor.add_index(Bookmark, index)
@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from authors.apps.authentication.bulk import run_pending_import
+
+
+class Command(BaseCommand):
+    help = 'Import the user files uploaded through the API'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=settings.USER_IMPORT_WORKERS,
+            help='Number of processes hashing the passwords, one per CPU by default'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5,
+            help='Seconds to wait before polling for uploads again'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Stop once there are no pending uploads left'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            user_import = run_pending_import(options['workers'])
+
+            if user_import is not None:
+                self.stdout.write("Import {} {}".format(user_import.id, user_import.status))
+                continue
+
+            if options['once']:
+                break
+
+            time.sleep(options['interval'])
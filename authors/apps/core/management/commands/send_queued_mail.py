@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from authors.apps.outbox.mail import deliver_pending
+
+
+class Command(BaseCommand):
+    help = 'Deliver the emails waiting in the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=50,
+            help='Number of emails to send over one connection'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=5,
+            help='Seconds to wait before polling an empty outbox again'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Stop once the outbox has no due emails left'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = deliver_pending(options['batch_size'])
+
+            if sent or failed:
+                self.stdout.write("Sent {} emails, {} failed".format(sent, failed))
+                continue
+
+            if options['once']:
+                break
+
+            time.sleep(options['interval'])
@@ -0,0 +1,55 @@
+class TrackedFieldsMixin:
+    """
+    Model mixin that remembers the values an instance was loaded from the
+    database with, so that `save` or signal handlers can tell which fields
+    have actually been changed since.
+
+    Set `tracked_fields` to the names of the fields to keep an eye on, all
+    the concrete fields of the model are tracked by default.
+    """
+    tracked_fields = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        loaded_values = dict(zip(field_names, values))
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            field.attname: loaded_values[field.attname]
+            for field in cls._tracked()
+            if field.attname in loaded_values
+        }
+
+        return instance
+
+    @classmethod
+    def _tracked(cls):
+        return [
+            field for field in cls._meta.concrete_fields
+            if cls.tracked_fields is None or field.name in cls.tracked_fields
+        ]
+
+    def changed_fields(self):
+        """
+        Return the names of the tracked fields that differ from the values
+        the instance was loaded or last saved with. Every tracked field is
+        considered changed on instances that have never been saved.
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+
+        if loaded_values is None:
+            return {field.name for field in self._tracked()}
+
+        return {
+            field.name for field in self._tracked()
+            if field.attname in loaded_values and
+            getattr(self, field.attname) != loaded_values[field.attname]
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._tracked()
+            if field.attname in self.__dict__
+        }
@@ -0,0 +1,70 @@
+"""
+The JSON encoding shared by the renderers of the API.
+
+Responses are encoded straight to UTF-8 bytes, with orjson when it is
+installed and with the standard library otherwise. Both encode the same
+values: the types JSON has no notion of (datetimes, decimals, UUIDs, lazy
+translations...) are converted by Django REST framework's encoder, like the
+default renderer does.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Escaping non ASCII characters keeps the standard library on its fastest,
+# C only, code path.
+_encoder = JSONEncoder(ensure_ascii=True, separators=(',', ':'))
+
+
+def _default(obj):
+    return _encoder.default(obj)
+
+
+def _dumps_stdlib(data):
+    return _encoder.encode(data).encode('ascii')
+
+
+def _dumps_orjson(data):
+    # Datetimes are left to the default encoder so that they are formatted
+    # the same whichever backend is used.
+    return orjson.dumps(
+        data,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+ENCODERS = {'stdlib': _dumps_stdlib}
+
+if orjson is not None:
+    ENCODERS['orjson'] = _dumps_orjson
+
+dumps = _dumps_orjson if orjson is not None else _dumps_stdlib
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Base class of the renderers of the API.
+
+    Subclasses only say how the data is wrapped by overriding `wrap`, or by
+    setting `namespace` to the key the data is rendered under.
+    """
+    charset = 'utf-8'
+    namespace = None
+
+    def wrap(self, data, renderer_context=None):
+        if self.namespace is None:
+            return data
+
+        return {self.namespace: data}
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return dumps(self.wrap(data, renderer_context))
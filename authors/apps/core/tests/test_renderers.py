@@ -0,0 +1,60 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+
+from authors.apps.articles.renderers import ArticlesJSONRenderer
+from authors.apps.authentication.renderers import UserJSONRenderer
+from authors.apps.core.renderers import ENCODERS
+
+
+class TestRenderers(SimpleTestCase):
+    """
+    test suite for the JSON renderers of the API
+    """
+
+    value = {
+        "when": datetime.datetime(2018, 11, 30, 10, 15, 30, 123456, tzinfo=timezone.utc),
+        "day": datetime.date(2018, 11, 30),
+        "price": decimal.Decimal("4.50"),
+        "id": uuid.UUID(int=1),
+        "message": gettext_lazy("Not found."),
+        "name": "Gaël",
+        "tags": ("one", "two"),
+        1: "integer key",
+    }
+
+    def test_encoders_agree(self):
+        decoded = [json.loads(encode(self.value).decode()) for encode in ENCODERS.values()]
+
+        self.assertEqual(decoded[0], {
+            "when": "2018-11-30T10:15:30.123456Z",
+            "day": "2018-11-30",
+            "price": 4.5,
+            "id": "00000000-0000-0000-0000-000000000001",
+            "message": "Not found.",
+            "name": "Gaël",
+            "tags": ["one", "two"],
+            "1": "integer key",
+        })
+
+        for other in decoded[1:]:
+            self.assertEqual(other, decoded[0])
+
+    def test_renderers_render_bytes(self):
+        rendered = UserJSONRenderer().render({"username": "gael"})
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered.decode()), {"user": {"username": "gael"}})
+
+    def test_errors_are_not_wrapped(self):
+        rendered = UserJSONRenderer().render({"errors": {"email": ["Required"]}})
+
+        self.assertEqual(json.loads(rendered.decode()), {"errors": {"email": ["Required"]}})
+
+    def test_empty_responses(self):
+        self.assertEqual(ArticlesJSONRenderer().render(None), b'')
@@ -0,0 +1,78 @@
+import warnings
+
+
+TRIGRAM_EXTENSION = 'pg_trgm'
+
+# The aliases of the databases the extension is known to be installed in.
+_installed = set()
+
+
+def trigram_available(connection):
+    """
+    Return whether the Postgres server can provide trigram matching.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = %s",
+            [TRIGRAM_EXTENSION]
+        )
+        return cursor.fetchone() is not None
+
+
+def trigram_installed(connection):
+    """
+    Return whether the trigram extension is installed in the database, which
+    the fuzzy searches need. Once it is, the answer is remembered.
+    """
+    if connection.alias in _installed:
+        return True
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [TRIGRAM_EXTENSION])
+        installed = cursor.fetchone() is not None
+
+    if installed:
+        _installed.add(connection.alias)
+
+    return installed
+
+
+def create_trigram_index(connection, model, field_name):
+    """
+    Create a GIN trigram index on a text column, so that similarity lookups
+    on it do not have to scan the whole table.
+
+    Django cannot declare indexes with an operator class yet, so this is run
+    after the migrations instead. It does nothing when the index exists.
+    """
+    if not trigram_available(connection):
+        warnings.warn(
+            "The {} extension is not available, {}.{} will not get a trigram "
+            "index".format(TRIGRAM_EXTENSION, model.__name__, field_name)
+        )
+        return
+
+    column = model._meta.get_field(field_name).column
+    table = model._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS {}".format(TRIGRAM_EXTENSION))
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS {index} ON {table} "
+            "USING gin ({column} gin_trgm_ops)".format(
+                index=connection.ops.quote_name('{}_{}_trgm'.format(table, column)),
+                table=connection.ops.quote_name(table),
+                column=connection.ops.quote_name(column)
+            )
+        )
+
+
+def set_similarity_threshold(connection, threshold):
+    """
+    Set the similarity above which the trigram `%` operator, and so the
+    `trigram_similar` lookup, considers two strings to match until the end of
+    the current transaction, so that it never outlives the query it was set
+    for on a reused connection. Outside of a transaction it has no effect.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL pg_trgm.similarity_threshold = %s", [threshold])
@@ -15,6 +15,9 @@ class FavouriteArticle(models.Model):
     article = models.ForeignKey(Article, related_name='favorited', on_delete=models.CASCADE)
     updated_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        unique_together = (('user', 'article'),)
+
     def __str__(self):
         """
         return a human readable string
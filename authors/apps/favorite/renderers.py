@@ -1,14 +1,8 @@
-import json
+from authors.apps.core.renderers import FastJSONRenderer
 
-from ..authentication.renderers import UserJSONRenderer
 
-
-class FavoriteJSONRenderer(UserJSONRenderer):
-
-    def render(self, data, media_type=None, renderer_context=None):
-        """
-        overide UserJSONRenderer to render our data under the "favorited" namespace.
-        """
-        return json.dumps({
-            'favorited': data
-        })
+class FavoriteJSONRenderer(FastJSONRenderer):
+    """
+    render our data under the "favorited" namespace.
+    """
+    namespace = 'favorited'
@@ -14,6 +14,9 @@ class FavoritedSerializers(serializers.ModelSerializer):
     class Meta:
         model = FavouriteArticle
         fields = ('user', 'article',)
+        # Favoriting twice is told by the unique constraint of the table,
+        # which unlike a lookup also catches concurrent requests.
+        validators = []
 
     def create(self, validated_data):
         """
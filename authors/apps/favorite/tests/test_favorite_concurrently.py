@@ -0,0 +1,63 @@
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import ArticleStats
+from authors.factory import ArticleFactory, UserFactory
+
+from ..models import FavouriteArticle
+
+
+class TestFavoriteConcurrently(TransactionTestCase):
+    """
+    Test concurrent favorites of the same article by the same user, which
+    each need their own connection and so committed data to work with.
+    """
+
+    def setUp(self):
+        self.article = ArticleFactory()
+        self.user = UserFactory()
+
+    def in_parallel(self, method, count):
+        barrier = threading.Barrier(count)
+        statuses = []
+
+        def request():
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+
+            try:
+                barrier.wait()
+                response = getattr(client, method)(
+                    '/api/article/{}/favorite'.format(self.article.slug)
+                )
+                statuses.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=request) for _ in range(count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return sorted(statuses)
+
+    def favorite_count(self):
+        return ArticleStats.objects.get(article=self.article).favorite_count
+
+    def test_parallel_favorites_count_once(self):
+        self.assertEqual(self.in_parallel('post', 4), [200, 400, 400, 400])
+        self.assertEqual(FavouriteArticle.objects.filter(article=self.article).count(), 1)
+        self.assertEqual(self.favorite_count(), 1)
+
+    def test_parallel_unfavorites_count_once(self):
+        FavouriteArticle.objects.create(user=self.user, article=self.article)
+        ArticleStats.objects.filter(article=self.article).update(favorite_count=1)
+
+        self.assertEqual(self.in_parallel('delete', 4), [204, 400, 400, 400])
+        self.assertEqual(self.favorite_count(), 0)
@@ -1,3 +1,4 @@
+from django.db import IntegrityError, transaction
 from rest_framework.generics import CreateAPIView, DestroyAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -7,6 +8,7 @@ from rest_framework import status
 from .serializers import FavoritedSerializers
 from .renderers import FavoriteJSONRenderer
 from ..articles.models import Article
+from ..articles.stats import bump_stats
 from .models import FavouriteArticle
 from authors.response import RESPONSE
 
@@ -31,21 +33,23 @@ class FavoriteView(CreateAPIView, DestroyAPIView):
         if isinstance(article, Response):
             return article
 
-        # check if user has favourite an article
-        # If user has favourited the article raise a flag
-        # otherwise favourite the article
-        favorite = FavouriteArticle.objects.filter(user=self.request.user.id, article=article.id).exists()
-        if favorite:
+        data = {"user": request.user.id, "article": article.id}
+        serializer = self.serializer_class(data=data)
+        serializer.is_valid(raise_exception=True)
+
+        # The unique (user, article) constraint tells whether the article
+        # was already favorited, even by a concurrent request, so the
+        # counter is only bumped for a row that was really inserted.
+        try:
+            with transaction.atomic():
+                serializer.save()
+                bump_stats(article.id, favorite_count=1)
+        except IntegrityError:
             return Response(
                 {"message": RESPONSE['favorite']['favorited_twice']},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        data = {"user": request.user.id, "article": article.id}
-        serializer = self.serializer_class(data=data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-
         message = {"message": RESPONSE['favorite']['favorited']}
 
         return Response(message, status=status.HTTP_200_OK)
@@ -62,19 +66,20 @@ class FavoriteView(CreateAPIView, DestroyAPIView):
         if isinstance(article, Response):
             return article
 
-        # check if user has unfavourite an article
-        # If a user tries to favorite an article raise a flag
-        # otherwise a user con unfavourite the article
-        favorite = FavouriteArticle.objects.filter(user=self.request.user.id, article=article.id).exists()
-        if not favorite:
+        # The counter is bumped by what was really deleted, which is nothing
+        # for the loser of two concurrent unfavorites.
+        with transaction.atomic():
+            deleted, _ = FavouriteArticle.objects.filter(
+                user=request.user.id, article=article.id
+            ).delete()
+            bump_stats(article.id, favorite_count=-deleted)
+
+        if not deleted:
             return Response(
                 {"message": RESPONSE['favorite']['unfavorited_twice']},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        instance = FavouriteArticle.objects.filter(user=request.user.id, article=article.id)
-        self.perform_destroy(instance)
-
         message = {"message": RESPONSE['favorite']['unfavorited']}
 
         return Response(message, status=status.HTTP_204_NO_CONTENT)
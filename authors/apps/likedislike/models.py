@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import connection, models
 from django.db.models import Sum
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -6,6 +6,34 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from authors.apps.authentication.models import User
 
 
+# Toggle a vote in one statement. `previous` locks and reads the vote the
+# user cast before, which is removed when it is the same as the new one,
+# and otherwise flipped. A new vote is inserted.
+TOGGLE_VOTE = """
+    WITH previous AS (
+        SELECT id, vote FROM {votes}
+        WHERE content_type_id = %(content_type_id)s
+            AND object_id = %(object_id)s AND user_id = %(user_id)s
+        FOR UPDATE
+    ), removed AS (
+        DELETE FROM {votes}
+        WHERE id IN (SELECT id FROM previous WHERE vote = %(vote)s)
+        RETURNING id
+    ), voted AS (
+        INSERT INTO {votes} AS vote_row (vote, user_id, content_type_id, object_id)
+        SELECT %(vote)s, %(user_id)s, %(content_type_id)s, %(object_id)s
+        WHERE NOT EXISTS (SELECT 1 FROM previous WHERE vote = %(vote)s)
+        ON CONFLICT (content_type_id, object_id, user_id) DO UPDATE
+            SET vote = EXCLUDED.vote
+            WHERE EXISTS (SELECT 1 FROM previous)
+        RETURNING vote_row.id
+    )
+    SELECT
+        (SELECT vote FROM previous),
+        COALESCE((SELECT id FROM voted), (SELECT id FROM removed))
+"""
+
+
 class ArticleLikeDislikeManager(models.Manager):
     """
     Manager class for article like and dislike
@@ -31,6 +59,33 @@ class ArticleLikeDislikeManager(models.Manager):
         """
         return self.get_queryset().aggregate(Sum('vote')).get('vote__sum') or 0
 
+    def toggle(self, content_type, object_id, user_id, vote):
+        """
+        Cast a vote on an object, flip the vote the user cast before if it
+        was the other one, or remove it if it was the same.
+
+        This is a single statement, which returns the previous vote, or
+        None, and the id of the vote row it wrote. Since it bypasses the
+        signals of the model, callers do what their receivers would.
+        """
+        params = {
+            "content_type_id": content_type.id,
+            "object_id": object_id,
+            "user_id": user_id,
+            "vote": vote
+        }
+
+        with connection.cursor() as cursor:
+            while True:
+                cursor.execute(TOGGLE_VOTE.format(votes=self.model._meta.db_table), params)
+                (previous_vote, vote_id) = cursor.fetchone()
+
+                # Nothing was written when the user's vote was cast by a
+                # concurrent request after the statement started, we then
+                # toggle it again now that it is visible.
+                if vote_id is not None:
+                    return (previous_vote, vote_id)
+
 
 class ArticleLikeDislike(models.Model):
     """
@@ -56,6 +111,18 @@ class ArticleLikeDislike(models.Model):
 
     objects = ArticleLikeDislikeManager()
 
+    class Meta:
+        # The unique index serves the lookups of the votes on an article,
+        # and the second one those of the votes of a reader, which it covers
+        # so that they are answered from the index alone.
+        unique_together = (('content_type', 'object_id', 'user'),)
+        indexes = [
+            models.Index(
+                fields=['user', 'content_type', 'object_id', 'vote', 'id'],
+                name='likedislike_user_votes_idx'
+            ),
+        ]
+
     def __str__(self):
         """
         Return a readable representation of class objects
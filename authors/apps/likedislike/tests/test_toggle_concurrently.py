@@ -0,0 +1,116 @@
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import ArticleStats
+from authors.apps.articles.stats import compute_stats
+from authors.factory import ArticleFactory, UserFactory
+
+from ..models import ArticleLikeDislike
+
+
+class TestToggleConcurrently(TransactionTestCase):
+    """
+    Test concurrent togglers of the votes of an article, which each need
+    their own connection and so committed data to work with.
+    """
+
+    def setUp(self):
+        self.article = ArticleFactory()
+        self.voters = UserFactory.create_batch(6)
+
+    def post_in_parallel(self, posts):
+        barrier = threading.Barrier(len(posts))
+        responses = []
+
+        def post(user, path, data):
+            client = APIClient()
+            client.force_authenticate(user=user)
+
+            try:
+                barrier.wait()
+                responses.append(client.post(path, data, format='json'))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=post, args=args) for args in posts]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([response.status_code for response in responses], [201] * len(posts))
+
+        return responses
+
+    def vote_in_parallel(self, votes):
+        return self.post_in_parallel([
+            (user, '/api/articles/{}/{}/'.format(self.article.slug, kind), None)
+            for (user, kind) in votes
+        ])
+
+    def assertCountersMatchVotes(self):
+        stats = ArticleStats.objects.get(article=self.article)
+        expected = compute_stats([self.article.id])[self.article.id]
+
+        self.assertEqual(
+            (stats.like_count, stats.dislike_count),
+            (expected['like_count'], expected['dislike_count'])
+        )
+
+        return stats
+
+    def test_parallel_voters(self):
+        responses = self.vote_in_parallel(
+            [(voter, 'like') for voter in self.voters[:4]] +
+            [(voter, 'dislike') for voter in self.voters[4:]]
+        )
+
+        stats = self.assertCountersMatchVotes()
+
+        self.assertEqual((stats.like_count, stats.dislike_count), (4, 2))
+        self.assertIn(
+            (4, 2, 2),
+            [
+                (response.data['total_likes'], response.data['total_dislikes'],
+                 response.data['total_votes'])
+                for response in responses
+            ]
+        )
+
+    def test_voting_while_commenting(self):
+        comment = {"text": "A comment", "parent": 0}
+        path = '/api/articles/{}/comments'.format(self.article.slug)
+
+        self.post_in_parallel([
+            post
+            for voter in self.voters
+            for post in (
+                (voter, '/api/articles/{}/like/'.format(self.article.slug), None),
+                (voter, path, comment),
+            )
+        ])
+
+        stats = self.assertCountersMatchVotes()
+
+        self.assertEqual((stats.like_count, stats.comment_count), (6, 6))
+
+    def test_double_clicks(self):
+        voter = self.voters[0]
+
+        self.vote_in_parallel([(voter, 'like')] * 4)
+
+        self.assertFalse(ArticleLikeDislike.objects.filter(user=voter).exists())
+        self.assertCountersMatchVotes()
+
+    def test_flipping_concurrently(self):
+        voter = self.voters[0]
+
+        self.vote_in_parallel([(voter, 'like'), (voter, 'dislike')] * 3)
+
+        self.assertLessEqual(ArticleLikeDislike.objects.filter(user=voter).count(), 1)
+        self.assertCountersMatchVotes()
@@ -0,0 +1,165 @@
+import io
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.batch import ArticleBatch
+from authors.apps.articles.conditional import viewer_signature
+from authors.apps.articles.models import Article, ArticleStats
+from authors.apps.rating.models import RateArticle
+from authors.apps.read_stats.models import UserReadStat
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.factory import ArticleFactory, UserFactory
+
+from ..models import ArticleLikeDislike
+
+
+class TestVoteIndexes(TransactionTestCase):
+    """
+    Test the lookups of the votes of a reader are answered from an index
+    alone. This needs VACUUM, which cannot run in a transaction.
+    """
+
+    def setUp(self):
+        self.readers = UserFactory.create_batch(4)
+        self.articles = ArticleFactory.create_batch(10)
+
+        for (index, reader) in enumerate(self.readers):
+            for article in self.articles[index:]:
+                article.votes.create(user=reader, vote=(-1) ** index)
+
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE {}".format(ArticleLikeDislike._meta.db_table))
+
+    def vote_queries(self, queries):
+        return [
+            query['sql'] for query in queries
+            if ArticleLikeDislike._meta.db_table in query['sql']
+        ]
+
+    def plan(self, sql):
+        # The tables are far too small for the planner to prefer an index
+        # over reading them whole.
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("SET enable_bitmapscan = off")
+
+            try:
+                cursor.execute("EXPLAIN " + sql)
+                return "\n".join(line for (line,) in cursor.fetchall())
+            finally:
+                cursor.execute("RESET enable_seqscan")
+                cursor.execute("RESET enable_bitmapscan")
+
+    def test_viewer_votes_are_index_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            ArticleBatch(self.articles, user=self.readers[1], viewer_only=True)
+
+        [sql] = self.vote_queries(queries)
+
+        self.assertIn("Index Only Scan using likedislike_user_votes_idx", self.plan(sql))
+
+    def test_viewer_signature_is_index_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            viewer_signature(self.readers[2])
+
+        [sql] = self.vote_queries(queries)
+
+        self.assertIn("Index Only Scan using likedislike_user_votes_idx", self.plan(sql))
+
+    def test_votes_on_an_article_use_the_unique_index(self):
+        sql = str(ArticleLikeDislike.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id=self.articles[5].id,
+            user_id=self.readers[0].id
+        ).values('id').query)
+
+        self.assertIn("Index", self.plan(sql))
+        self.assertNotIn("Seq Scan", self.plan(sql))
+
+
+class TestDedupeEngagement(TestUsingLoggedInUser):
+    """
+    Test deleting the duplicates that predate the unique constraints
+    """
+
+    def drop_unique_constraint(self, model):
+        # Dropping the constraint is rolled back with the test transaction.
+        table = model._meta.db_table
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+            for (name, constraint) in constraints.items():
+                if constraint['unique'] and not constraint['primary_key'] and \
+                        len(constraint['columns']) > 1:
+                    cursor.execute("ALTER TABLE {} DROP CONSTRAINT {}".format(table, name))
+
+    def test_duplicates_are_deleted(self):
+        for model in (ArticleLikeDislike, RateArticle, UserReadStat):
+            self.drop_unique_constraint(model)
+
+        article = self.stored_articles[8]
+        reader = self.stored_users[1]
+
+        article.votes.create(user=reader, vote=1)
+        kept_vote = article.votes.create(user=reader, vote=-1)
+        RateArticle.objects.create(article=article, user=reader, user_rating=2)
+        RateArticle.objects.create(article=article, user=reader, user_rating=4)
+        UserReadStat.objects.create(article=article, user=reader)
+        kept_read = UserReadStat.objects.create(article=article, user=reader, read=True)
+
+        out = io.StringIO()
+        call_command('dedupe_engagement', stdout=out)
+
+        self.assertEqual(list(article.votes.filter(user=reader)), [kept_vote])
+        self.assertEqual(
+            list(RateArticle.objects.filter(article=article).values_list('user_rating', flat=True)),
+            [4]
+        )
+        self.assertEqual(list(UserReadStat.objects.filter(article=article)), [kept_read])
+        self.assertIn("Duplicates of 1 articles deleted", out.getvalue())
+
+        stats = ArticleStats.objects.get(article=article)
+        self.assertEqual(
+            (stats.like_count, stats.dislike_count, stats.rating_count, stats.read_count),
+            (0, 1, 1, 1)
+        )
+
+    def test_dry_run(self):
+        self.drop_unique_constraint(RateArticle)
+        article = self.stored_articles[9]
+
+        for rate in (1, 2):
+            RateArticle.objects.create(article=article, user=self.stored_users[1], user_rating=rate)
+
+        out = io.StringIO()
+        call_command('dedupe_engagement', dry_run=True, stdout=out)
+
+        self.assertEqual(RateArticle.objects.filter(article=article).count(), 2)
+        self.assertIn("Duplicates of 1 articles found", out.getvalue())
+
+    def test_duplicates_are_deleted_before_the_counters_exist(self):
+        self.drop_unique_constraint(RateArticle)
+        article = self.stored_articles[10]
+
+        for rate in (1, 2):
+            RateArticle.objects.create(article=article, user=self.stored_users[1], user_rating=rate)
+
+        out = io.StringIO()
+        tables = [
+            table for table in connection.introspection.table_names()
+            if table != ArticleStats._meta.db_table
+        ]
+
+        with mock.patch.object(connection.introspection, 'table_names', return_value=tables), \
+                mock.patch('authors.apps.core.management.commands.dedupe_engagement.rebuild_stats') as rebuild:
+            call_command('dedupe_engagement', stdout=out)
+
+        rebuild.assert_not_called()
+        self.assertEqual(RateArticle.objects.filter(article=article).count(), 1)
+        self.assertIn("run rebuild_article_stats after migrating", out.getvalue())
@@ -4,7 +4,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.contenttypes.models import ContentType
-from authors.apps.articles.models import Article
+from django.db import transaction
+from authors.apps.articles.cache import invalidate_article
+from authors.apps.articles.models import Article, ArticleStats
+from authors.apps.articles.stats import bump_stats
+from authors.apps.changefeed.models import ChangeLogEntry, record_change
 
 from .serializers import ArticleLikeDislikeSerializer
 from .models import ArticleLikeDislike
@@ -32,42 +36,67 @@ class ArticleLikeDislikeView(CreateAPIView):
         """
         # Search for article using its slug
         # Return a 404 if it does not exist
-        obj = get_object_or_404(Article, slug=slug)
+        obj = get_object_or_404(Article.objects.only('id'), slug=slug)
 
-        try:
-            # Check if the article has already been liked/disliked by user.
-            # Filter by ContentType instance representing our Article model,
-            # the id of our article object,
-            # and the current user
-            like_dislike = ArticleLikeDislike.objects.get(
-                content_type=ContentType.objects.get_for_model(obj),
-                object_id=obj.id,
-                user=request.user
+        with transaction.atomic():
+            # Cast, flip or remove the vote in a single statement, which is
+            # safe against the same user voting twice at the same time.
+            (previous_vote, vote_id) = ArticleLikeDislike.objects.toggle(
+                ContentType.objects.get_for_model(Article),
+                obj.id,
+                request.user.id,
+                self.vote_type
             )
 
-            # Flip the votes if the incoming vote is a different one
-            # update_fieids allows us to change just the votes field
-            if like_dislike.vote is not self.vote_type:
-                like_dislike.vote = self.vote_type
-                like_dislike.save(update_fields=['vote'])
+            if previous_vote is None:
+                # If the article has never received a vote from the user
+                deltas = {self.counter(self.vote_type): 1}
+                action = ChangeLogEntry.CREATED
+            elif previous_vote != self.vote_type:
+                # The vote was flipped
+                deltas = {
+                    self.counter(self.vote_type): 1,
+                    self.counter(-self.vote_type): -1
+                }
+                action = ChangeLogEntry.UPDATED
             else:
-                # The existing vote record is deleted if the user is submitting a vote twice,
-                # a user can hit like/dislike twice to remove their opinion
-                like_dislike.delete()
+                # The vote was removed, a user can hit like/dislike twice to
+                # remove their opinion
+                deltas = {self.counter(self.vote_type): -1}
+                action = ChangeLogEntry.DELETED
 
-        except ArticleLikeDislike.DoesNotExist:
-            # If the article has never received a vote
-            # create a new vote
-            obj.votes.create(user=request.user, vote=self.vote_type)
+            # Logged before the counters are bumped, as the receivers of the
+            # other logged models do.
+            record_change(
+                ChangeLogEntry.VOTE, action, vote_id,
+                article_id=obj.id, user_id=request.user.id
+            )
+            bump_stats(obj.id, **deltas)
+            invalidate_article(obj.id)
+
+            # The counters were just updated in this transaction, so they
+            # account for this vote and for those committed before it.
+            (likes, dislikes) = ArticleStats.objects.filter(
+                article_id=obj.id
+            ).values_list('like_count', 'dislike_count').get()
 
         # Let's return some confirmation data
         # along with a response status
         return Response({
             "article_slug": slug,
             "article_id": obj.id,
-            "total_likes": obj.votes.likes().count(),
-            "total_dislikes": obj.votes.dislikes().count(),
-            "total_votes": obj.votes.sum_rating(),
+            "total_likes": likes,
+            "total_dislikes": dislikes,
+            "total_votes": likes - dislikes,
         },
             status=status.HTTP_201_CREATED
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def counter(vote_type):
+        """
+        Name of the article stats counter that tracks the given vote type
+        """
+        if vote_type == ArticleLikeDislike.LIKE:
+            return 'like_count'
+        return 'dislike_count'
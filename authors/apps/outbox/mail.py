@@ -0,0 +1,106 @@
+"""
+The outbox that emails are sent through.
+
+Views only store the emails they want to send with `queue_mail`, which
+costs an insert instead of an SMTP conversation. The `send_queued_mail`
+worker then delivers them in batches over a single connection, retrying
+the failed ones with an exponential backoff.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+
+def queue_mail(subject, message, from_email, recipient_list):
+    """
+    Queue an email for delivery, taking the arguments of `send_mail`.
+    """
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email,
+        to=list(recipient_list)
+    )
+
+
+def retry_delay(attempts):
+    """
+    How long to wait before attempting a delivery again after the given
+    number of failed attempts.
+    """
+    return timedelta(seconds=settings.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def deliver_pending(batch_size=50):
+    """
+    Deliver a batch of the queued emails that are due, returning how many
+    were sent and how many failed.
+
+    The batch is locked with SKIP LOCKED, so that several workers can run
+    side by side without sending an email twice.
+    """
+    sent = failed = 0
+
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                status=OutboundEmail.PENDING,
+                next_attempt_at__lte=timezone.now()
+            ).order_by('next_attempt_at', 'id')[:batch_size]
+        )
+
+        if not emails:
+            return sent, failed
+
+        connection = get_connection()
+
+        try:
+            for email in emails:
+                message = EmailMessage(
+                    email.subject,
+                    email.body,
+                    email.from_email,
+                    email.to,
+                    connection=connection
+                )
+
+                try:
+                    # Opening an open connection does nothing, so all the
+                    # messages of the batch share the first one.
+                    connection.open()
+                    message.send()
+                except Exception as error:
+                    _failed(email, error)
+                    failed += 1
+
+                    # The connection may be what failed, the next message
+                    # opens a new one.
+                    connection.close()
+                else:
+                    email.status = OutboundEmail.SENT
+                    email.sent_at = timezone.now()
+                    email.attempts += 1
+                    email.save(update_fields=['status', 'sent_at', 'attempts'])
+                    sent += 1
+        finally:
+            connection.close()
+
+    return sent, failed
+
+
+def _failed(email, error):
+    email.attempts += 1
+    email.last_error = repr(error)
+
+    if email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboundEmail.FAILED
+    else:
+        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
@@ -0,0 +1,101 @@
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from authors.apps.outbox.mail import deliver_pending, queue_mail
+from authors.apps.outbox.models import OutboundEmail
+from authors.base_test_config import TestConfiguration
+
+
+class TestOutbox(TestConfiguration):
+    """
+    test suite for queueing emails in the outbox and delivering them
+    """
+
+    def queue(self, count=1):
+        return [
+            queue_mail("Subject {}".format(i), "Body", "from@email.com", ["to@email.com"])
+            for i in range(count)
+        ]
+
+    def test_registration_queues_the_verification_email(self):
+        self.register(self.reg_user)
+
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.to, [self.reg_user['user']['email']])
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+
+        call_command('send_queued_mail', once=True, stdout=mock.Mock())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "VERIFY YOUR ACCOUNT")
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.SENT)
+
+    def test_reset_request_queues_the_reset_email(self):
+        self.client.post(
+            reverse("reset_request"),
+            self.registered_user_email,
+            content_type='application/json'
+        )
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.get().subject, "Password Reset Request")
+
+    def test_batches_share_a_connection(self):
+        self.queue(3)
+
+        with mock.patch(
+            'authors.apps.outbox.mail.get_connection',
+            wraps=mail.get_connection
+        ) as get_connection:
+            self.assertEqual(deliver_pending(batch_size=2), (2, 0))
+            self.assertEqual(deliver_pending(batch_size=2), (1, 0))
+
+        self.assertEqual(get_connection.call_count, 2)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_failed_deliveries_are_retried_later(self):
+        email, = self.queue()
+
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=SMTPException("Connection refused")
+        ):
+            self.assertEqual(deliver_pending(), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("Connection refused", email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+        # It is not due yet
+        self.assertEqual(deliver_pending(), (0, 0))
+
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+
+        self.assertEqual(deliver_pending(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=2)
+    def test_deliveries_are_given_up_on(self):
+        email, = self.queue()
+
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=SMTPException
+        ):
+            for _ in range(2):
+                OutboundEmail.objects.update(next_attempt_at=timezone.now())
+                deliver_pending()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.FAILED)
+        self.assertEqual(email.attempts, 2)
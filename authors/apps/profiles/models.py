@@ -3,9 +3,12 @@ from django.db import models
 from ..authentication.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
+from authors.apps.core.mixins import TrackedFieldsMixin
 
-class Profile(models.Model):
+
+class Profile(TrackedFieldsMixin, models.Model):
     """
     create a user profile model
     """
@@ -37,8 +40,23 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+def save_user_profile(sender, instance, created, **kwargs):
     """
-    Save created user profile.
+    Save the changes made to the profile of a user through the user. Most
+    saves of a user, such as logins and activations, do not touch a profile
+    that was not even loaded, so these are left alone.
+
+    The username is shown along with the profile, so renaming a user marks
+    its profile as updated too.
     """
-    instance.profile.save()
+    if created:
+        return
+
+    changed = set()
+    if User.profile.related.is_cached(instance):
+        changed = instance.profile.changed_fields()
+
+    if changed:
+        instance.profile.save(update_fields=changed | {'updated_at'})
+    elif 'username' in instance.changed_fields():
+        Profile.objects.filter(user_id=instance.id).update(updated_at=timezone.now())
@@ -1,14 +1,8 @@
-import json
+from authors.apps.core.renderers import FastJSONRenderer
 
-from ..authentication.renderers import UserJSONRenderer
 
-
-class ProfileJSONRenderer(UserJSONRenderer):
-
-    def render(self, data, media_type=None, renderer_context=None):
-        """
-        overide UserJSONRenderer to render our data under the "profile" namespace.
-        """
-        return json.dumps({
-            'profile': data
-        })
+class ProfileJSONRenderer(FastJSONRenderer):
+    """
+    render our data under the "profile" namespace.
+    """
+    namespace = 'profile'
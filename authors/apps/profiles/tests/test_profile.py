@@ -141,3 +141,24 @@ class TestProfile(TestConfiguration):
             reverse('authors_profile'),
             content_type='application/json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unchanged_profile_is_not_resent(self):
+        """
+        Test a client that has the current profile gets a 304
+        """
+        self.email_verification(self.reg_user)
+        res = self.login(self.log_user)
+        url = '/api/profiles/' + res.data['username']
+        token = 'Token ' + res.data['token']
+
+        etag = self.client.get(url, HTTP_AUTHORIZATION=token)['ETag']
+        response = self.client.get(url, HTTP_AUTHORIZATION=token, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        profile = Profile.objects.get(user__username=res.data['username'])
+        profile.bio = "A new bio"
+        profile.save()
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=token, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['bio'], "A new bio")
@@ -0,0 +1,101 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from authors.apps.authentication.models import User
+from authors.apps.authentication.token import account_activation_token
+from authors.apps.profiles.models import Profile
+from authors.base_test_config import TestConfiguration
+
+
+class TestProfileSaves(TestConfiguration):
+    """
+    Test saving a user only saves its profile when the profile changed
+    """
+
+    def profile_queries(self, queries):
+        return [
+            query['sql'] for query in queries
+            if 'profiles_profile' in query['sql']
+        ]
+
+    def test_login_does_not_touch_the_profile(self):
+        self.email_verification(self.reg_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.login(self.log_user)
+
+        self.assertIn('token', response.data)
+        self.assertEqual(len(queries), 1)
+
+    def test_activation_does_not_save_the_profile(self):
+        self.register(self.reg_user)
+        user = User.objects.get(username=self.reg_user['user']['username'])
+
+        url = '/api/activate/account/{pk}/{token}'.format(
+            pk=urlsafe_base64_encode(force_bytes(user.id)).decode(),
+            token=account_activation_token.make_token(self.reg_user)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+
+        user.refresh_from_db()
+        self.assertTrue(user.is_active)
+        self.assertEqual(self.profile_queries(queries), [])
+        self.assertEqual(len(queries), 2)
+
+    def test_password_reset_does_not_save_the_profile(self):
+        response = self.client.post(
+            reverse("reset_request"),
+            self.registered_user_email,
+            content_type='application/json'
+        )
+        link = response.json()['user']['linker']
+        link = link[:22] + 'api/' + link[22:]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                link,
+                {"user": {"password": "Masesey@2"}},
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.profile_queries(queries), [])
+
+    def test_profile_changes_are_saved_with_the_user(self):
+        user = self.stored_users[1]
+        user.profile.bio = "Changed through the user"
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+
+        self.assertEqual(len(self.profile_queries(queries)), 1)
+        self.assertIn('"bio"', self.profile_queries(queries)[0])
+        self.assertNotIn('"company"', self.profile_queries(queries)[0])
+
+        user.profile.refresh_from_db()
+        self.assertEqual(user.profile.bio, "Changed through the user")
+
+    def test_loaded_but_unchanged_profiles_are_not_saved(self):
+        user = User.objects.select_related('profile').get(id=self.stored_users[1].id)
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+
+        self.assertEqual(self.profile_queries(queries), [])
+
+    def test_renaming_marks_the_profile_as_updated(self):
+        user = User.objects.get(id=self.stored_users[1].id)
+        updated_at = user.profile.updated_at
+        user = User.objects.get(id=user.id)
+        user.username = "renamed_user"
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+
+        self.assertEqual(len(self.profile_queries(queries)), 1)
+        self.assertGreater(Profile.objects.get(user=user).updated_at, updated_at)
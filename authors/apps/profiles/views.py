@@ -4,6 +4,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 # local imports
+from authors.apps.core.conditional import Validators
+from ..followers.models import Follower
 from .models import Profile
 from .serializers import GetProfileSerializer, UpdateProfileSerializer
 from .renderers import ProfileJSONRenderer
@@ -28,10 +30,29 @@ class GetUserProfileView(RetrieveAPIView):
             raise NotFound('User profile not found')
 
     def retrieve(self, request, **kwargs):
+        # Clients that already have the profile get a 304 as long as neither
+        # the profile nor whether they follow its owner changed, which only
+        # takes two small queries.
+        profile = Profile.objects.filter(
+            user__username=self.kwargs.get('username')
+        ).values('id', 'updated_at').first()
+
+        if profile is None:
+            raise NotFound('User profile not found')
+
+        following = Follower.objects.filter(
+            user=request.user.id, followed=profile['id']
+        ).exists()
+        validators = Validators(profile['id'], profile['updated_at'], request.user.id, following)
+        not_modified = validators.not_modified(request)
+
+        if not_modified is not None:
+            return not_modified
+
         data = self.get_queryset()
         serializer = self.serializer_class(data, context={'request': request})
 
-        return Response(serializer.data)
+        return validators.apply(Response(serializer.data))
 
 
 class AuthorsProfileListAPIView(ListAPIView):
@@ -42,7 +63,7 @@ class AuthorsProfileListAPIView(ListAPIView):
     permission_classes = (IsAuthenticated,)
     renderer_classes = (ProfileJSONRenderer,)
     serializer_class = GetProfileSerializer
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related('user').order_by('id')
 
 
 class UpdateUserProfileView(UpdateAPIView):
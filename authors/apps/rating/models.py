@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from ..authentication.models import User
+from ..articles.cache import invalidate_article
 from ..articles.models import Article
 
 # Create your models here.
@@ -15,3 +18,15 @@ class RateArticle(models.Model):
 
     # This is to hold the user rating on the specific article
     user_rating = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (('article', 'user'),)
+
+
+@receiver(post_save, sender=RateArticle)
+@receiver(post_delete, sender=RateArticle)
+def invalidate_rated_article(sender, instance, **kwargs):
+    """
+    drop the cached payload of an article when its ratings change.
+    """
+    invalidate_article(instance.article_id)
@@ -1,13 +1,34 @@
-import numpy
-
-from django.db.models import Sum, Q
+from django.db import connection, transaction
 
 from rest_framework import serializers
 from rest_framework import exceptions
 
 # local imports
 from .models import RateArticle
+from ..articles.cache import invalidate_article
 from ..articles.models import Article
+from ..articles.stats import bump_stats, compute_stats
+from ..changefeed.models import ChangeLogEntry, record_change
+
+# Rate an article in one statement. `previous` locks and reads the rating
+# the user gave before, if any. When the user's rating was inserted by a
+# concurrent request after this statement started, it is not visible to
+# `previous` and the update is skipped, for the caller to try again.
+UPSERT_RATING = """
+    WITH previous AS (
+        SELECT user_rating FROM {ratings}
+        WHERE article_id = %(article_id)s AND user_id = %(user_id)s
+        FOR UPDATE
+    ), rated AS (
+        INSERT INTO {ratings} AS rating (article_id, user_id, user_rating)
+        VALUES (%(article_id)s, %(user_id)s, %(rate)s)
+        ON CONFLICT (article_id, user_id) DO UPDATE
+            SET user_rating = EXCLUDED.user_rating
+            WHERE EXISTS (SELECT 1 FROM previous)
+        RETURNING rating.id
+    )
+    SELECT rated.id, (SELECT user_rating FROM previous) FROM rated
+""".format(ratings=RateArticle._meta.db_table)
 
 
 class RateArticleSerializer(serializers.Serializer):
@@ -20,43 +41,50 @@ class RateArticleSerializer(serializers.Serializer):
         """
         Method to check if the article to be rated exists
         """
-        to_rate = Article.objects.filter(slug=slug)
-        # import pdb; pdb.set_trace()
+        to_rate = Article.objects.filter(slug=slug).only('id', 'author_id').first()
+
         # find the article the user wants to rate. If not found return 404
-        if not to_rate:
+        if to_rate is None:
             raise exceptions.NotFound({
                 "message": "Article was not found"
             })
-        return Article.objects.get(slug=slug)
+        return to_rate
 
     @staticmethod
     def get_rating_per_article(slug):
         """
-        Method to get user rating as per the article
+        Method to get the number of ratings of an article, their sum and
+        their average, which is 0 when the article was not rated yet.
+
+        These come from the counters of the article, which are looked up
+        along with the article itself.
         """
-        # Check if article exists
-        rated = RateArticleSerializer().get_article_to_rate(slug=slug)
-
-        # Second perform a check if there is an article that has the article id
-        # in the rating table. Proceed to find the number of users who have rated the article
-        # find the sum of those ratings
-        # return back the average to the user.
-        # If no rating matching the article id exists return 0 to user
-        # import pdb; pdb.set_trace()
-        if RateArticle.objects.filter(article_id=rated.id).exists():
-            # find the total number of users
-            number_of_users = RateArticle.objects.filter(article_id=rated.id).values('user_id').count()
-
-            # get all ratings of this article
-            article_rates = RateArticle.objects.filter(article_id=rated.id).values('user_rating').aggregate(Sum('user_rating')).get('user_rating__sum')
-            # import pdb; pdb.set_trace()
-            return (numpy.rint(article_rates / number_of_users))
-        return 0
+        rated = Article.objects.filter(slug=slug).values_list(
+            'id', 'stats__rating_sum', 'stats__rating_count'
+        ).first()
+
+        if rated is None:
+            raise exceptions.NotFound({
+                "message": "Article was not found"
+            })
+
+        (article_id, total, count) = rated
+
+        if count is None:
+            # The article has no counters row yet.
+            counters = compute_stats([article_id])[article_id]
+            (total, count) = (counters['rating_sum'], counters['rating_count'])
+
+        return {
+            "count": count,
+            "sum": total,
+            "average": total / count if count else 0
+        }
 
     @staticmethod
-    def rate_article(data, user_id, article_id):
+    def rate_article(data, user_id, article):
         """
-        Method to rate an article
+        Method to rate an article, or to change the rating the user gave it
         """
 
         my_rate = data.get('rate', None)
@@ -72,32 +100,39 @@ class RateArticleSerializer(serializers.Serializer):
                 'Please rate the article with a number between 1 to 5'
             )
         # Restrict article owner from rating themselves
-        elif Article.objects.filter(author_id=user_id, id=article_id).exists():
+        elif article.author_id == user_id:
             raise exceptions.PermissionDenied(
                 "You cannot rate your own article")
 
-        # Check if the user has already rated the article. If so find the instance that matches
-        # the user id and article id. To the value that exists as user rating pass in the new rating.
-        # update the column in the database. If user has never rated the article before. Create the
-        # new rating as per the user
-        if RateArticle.objects.filter(user_id=user_id, article_id=article_id).exists():
-            to_rate = RateArticle.objects.get(
-                Q(user_id=user_id),
-                Q(article_id=article_id)
+        params = {"article_id": article.id, "user_id": user_id, "rate": my_rate}
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                row = None
+
+                while row is None:
+                    cursor.execute(UPSERT_RATING, params)
+                    row = cursor.fetchone()
+
+            (rating_id, previous_rate) = row
+
+            # The statement bypasses the signals of the model, so we do what
+            # their receivers would, logging the change before bumping the
+            # counters as the other logged models do.
+            if previous_rate is None:
+                action = ChangeLogEntry.CREATED
+                deltas = {"rating_sum": my_rate, "rating_count": 1}
+            else:
+                action = ChangeLogEntry.UPDATED
+                deltas = {"rating_sum": my_rate - previous_rate}
+
+            record_change(
+                ChangeLogEntry.RATING, action, rating_id,
+                article_id=article.id, user_id=user_id
             )
-            # pass in the new rating
-            to_rate.user_rating = my_rate
-
-            to_rate.save(update_fields=['user_rating'])
-            return {
-                "rating": my_rate
-            }
-
-        # create the rating
-        rate = RateArticle.objects.create(
-            user_rating=my_rate,
-            article_id=article_id,
-            user_id=user_id)
-        rate.save()
-
-        return rate
+            bump_stats(article.id, **deltas)
+            invalidate_article(article.id)
+
+        return {
+            "rating": my_rate
+        }
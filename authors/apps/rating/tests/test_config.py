@@ -1,4 +1,5 @@
 from rest_framework.test import APIClient
+from django.core.cache import cache
 from django.test import TestCase
 
 
@@ -13,6 +14,8 @@ class TestConfiguration(TestCase):
 
     def setUp(self):
         """ Configurations for test cases """
+        cache.clear()
+
         self.user = {
             "user": {
                 "email": "johndoe@email.com",
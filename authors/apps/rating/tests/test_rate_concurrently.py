@@ -0,0 +1,70 @@
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+
+from authors.apps.articles.models import ArticleStats
+from authors.apps.articles.stats import compute_stats
+from authors.factory import ArticleFactory, UserFactory
+
+from ..models import RateArticle
+from ..serializers import RateArticleSerializer
+
+
+class TestRateConcurrently(TransactionTestCase):
+    """
+    Test parallel raters of an article, which each need their own
+    connection and so committed data to work with.
+    """
+
+    def rate_in_parallel(self, ratings):
+        barrier = threading.Barrier(len(ratings))
+        errors = []
+
+        def rate(user, rate):
+            try:
+                barrier.wait()
+                RateArticleSerializer.rate_article({"rate": rate}, user.id, self.article)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=rate, args=rating) for rating in ratings]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def setUp(self):
+        self.article = ArticleFactory()
+        self.raters = UserFactory.create_batch(8)
+
+    def test_parallel_raters(self):
+        self.rate_in_parallel([
+            (rater, index % 5 + 1) for (index, rater) in enumerate(self.raters)
+        ])
+
+        stats = ArticleStats.objects.get(article=self.article)
+
+        self.assertEqual(RateArticle.objects.filter(article=self.article).count(), 8)
+        self.assertEqual(stats.rating_count, 8)
+        self.assertEqual(stats.rating_sum, 1 + 2 + 3 + 4 + 5 + 1 + 2 + 3)
+
+    def test_parallel_ratings_by_the_same_user(self):
+        rater = self.raters[0]
+        RateArticleSerializer.rate_article({"rate": 1}, self.raters[1].id, self.article)
+
+        self.rate_in_parallel([(rater, 2), (rater, 5), (rater, 3), (self.raters[2], 4)])
+
+        ratings = RateArticle.objects.filter(article=self.article)
+        stats = ArticleStats.objects.get(article=self.article)
+        expected = compute_stats([self.article.id])[self.article.id]
+
+        self.assertEqual(ratings.filter(user=rater).count(), 1)
+        self.assertEqual(stats.rating_count, 3)
+        self.assertEqual(stats.rating_sum, expected['rating_sum'])
@@ -57,6 +57,8 @@ class TestGetArticleRating(TestRateArticle):
             response.json().get('Rated at'),
             5
         )
+        self.assertEqual(response.json().get('count'), 1)
+        self.assertEqual(response.json().get('average'), 5)
 
     def test_none_existing_article(self):
         """
@@ -29,7 +29,7 @@ class RateArticleView(CreateAPIView):
         self.serializer_class.rate_article(
             data=user_data,
             user_id=request.user.id,
-            article_id=to_rate.id)
+            article=to_rate)
 
         # Return response to user
         return Response(
@@ -46,10 +46,13 @@ class GetArticleRatingsView(RetrieveAPIView):
     """
     def get(self, request, slug):
 
-        # Retrieve the current rate
-        current_rate = self.serializer_class.get_rating_per_article(
+        # Retrieve the current ratings
+        ratings = self.serializer_class.get_rating_per_article(
             slug=slug
         )
 
-        # Return response to user
-        return Response({"Rated at": current_rate}, status=status.HTTP_200_OK)
+        # Return response to user, with the average rounded like it always
+        # was under "Rated at"
+        return Response(
+            dict(ratings, **{"Rated at": round(ratings['average'])}),
+            status=status.HTTP_200_OK)
@@ -0,0 +1,245 @@
+"""
+The write path of the read stats.
+
+Viewing an article only records the read, and when it happened, in memory
+with `record_read`. A background thread flushes the buffered reads every few seconds, or as soon
+as a batch is ready, with one `INSERT ... ON CONFLICT DO NOTHING` per batch,
+so reading an article never waits on the read stats table. The reads still
+buffered are flushed when the process exits.
+
+The buffer is bounded: once it holds `READ_EVENTS_BUFFER_SIZE` reads, new
+ones are dropped until the next flush rather than slowing the readers down.
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.stats import bump_stats
+from authors.apps.authentication.models import User
+
+from .models import UserReadStat
+
+logger = logging.getLogger(__name__)
+
+# The number of reads written by a single statement.
+FLUSH_BATCH_SIZE = 500
+
+
+def save_reads(reads):
+    """
+    Store the given `(user_id, article_id, viewed_at)` reads, skipping the
+    ones already stored and those of users or articles deleted since, and
+    count the new ones in the stats of their articles. Returns the number of
+    new reads.
+    """
+    reads = list(reads)
+    created = 0
+
+    for start in range(0, len(reads), FLUSH_BATCH_SIZE):
+        (user_ids, article_ids, viewed_at) = zip(*reads[start:start + FLUSH_BATCH_SIZE])
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO {read_stats} (user_id, article_id, read, "createdAt", "updatedAt")
+                    SELECT reads.user_id, reads.article_id, false, reads.viewed_at, now()
+                    FROM unnest(%s::integer[], %s::integer[], %s::timestamptz[])
+                        AS reads (user_id, article_id, viewed_at)
+                    JOIN {users} ON {users}.id = reads.user_id
+                    JOIN {articles} ON {articles}.id = reads.article_id
+                    ON CONFLICT (user_id, article_id) DO NOTHING
+                    RETURNING article_id
+                    """.format(
+                        read_stats=UserReadStat._meta.db_table,
+                        users=User._meta.db_table,
+                        articles=Article._meta.db_table
+                    ),
+                    [list(user_ids), list(article_ids), list(viewed_at)]
+                )
+                new_reads = Counter(article_id for (article_id,) in cursor.fetchall())
+
+            # The counters are locked in the order of their articles, so
+            # that concurrent flushes cannot deadlock.
+            for (article_id, count) in sorted(new_reads.items()):
+                bump_stats(article_id, read_count=count)
+
+        created += sum(new_reads.values())
+
+    return created
+
+
+def complete_read(user_id, article_id):
+    """
+    Mark an article as read by a user. Returns how long the user took to
+    read it, from the first time they viewed it, or None when they had
+    already read it.
+
+    This is a single statement on the `(user, article)` unique index. The
+    view of the article may not be saved yet, in which case it is saved
+    along, with the time it was viewed at if it is buffered here.
+    """
+    viewed_at = read_events.viewed_at(user_id, article_id) or timezone.now()
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO {read_stats} AS stat (user_id, article_id, read, "createdAt", "updatedAt")
+                VALUES (%s, %s, true, LEAST(%s, statement_timestamp()), statement_timestamp())
+                ON CONFLICT (user_id, article_id) DO UPDATE
+                    SET read = true, "updatedAt" = EXCLUDED."updatedAt"
+                    WHERE stat.read = false
+                RETURNING stat."updatedAt" - stat."createdAt", stat.xmax = 0
+                """.format(read_stats=UserReadStat._meta.db_table),
+                [user_id, article_id, viewed_at]
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        (duration, inserted) = row
+
+        if inserted:
+            bump_stats(article_id, read_count=1)
+
+    return duration
+
+
+class ReadBuffer:
+    """
+    Reads waiting to be saved, deduplicated, and the thread that saves them.
+
+    The thread is started with the first read, and wakes up every
+    `interval` seconds or as soon as `FLUSH_BATCH_SIZE` reads are waiting.
+    """
+
+    def __init__(self, max_size=10000, interval=2):
+        self.max_size = max_size
+        self.interval = interval
+        self.dropped = 0
+        self._reads = {}
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def __len__(self):
+        return len(self._reads)
+
+    def add(self, user_id, article_id, viewed_at):
+        """
+        Buffer a read. Returns False when it was dropped because the buffer
+        is full.
+        """
+        with self._lock:
+            if (user_id, article_id) in self._reads:
+                return True
+
+            if len(self._reads) >= self.max_size:
+                self.dropped += 1
+                return False
+
+            self._reads[(user_id, article_id)] = viewed_at
+            batch_ready = len(self._reads) >= FLUSH_BATCH_SIZE
+
+            if self._thread is None:
+                self._start()
+
+        if batch_ready:
+            self._wake_up.set()
+
+        return True
+
+    def viewed_at(self, user_id, article_id):
+        """
+        When the user viewed the article, if the read is still buffered.
+        """
+        return self._reads.get((user_id, article_id))
+
+    def flush(self):
+        """
+        Save the buffered reads. Those that could not be saved are buffered
+        again, as far as there is room, for the next flush to retry.
+        """
+        with self._lock:
+            (reads, self._reads) = (self._reads, {})
+
+        if not reads:
+            return 0
+
+        try:
+            return save_reads(
+                (user_id, article_id, viewed_at)
+                for ((user_id, article_id), viewed_at) in reads.items()
+            )
+        except Exception:
+            with self._lock:
+                room = max(self.max_size - len(self._reads), 0)
+                retried = list(reads.items())[:room]
+                self._reads.update(retried)
+                self.dropped += len(reads) - len(retried)
+            raise
+
+    def stop(self, timeout=10):
+        """
+        Stop the thread and flush what is left in the buffer.
+        """
+        self._stopping = True
+        self._wake_up.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        self.flush()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name='read-stats-flusher', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self):
+        while True:
+            self._wake_up.wait(self.interval)
+            self._wake_up.clear()
+
+            # What is left is flushed by `stop` itself.
+            if self._stopping:
+                return
+
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Could not save the buffered article reads")
+            finally:
+                # The thread sleeps most of the time, so it does not hold on
+                # to a connection in between.
+                connection.close()
+
+
+read_events = ReadBuffer(
+    max_size=settings.READ_EVENTS_BUFFER_SIZE,
+    interval=settings.READ_EVENTS_FLUSH_INTERVAL
+)
+
+
+def record_read(user_id, article_id):
+    """
+    Record that a user viewed an article. Unless buffering is turned off by
+    setting `READ_EVENTS_FLUSH_INTERVAL` to 0, the read is only buffered.
+    """
+    viewed_at = timezone.now()
+
+    if not settings.READ_EVENTS_FLUSH_INTERVAL:
+        save_reads([(user_id, article_id, viewed_at)])
+        return
+
+    read_events.add(user_id, article_id, viewed_at)
@@ -16,6 +16,9 @@ class UserReadStat(models.Model):
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        unique_together = (('user', 'article'),)
+
     def __str__(self):
         """Print out as title."""
         return self.article.title
@@ -11,8 +11,12 @@ class UserReadStatSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
     def get_duration(self, stat):
-        duration = stat.updatedAt - stat.createdAt
-        return duration
+        # How long the article took to read, from when it was first viewed
+        # until it was marked as read.
+        if not stat.read:
+            return None
+
+        return stat.updatedAt - stat.createdAt
 
     def get_article(self, stat):
         return {
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from authors.apps.articles.models import ArticleStats
+from authors.apps.read_stats.buffer import ReadBuffer
+from authors.apps.read_stats.models import UserReadStat
+from authors.base_test_config import TestUsingLoggedInUser
+
+
+class TestReadBuffer(TestUsingLoggedInUser):
+    """
+    test suite for buffering the reads of articles
+    """
+
+    def setUp(self):
+        super().setUp()
+        # A long interval keeps the flusher thread from writing outside of
+        # the test transaction, the tests flush themselves.
+        self.buffer = ReadBuffer(max_size=3, interval=3600)
+        self.addCleanup(self.buffer.stop)
+        self.now = timezone.now()
+
+    def read_count(self, article):
+        return ArticleStats.objects.get(article=article).read_count
+
+    def test_reads_are_deduplicated_and_bounded(self):
+        user = self.stored_users[1]
+        articles = self.stored_articles
+
+        self.assertTrue(self.buffer.add(user.id, articles[0].id, self.now))
+        self.assertTrue(self.buffer.add(user.id, articles[0].id, self.now))
+        self.assertTrue(self.buffer.add(user.id, articles[1].id, self.now))
+        self.assertTrue(self.buffer.add(user.id, articles[2].id, self.now))
+        self.assertFalse(self.buffer.add(user.id, articles[3].id, self.now))
+
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(self.buffer.dropped, 1)
+
+    def test_flush_saves_new_reads_only(self):
+        user = self.stored_users[1]
+        (read, unread, deleted) = self.stored_articles[3:6]
+        UserReadStat.objects.create(user=user, article=read)
+        reads_before = self.read_count(unread)
+
+        self.buffer.add(user.id, read.id, self.now)
+        self.buffer.add(user.id, unread.id, self.now)
+        self.buffer.add(user.id, deleted.id, self.now)
+        deleted.delete()
+
+        # The insert and the update of the counters of the one new read,
+        # each in a savepoint.
+        with self.assertNumQueries(6):
+            self.assertEqual(self.buffer.flush(), 1)
+
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(UserReadStat.objects.filter(user=user).count(), 2)
+        self.assertEqual(self.read_count(unread), reads_before + 1)
+        self.assertEqual(UserReadStat.objects.get(user=user, article=unread).createdAt, self.now)
+
+    @override_settings(READ_EVENTS_FLUSH_INTERVAL=3600)
+    def test_viewing_an_article_does_not_write(self):
+        article = self.stored_articles[6]
+
+        with mock.patch('authors.apps.read_stats.buffer.read_events', self.buffer):
+            response = self.client.get(
+                reverse("article", kwargs={"slug": article.slug}),
+                HTTP_AUTHORIZATION="Token {}".format(self.access_token)
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(UserReadStat.objects.filter(article=article).exists())
+
+        self.buffer.flush()
+
+        self.assertTrue(
+            UserReadStat.objects.filter(user=self.stored_users[0], article=article).exists()
+        )
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from authors.apps.articles.models import ArticleStats
+from authors.apps.read_stats.models import UserReadStat
+from authors.base_test_config import TestUsingLoggedInUser
+from authors.factory import UserFactory
+
+
+class TestReadComplete(TestUsingLoggedInUser):
+    """
+    test suite for marking an article as read when it has many readers
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.article = self.stored_articles[4]
+        self.readers = UserFactory.create_batch(20)
+        self.viewed_at = timezone.now() - timedelta(minutes=5)
+
+        UserReadStat.objects.bulk_create(
+            UserReadStat(user=reader, article=self.article)
+            for reader in self.readers + [self.stored_users[0]]
+        )
+        UserReadStat.objects.filter(article=self.article).update(createdAt=self.viewed_at)
+
+    def complete(self, slug=None):
+        return self.client.get(
+            reverse("article_read", kwargs={"slug": slug or self.article.slug}),
+            HTTP_AUTHORIZATION="Token {}".format(self.access_token)
+        )
+
+    def test_only_the_readers_stat_is_updated(self):
+        response = self.complete()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(UserReadStat.objects.filter(article=self.article, read=True).values_list('user', flat=True)),
+            [self.stored_users[0].id]
+        )
+
+    def test_duration_is_measured_from_the_first_view(self):
+        response = self.complete()
+
+        duration = UserReadStat.objects.get(
+            user=self.stored_users[0], article=self.article
+        ).updatedAt - self.viewed_at
+
+        self.assertEqual(response.data['duration'], duration)
+        self.assertGreaterEqual(duration, timedelta(minutes=5))
+
+    def test_article_is_read_once(self):
+        self.complete()
+
+        response = self.complete()
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_completion_is_a_single_update(self):
+        # Only the reader's row is written, by one upsert. The other queries
+        # of the request, such as resyncing the revoked tokens, vary.
+        with CaptureQueriesContext(connection) as queries:
+            self.complete()
+
+        read_stat_queries = [
+            query['sql'] for query in queries
+            if UserReadStat._meta.db_table in query['sql']
+        ]
+
+        self.assertEqual(len(read_stat_queries), 1)
+
+    def test_read_not_saved_yet(self):
+        article = self.stored_articles[7]
+        reads_before = ArticleStats.objects.get(article=article).read_count
+
+        response = self.complete(article.slug)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ArticleStats.objects.get(article=article).read_count, reads_before + 1)
+        self.assertTrue(
+            UserReadStat.objects.get(user=self.stored_users[0], article=article).read
+        )
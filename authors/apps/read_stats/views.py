@@ -3,7 +3,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from .models import UserReadStat
+from authors.apps.articles.models import Article
 from authors.response import RESPONSE
+from .buffer import complete_read
 from .serializers import UserReadStatSerializer
 
 
@@ -14,7 +16,9 @@ class ReadStatsView(ListAPIView):
         """
         read all the articles read by a user
         """
-        return UserReadStat.objects.filter(user=self.request.user)
+        return UserReadStat.objects.filter(
+            user=self.request.user
+        ).select_related('article').order_by('-updatedAt', '-id')
 
 
 class ReadCompleteView(RetrieveAPIView):
@@ -24,18 +28,20 @@ class ReadCompleteView(RetrieveAPIView):
         """
         we are updating read status to true
         """
-        try:
-            user_read_stat = UserReadStat.objects.get(article__slug=slug)
-        except UserReadStat.DoesNotExist:
+        article_id = Article.objects.filter(slug=slug).values_list('id', flat=True).first()
+
+        if article_id is None:
             return Response(
                 {
                     "errors": {
-                        "article": RESPONSE['not_found'].format(data="User read stat")
+                        "article": RESPONSE['article_not_found'].format(data=slug)
                     }
                 }, status.HTTP_404_NOT_FOUND
             )
 
-        if user_read_stat.read:
+        duration = complete_read(request.user.id, article_id)
+
+        if duration is None:
             return Response({
                 "errors": {
                     "article": "Article has already been read!"
@@ -43,11 +49,9 @@ class ReadCompleteView(RetrieveAPIView):
             }, status.HTTP_403_FORBIDDEN
             )
 
-        user_read_stat.read = True
-        user_read_stat.save()
-
         return Response(
             {
-                "message": "Article Read!"
+                "message": "Article Read!",
+                "duration": duration
             }, status.HTTP_200_OK
         )
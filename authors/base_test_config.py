@@ -3,8 +3,9 @@ import json
 # local imports
 from authors.apps.authentication.models import User
 from authors.apps.authentication.token import account_activation_token
+from django.core.cache import cache
 from django.db import IntegrityError, transaction
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
@@ -18,6 +19,9 @@ from .factory import (ArticleFactory, CommentFactory, CommentHistoryFactory,
 faker = Faker()
 
 
+# Reads are saved as they happen: the thread that flushes the buffered ones
+# would not see the data of the test transactions.
+@override_settings(READ_EVENTS_FLUSH_INTERVAL=0)
 class TestConfiguration(TestCase):
     """ Configurations for all test suites"""
 
@@ -141,6 +145,10 @@ class TestConfiguration(TestCase):
     def setUp(self):
         """ Configurations for test cases """
 
+        # The database is rolled back after every test, so cached data
+        # would outlive what it was built from.
+        cache.clear()
+
         self.user = {
             "user": {
                 "email": "johndoe@email.com",
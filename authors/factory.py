@@ -39,7 +39,7 @@ class UserProfileFactory(factory.django.DjangoModelFactory):
 class ArticleFactory(factory.django.DjangoModelFactory):
 
     author = factory.SubFactory(UserFactory)
-    title = factory.Faker('sentence', nb_words=4)
+    title = factory.Faker('text', max_nb_chars=50)
     description = factory.Faker('paragraph', nb_sentences=3)
     body = factory.Faker('text', max_nb_chars=10000)
 
@@ -14,6 +14,7 @@ RESPONSE = {
     "not_found": "{data} not found! Please ensure you have provided the valid {data} id!",
     "forbidden": "You are not authorized to continue with this action!",
     "article_not_found": "Article {data} was not found",
+    "unavailable_field": "Searching by {} is not available at the moment!",
     "comment": {
         "replies": {
             "get_success": "You have successfully retrieved all the replies to the comment!"
@@ -21,6 +22,9 @@ RESPONSE = {
         "history": {
             "get_success": "You have successfully retrieved the edit history of the comment!"
         },
+        "tree": {
+            "get_success": "You have successfully retrieved the comment thread!"
+        },
         "get_success": "You have successfully retrieved all the comments!",
         "post_success": "You have successfully posted a new comment!",
         "update_success": "You have successfully updated the comment!",
@@ -51,6 +55,8 @@ RESPONSE = {
         "refresh": {
             "invalid": "You have not provided a valid refresh token!",
             "valid": "You have successfully refreshed the access token!"
-        }
+        },
+        "revoked": "Token has been revoked please request for another",
+        "logout": "You have successfully logged out!"
     }
 }
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'corsheaders',
     'django_extensions',
@@ -54,7 +55,9 @@ INSTALLED_APPS = [
     'authors.apps.rating',
     'authors.apps.favorite',
     'authors.apps.read_stats',
-    'authors.apps.bookmark'
+    'authors.apps.bookmark',
+    'authors.apps.outbox',
+    'authors.apps.changefeed'
 
 ]
 
@@ -219,6 +222,52 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10
 }
 
+# The cache backend can be swapped, for instance for a shared Redis cache, by
+# pointing CACHE_BACKEND to its dotted path and CACHE_LOCATION to the server.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Whether the cache is shared by every process serving the site. The article
+# and user caches are invalidated through it, so they are only used when it
+# is, and are otherwise turned off rather than served stale.
+SHARED_CACHE = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# How long, in seconds, the payload of an article is cached for.
+ARTICLE_CACHE_TIMEOUT = int(os.getenv('ARTICLE_CACHE_TIMEOUT', 300))
+
+# How many users each process keeps in memory to authenticate requests
+# without a query, and for how long, in seconds.
+USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', 1024))
+USER_CACHE_TIMEOUT = int(os.getenv('USER_CACHE_TIMEOUT', 300))
+
+# How many verified tokens each process remembers the claims of, and for
+# how long, in seconds.
+TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', 4096))
+TOKEN_CACHE_TIMEOUT = int(os.getenv('TOKEN_CACHE_TIMEOUT', 300))
+
+# How often, in seconds, each process reloads the revoked tokens. A token
+# revoked by another process is accepted for at most this long.
+REVOKED_TOKENS_SYNC_INTERVAL = int(os.getenv('REVOKED_TOKENS_SYNC_INTERVAL', 30))
+
+# The default similarity, from 0 to 1, an article title or author username
+# needs to have to the search text to be a fuzzy search match.
+TRIGRAM_SIMILARITY_THRESHOLD = float(os.getenv('TRIGRAM_SIMILARITY_THRESHOLD', 0.3))
+
+# Articles are ranked by the average of their ratings as if they had
+# RATING_PRIOR_WEIGHT more ratings of RATING_PRIOR_MEAN. The stored scores
+# are recomputed with the `rebuild_article_stats` command after changing
+# these.
+RATING_PRIOR_MEAN = float(os.getenv('RATING_PRIOR_MEAN', 3))
+RATING_PRIOR_WEIGHT = float(os.getenv('RATING_PRIOR_WEIGHT', 5))
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/1.9/howto/static-files/
 STATIC_ROOT = os.path.join(BASE_DIR, 'authors/staticfiles')
@@ -246,3 +295,20 @@ EMAIL_HOST = 'smtp.googlemail.com'
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+
+# Emails are queued in the outbox and delivered by the `send_queued_mail`
+# worker. A failed delivery is retried after OUTBOX_RETRY_DELAY seconds,
+# doubling the delay every time, up to OUTBOX_MAX_ATTEMPTS attempts.
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 5))
+OUTBOX_RETRY_DELAY = int(os.getenv('OUTBOX_RETRY_DELAY', 60))
+
+# Number of processes the `run_user_imports` worker hashes the passwords of
+# the users uploaded through the API with, one per CPU when it is not set.
+USER_IMPORT_WORKERS = int(os.getenv('USER_IMPORT_WORKERS', 0)) or None
+
+# Article reads are buffered in memory and saved every
+# READ_EVENTS_FLUSH_INTERVAL seconds by a background thread, or right away
+# when it is 0. Reads are dropped while READ_EVENTS_BUFFER_SIZE of them are
+# waiting.
+READ_EVENTS_BUFFER_SIZE = int(os.getenv('READ_EVENTS_BUFFER_SIZE', 10000))
+READ_EVENTS_FLUSH_INTERVAL = float(os.getenv('READ_EVENTS_FLUSH_INTERVAL', 2))
@@ -30,6 +30,7 @@ urlpatterns = [
     path('api/', include('authors.apps.articles.urls')),
     path('api/', include('authors.apps.likedislike.urls')),
     path('api/', include('authors.apps.read_stats.urls')),
+    path('api/', include('authors.apps.changefeed.urls')),
     path('oauth/', include('social_django.urls', namespace='social')),
     path('home', GeneralRoutes.home, name="home"),
     path('privacy', GeneralRoutes.privacy, name="privacy"),